@@ -1,36 +1,21 @@
 #!/usr/bin/env python3
-import os, json
+import os
 import pandas as pd
 
+from results_store import open_store
+
 RESULTS_ROOT = os.path.abspath("results")
 JSON_DIR     = os.path.join(RESULTS_ROOT, "json")
+STORE_PATH   = os.path.join(RESULTS_ROOT, "runs.sqlite")
 SUMMARY_CSV  = os.path.join(RESULTS_ROOT, "results_summary.csv")
 
-def load_rows(json_dir: str):
-    rows = []
-    if not os.path.isdir(json_dir):
-        return rows
-    for algo in os.listdir(json_dir):
-        ap = os.path.join(json_dir, algo)
-        if not os.path.isdir(ap): 
-            continue
-        for size in os.listdir(ap):
-            sp = os.path.join(ap, size)
-            if not os.path.isdir(sp):
-                continue
-            for fname in os.listdir(sp):
-                if not fname.endswith(".json"):
-                    continue
-                with open(os.path.join(sp, fname), "r", encoding="utf-8") as f:
-                    rows.append(json.load(f))
-    return rows
-
-def main():
-    rows = load_rows(JSON_DIR)
-    if not rows:
-        print("No se encontraron JSONs. ¿Ya corriste main_experiments.py?")
-        return
+def load_rows(store_path: str, json_dir: str):
+    if not os.path.isfile(store_path) and not os.path.isdir(json_dir):
+        return []
+    with open_store(store_path, json_dir) as store:
+        return store.rows()
 
+def summarize(rows) -> pd.DataFrame:
     df = pd.DataFrame(rows)
     # Tipos robustos
     df["env_n"]  = df["env_n"].astype(int)
@@ -81,8 +66,15 @@ def main():
         .apply(agg, include_groups=False)
         .reset_index()
     )
-    summary = summary.sort_values(["size", "algorithm_name"]).reset_index(drop=True)
+    return summary.sort_values(["size", "algorithm_name"]).reset_index(drop=True)
+
+def main():
+    rows = load_rows(STORE_PATH, JSON_DIR)
+    if not rows:
+        print("No se encontraron corridas. ¿Ya corriste main_experiments.py?")
+        return
 
+    summary = summarize(rows)
     os.makedirs(RESULTS_ROOT, exist_ok=True)
     summary.to_csv(SUMMARY_CSV, index=False)
     print("Resumen guardado en:", SUMMARY_CSV)
@@ -0,0 +1,502 @@
+"""
+Benchmark de rendimiento de las implementaciones de N-reinas (tp4).
+
+Separa el costo computacional de la calidad de las soluciones, que es lo que
+registra `RunRecord`. Mide tres cosas para N = 8..500:
+
+- throughput: evaluaciones por segundo de cada `Board` (`fitness` completo)
+  y de los evaluadores incrementales O(1) de SA y min-conflicts;
+- iteration_cost: segundos por iteración de cada algoritmo (iteración =
+  escalada en HC, propuesta en SA, generación en GA, movimiento en TS/MC);
+- time_to_solution: distribución del tiempo hasta H=0 de cada algoritmo,
+  hasta el N en que todavía resuelve dentro de su presupuesto, con las
+  corridas sin solución censuradas.
+
+Uso:
+    python benchmark.py run [--out results/benchmark_baseline.json]
+    python benchmark.py compare [--baseline ...] [--tolerance 0.2]
+
+`compare` repite las mediciones con la configuración guardada en la línea
+base y termina con código 1 si algún throughput cae (o algún costo por
+iteración sube) más allá de la tolerancia.
+
+La velocidad de una máquina compartida puede variar más de un 30 % en pocos
+segundos. Por eso cada repetición se intercala con un ciclo de calibración
+en Python puro y, además del valor crudo (mediana), se guarda un `score`
+normalizado: la mediana del cociente contra esa calibración. Las
+comparaciones usan el `score`; las del costo por iteración, además, sus
+cotas mínima y máxima entre repeticiones (ver `compare`).
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import n_reinas_GA as ga
+import n_reinas_HC as hc
+import n_reinas_MC as mc
+import n_reinas_SA as sa
+import n_reinas_TS as ts
+import n_reinas_random as rnd
+from conflicts import ConflictTracker, count_conflicts
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BASE_DIR, "results", "benchmark_baseline.json")
+
+DEFAULT_SIZES = [8, 16, 32, 64, 128, 256, 500]
+DEFAULT_TTS_RUNS = 10
+MIN_TIME = 0.1  # segundos mínimos por medición
+REPEATS = 5     # se informa la mediana de las repeticiones
+CONFIRM = 3     # re-mediciones de una posible regresión antes de reportarla
+ITER_SEEDS = 8  # semillas fijas que recorre cada repetición del costo por iteración
+
+
+def _calibration_rate(k: int = 100_000) -> float:
+    """Operaciones por segundo de un ciclo fijo que no depende del TP."""
+    t0 = time.perf_counter()
+    acc = 0
+    for i in range(k):
+        acc += (i * 7) % 13
+    return k / (time.perf_counter() - t0)
+
+
+def _median_rate(work: Callable[[int], int], min_time: float = MIN_TIME) -> Tuple[float, float]:
+    """(ops/s, score) de `work(k)`, que ejecuta k operaciones y las devuelve.
+
+    Calibra k hasta superar `min_time` y toma la mediana de `REPEATS`
+    repeticiones; el score es la mediana de ops/s dividido la calibración
+    medida justo antes de cada repetición.
+    """
+    k = 1
+    while True:
+        t0 = time.perf_counter()
+        work(k)
+        if time.perf_counter() - t0 >= min_time:
+            break
+        k *= 2
+    rates, scores = [], []
+    for _ in range(REPEATS):
+        calibration = _calibration_rate()
+        t0 = time.perf_counter()
+        done = work(k)
+        rate = done / (time.perf_counter() - t0)
+        rates.append(rate)
+        scores.append(rate / calibration)
+    return statistics.median(rates), statistics.median(scores)
+
+
+# =================== Throughput de evaluación ===================
+def _fitness_work(board_cls, n: int) -> Callable[[int], int]:
+    board = board_cls(dimension=n)
+    states = [board.random_start() for _ in range(64)]
+
+    def work(k: int) -> int:
+        fitness = board.fitness
+        for i in range(k):
+            fitness(states[i & 63])
+        return k
+
+    return work
+
+
+def _sa_delta_work(n: int) -> Callable[[int], int]:
+    board = sa.Board(dimension=n)
+    tracker = ConflictTracker(board.queens[:])
+    moves = [(random.randrange(n), random.randrange(n)) for _ in range(256)]
+
+    def work(k: int) -> int:
+        neighbour_fitness = board.neighbour_fitness
+        for i in range(k):
+            column, row = moves[i & 255]
+            neighbour_fitness(tracker, column, row)
+        return k
+
+    return work
+
+
+def _mc_delta_work(n: int) -> Callable[[int], int]:
+    board = mc.Board(dimension=n)
+    moves = [(random.randrange(n), random.randrange(n)) for _ in range(256)]
+
+    def work(k: int) -> int:
+        conflicts = board.conflicts
+        for i in range(k):
+            column, row = moves[i & 255]
+            conflicts(column, row)
+        return k
+
+    return work
+
+
+THROUGHPUT: Dict[str, Callable[[int], Callable[[int], int]]] = {
+    "random.fitness": lambda n: _fitness_work(rnd.Board, n),
+    "HC.fitness": lambda n: _fitness_work(hc.Board, n),
+    "SA.fitness": lambda n: _fitness_work(sa.Board, n),
+    "GA.fitness": lambda n: _fitness_work(ga.Board, n),
+    "TS.fitness": lambda n: _fitness_work(ts.Board, n),
+    "SA.neighbour_fitness": _sa_delta_work,
+    "MC.conflicts": _mc_delta_work,
+}
+
+
+# =================== Costo por iteración ===================
+# Cada función corre el algoritmo una vez con un presupuesto acotado y devuelve
+# (iteraciones, segundos). Las iteraciones se derivan de la longitud de la
+# historia H(t) y el tiempo excluye la construcción del tablero.
+def _iters_random(n: int) -> Tuple[int, float]:
+    board = rnd.Board(dimension=n, max_evals=20_000)
+    t0 = time.perf_counter()
+    _, _, history = rnd.random_search(board, return_history=True)
+    return len(history), time.perf_counter() - t0
+
+
+def _iters_hc(n: int) -> Tuple[int, float]:
+    # Una iteración es un barrido completo del vecindario (N * (N - 1) vecinos).
+    board = hc.Board(dimension=n)
+    t0 = time.perf_counter()
+    _, history = hc.hill_climbing(board, max_steps=max(1, 4096 // (n * n)), return_history=True)
+    return (len(history) + 1) // 2, time.perf_counter() - t0
+
+
+def _iters_sa(n: int) -> Tuple[int, float]:
+    board = sa.Board(dimension=n, max_evals=50_000)
+    t0 = time.perf_counter()
+    _, _, history = sa.simulated_annealing(
+        board, T_init=float(n), T_min=1e-9, alpha=0.9999, max_iters=50_000, return_history=True
+    )
+    return len(history), time.perf_counter() - t0
+
+
+def _iters_ga(n: int) -> Tuple[int, float]:
+    board = ga.Board(dimension=n)
+    t0 = time.perf_counter()
+    _, history = board.genetic_algorithm(population_size=100, generations=10, return_history=True)
+    return max(1, len(history) - 1), time.perf_counter() - t0
+
+
+def _iters_ts(n: int) -> Tuple[int, float]:
+    board = ts.Board(dimension=n)
+    t0 = time.perf_counter()
+    _, _, history = ts.tabu_search(board, max_iters=max(5, 20_000 // (n * n)), return_history=True)
+    return len(history), time.perf_counter() - t0
+
+
+def _iters_mc(n: int) -> Tuple[int, float]:
+    board = mc.Board(dimension=n)
+    t0 = time.perf_counter()
+    _, _, history = mc.min_conflicts(board, max_evals=20_000 + board.evaluations, return_history=True)
+    return len(history), time.perf_counter() - t0
+
+
+# (función, N máximo): HC recorre O(N²) vecinos por iteración y cada uno cuesta O(N)
+ITERATION: Dict[str, Tuple[Callable[[int], Tuple[int, float]], int]] = {
+    "random": (_iters_random, 500),
+    "HC": (_iters_hc, 64),
+    "SA": (_iters_sa, 500),
+    "GA": (_iters_ga, 500),
+    "TS": (_iters_ts, 500),
+    "MC": (_iters_mc, 500),
+}
+
+
+def measure_throughput(name: str, n: int) -> Dict[str, float]:
+    random.seed(f"bench-eval-{name}-{n}")
+    rate, score = _median_rate(THROUGHPUT[name](n))
+    return {"rate": rate, "score": score}
+
+
+def measure_iteration(name: str, n: int, min_time: float = MIN_TIME) -> Dict[str, float]:
+    """Segundos por iteración y score = segundos * calibración (menor es mejor).
+
+    Cada repetición recorre vueltas completas de las mismas `ITER_SEEDS`
+    semillas hasta acumular `min_time` segundos, de modo que todas (y la
+    línea base) promedian la misma mezcla de corridas. Se informa la mediana
+    de `REPEATS` y también el mínimo y el máximo del score, que `compare`
+    usa como cotas del ruido.
+    """
+    run = ITERATION[name][0]
+    costs, scores = [], []
+    for _ in range(REPEATS):
+        calibration = _calibration_rate()
+        iterations, elapsed = 0, 0.0
+        while elapsed < min_time:
+            for seed in range(ITER_SEEDS):
+                random.seed(f"bench-iter-{name}-{n}-{seed}")
+                done, seconds = run(n)
+                iterations += done
+                elapsed += seconds
+        cost = elapsed / iterations
+        costs.append(cost)
+        scores.append(cost * calibration)
+    return {
+        "seconds": statistics.median(costs),
+        "score": statistics.median(scores),
+        "score_min": min(scores),
+        "score_max": max(scores),
+    }
+
+
+# =================== Tiempo hasta la solución ===================
+def _tts_random(n: int) -> bool:
+    board = rnd.Board(dimension=n, max_evals=500_000)
+    _, h, _ = rnd.random_search(board)
+    return h == 0
+
+
+def _tts_hc(n: int) -> bool:
+    # HC solo queda en mínimos locales: se reinicia en secuencia (HC-RR sin
+    # procesos) hasta H=0 o agotar el presupuesto.
+    board = hc.Board(dimension=n, max_evals=200 * n ** 3)
+    while not board.budget_exhausted():
+        board.queens = board.random_start()
+        queens, _ = hc.hill_climbing(board)
+        if count_conflicts(queens) == 0:
+            return True
+    return False
+
+
+def _tts_ga(n: int) -> bool:
+    board = ga.Board(dimension=n, max_evals=500 * n * n)
+    solution = board.genetic_algorithm(population_size=100, generations=999_999_999)
+    return count_conflicts(solution) == 0
+
+
+def _tts_ts(n: int) -> bool:
+    board = ts.Board(dimension=n, max_evals=200 * n * n)
+    _, h, _ = ts.tabu_search(board, max_iters=999_999_999)
+    return h == 0
+
+
+def _tts_mc(n: int) -> bool:
+    board = mc.Board(dimension=n)
+    _, h, _ = mc.min_conflicts(board, max_evals=board.evaluations + 1000 * n)
+    return h == 0
+
+
+def _tts_sa(n: int) -> bool:
+    board = sa.Board(dimension=n, max_evals=100 * n * n)
+    _, h = sa.simulated_annealing(board, T_init=float(n), T_min=1e-3, alpha=0.999, max_iters=999_999_999)
+    return h == 0
+
+
+# (función, N máximo): más allá de ese N la mayoría de las corridas agota el
+# presupuesto y la distribución queda casi toda censurada.
+TIME_TO_SOLUTION: Dict[str, Tuple[Callable[[int], bool], int]] = {
+    "random": (_tts_random, 8),
+    "HC": (_tts_hc, 16),
+    "GA": (_tts_ga, 16),
+    "SA": (_tts_sa, 32),
+    "TS": (_tts_ts, 256),
+    "MC": (_tts_mc, 500),
+}
+
+
+def _quantile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    pos = q * (len(sorted_values) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def _time_to_solution(solve: Callable[[int], bool], n: int, runs: int, name: str) -> Dict[str, float]:
+    times: List[float] = []
+    for seed in range(runs):
+        random.seed(f"bench-{name}-{n}-{seed}")
+        t0 = time.perf_counter()
+        solved = solve(n)
+        if solved:
+            times.append(time.perf_counter() - t0)
+    times.sort()
+    return {
+        "runs": runs,
+        "solved": len(times),
+        "median": _quantile(times, 0.5),
+        "p90": _quantile(times, 0.9),
+        "max": times[-1] if times else float("nan"),
+        "mean": statistics.fmean(times) if times else float("nan"),
+    }
+
+
+# =================== Ejecución y comparación ===================
+def run_benchmark(sizes: Sequence[int], tts_runs: int, sections: Sequence[str]) -> Dict:
+    random.seed(0)
+    result: Dict = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "config": {"sizes": list(sizes), "tts_runs": tts_runs, "sections": list(sections)},
+    }
+
+    if "throughput" in sections:
+        print("== Throughput (evaluaciones/s) ==")
+        table: Dict[str, Dict[str, Dict]] = {}
+        for name in THROUGHPUT:
+            table[name] = {}
+            for n in sizes:
+                table[name][str(n)] = measure_throughput(name, n)
+            print(f"{name:>22} " + " ".join(f"N={n}:{v['rate']:>10.0f}" for n, v in table[name].items()))
+        result["throughput"] = table
+
+    if "iteration" in sections:
+        print("== Costo por iteración (µs) ==")
+        table = {}
+        for name, (_, max_n) in ITERATION.items():
+            table[name] = {}
+            for n in sizes:
+                if n > max_n:
+                    continue
+                table[name][str(n)] = measure_iteration(name, n)
+            print(f"{name:>8} " + " ".join(f"N={n}:{v['seconds'] * 1e6:>10.1f}" for n, v in table[name].items()))
+        result["iteration_cost"] = table
+
+    if "tts" in sections:
+        print("== Tiempo hasta la solución (s) ==")
+        table = {}
+        for name, (solve, max_n) in TIME_TO_SOLUTION.items():
+            table[name] = {}
+            for n in sizes:
+                if n > max_n:
+                    continue
+                stats = _time_to_solution(solve, n, tts_runs, name)
+                table[name][str(n)] = stats
+                print(
+                    f"{name:>4} N={n:>3}: resueltas {stats['solved']}/{stats['runs']} | "
+                    f"mediana={stats['median']:.4f} p90={stats['p90']:.4f} máx={stats['max']:.4f}"
+                )
+        result["time_to_solution"] = table
+
+    return result
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float, confirm: int = CONFIRM) -> List[str]:
+    """Lista de regresiones: score de throughput menor a (1 - tol) veces la
+    línea base o score de costo por iteración mayor a (1 + tol) veces.
+
+    El costo por iteración proviene de algoritmos estocásticos y su mediana
+    varía entre corridas más que la tolerancia; por eso se compara por
+    cotas: sólo es regresión si la mejor repetición actual (`score_min`)
+    supera en más de la tolerancia a la peor de la línea base (`score_max`).
+
+    Cada posible regresión se vuelve a medir hasta `confirm` veces y sólo se
+    reporta si la mejor medición sigue fuera de tolerancia.
+    """
+    regressions = []
+    for name, by_size in baseline.get("throughput", {}).items():
+        for n, base in by_size.items():
+            now = current.get("throughput", {}).get(name, {}).get(n)
+            if now is None or name not in THROUGHPUT:
+                continue
+            for _ in range(confirm):
+                if now["score"] >= base["score"] * (1 - tolerance):
+                    break
+                now = max(now, measure_throughput(name, int(n)), key=lambda m: m["score"])
+            current["throughput"][name][n] = now
+            if now["score"] < base["score"] * (1 - tolerance):
+                regressions.append(
+                    f"throughput {name} N={n}: score {now['score']:.4f} < {base['score']:.4f} "
+                    f"({now['rate']:.0f}/s vs {base['rate']:.0f}/s)"
+                )
+    for name, by_size in baseline.get("iteration_cost", {}).items():
+        for n, base in by_size.items():
+            now = current.get("iteration_cost", {}).get(name, {}).get(n)
+            if now is None or name not in ITERATION:
+                continue
+            limit = base.get("score_max", base["score"]) * (1 + tolerance)
+            for _ in range(confirm):
+                if now["score_min"] <= limit:
+                    break
+                now = min(now, measure_iteration(name, int(n)), key=lambda m: m["score_min"])
+            current["iteration_cost"][name][n] = now
+            if now["score_min"] > limit:
+                regressions.append(
+                    f"iteración {name} N={n}: score {now['score_min']:.2f}..{now['score_max']:.2f} "
+                    f"> {base.get('score_min', base['score']):.2f}..{base.get('score_max', base['score']):.2f} "
+                    f"({now['seconds'] * 1e6:.1f}µs vs {base['seconds'] * 1e6:.1f}µs)"
+                )
+    return regressions
+
+
+def _print_tts_changes(baseline: Dict, current: Dict) -> None:
+    """Informa (sin fallar) los cambios en la mediana de tiempo hasta la solución."""
+    for name, by_size in baseline.get("time_to_solution", {}).items():
+        for n, base in by_size.items():
+            now = current.get("time_to_solution", {}).get(name, {}).get(n)
+            if now is None:
+                continue
+            print(
+                f"TTS {name} N={n}: mediana {base['median']:.4f}s -> {now['median']:.4f}s "
+                f"| resueltas {base['solved']} -> {now['solved']}"
+            )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de rendimiento de N-reinas (tp4).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="Mide y guarda una línea base JSON.")
+    run_p.add_argument("--out", default=BASELINE_PATH, help="Archivo de salida (default: results/benchmark_baseline.json).")
+    run_p.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Tamaños N a medir.")
+    run_p.add_argument("--tts-runs", type=int, default=DEFAULT_TTS_RUNS, help="Corridas por punto de tiempo-a-solución.")
+    run_p.add_argument(
+        "--sections",
+        nargs="+",
+        choices=["throughput", "iteration", "tts"],
+        default=["throughput", "iteration", "tts"],
+        help="Secciones a medir (default: todas).",
+    )
+
+    cmp_p = sub.add_parser("compare", help="Repite la medición y la compara con la línea base.")
+    cmp_p.add_argument("--baseline", default=BASELINE_PATH, help="Línea base a comparar.")
+    cmp_p.add_argument("--tolerance", type=float, default=0.2, help="Caída relativa tolerada (default: 0.2).")
+    cmp_p.add_argument(
+        "--confirm",
+        type=int,
+        default=CONFIRM,
+        help=f"Re-mediciones de cada posible regresión (default: {CONFIRM}).",
+    )
+    cmp_p.add_argument("--out", default=None, help="Guarda también la medición actual en este archivo.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        result = run_benchmark(args.sizes, args.tts_runs, args.sections)
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print("Línea base guardada en:", args.out)
+        return 0
+
+    if not os.path.isfile(args.baseline):
+        print(f"No existe la línea base {args.baseline}. Corré `python benchmark.py run` primero.")
+        return 2
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    config = baseline["config"]
+    current = run_benchmark(config["sizes"], config["tts_runs"], config["sections"])
+    _print_tts_changes(baseline, current)
+    regressions = compare(baseline, current, args.tolerance, args.confirm)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+    if regressions:
+        print(f"\nRegresiones (tolerancia {args.tolerance:.0%}):")
+        for line in regressions:
+            print("  -", line)
+        return 1
+    print(f"\nSin regresiones (tolerancia {args.tolerance:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Conteo O(N) de conflictos para N-reinas (representación columna→fila).
+
+H(e) es la cantidad de pares de reinas que se atacan. Como dos reinas en
+columnas distintas nunca comparten fila y diagonal a la vez, H es la suma de
+C(k, 2) sobre las reinas por fila, por diagonal `r - c` y por antidiagonal
+`r + c`. `count_conflicts` obtiene esa suma en una sola pasada: cada reina
+suma las que ya ocupaban sus tres líneas. `count_conflicts_batch` evalúa un
+lote (B, N) con NumPy y `ConflictTracker` mantiene los contadores de un estado
+para evaluar movimientos en O(1).
+
+`Board.get_threat` (doble ciclo sobre pares de columnas) se conserva en cada
+módulo como implementación de referencia; `python conflicts.py` verifica la
+equivalencia sobre tableros aleatorios y mide ambos métodos.
+"""
+
+import argparse
+import random
+import time
+from typing import List, Sequence
+
+
+def count_conflicts(queens: Sequence[int]) -> int:
+    """Pares de reinas amenazadas en O(N)."""
+    n = len(queens)
+    offset = n - 1
+    rows = [0] * n
+    diag1 = [0] * (2 * n - 1)  # r - c + (n - 1)
+    diag2 = [0] * (2 * n - 1)  # r + c
+    total = 0
+    for col, row in enumerate(queens):
+        d1 = row - col + offset
+        d2 = row + col
+        total += rows[row] + diag1[d1] + diag2[d2]
+        rows[row] += 1
+        diag1[d1] += 1
+        diag2[d2] += 1
+    return total
+
+
+def count_conflicts_batch(boards, rows: bool = True):
+    """H(e) de cada fila de un arreglo (B, N); devuelve un arreglo (B,) int64.
+
+    Cuenta reinas por fila y diagonal con un `bincount` por tipo de línea
+    (desplazando cada tablero a su propio rango de casilleros) y suma
+    C(k, 2). Con `rows=False` se omite el conteo por fila, que es siempre
+    cero cuando cada tablero es una permutación (como en el GA). Requiere
+    NumPy, que se importa recién al usarla.
+    """
+    import numpy as np
+
+    boards = np.asarray(boards)
+    b, n = boards.shape
+    width = 2 * n - 1
+    cols = np.arange(n)
+    offsets = (np.arange(b) * width)[:, None]
+    threats = np.zeros(b, dtype=np.int64)
+    lines = (boards - cols + (n - 1), boards + cols)
+    if rows:
+        lines = (boards,) + lines
+    for line in lines:
+        counts = np.bincount((line + offsets).ravel(), minlength=b * width)
+        threats += (counts * (counts - 1) // 2).reshape(b, width).sum(axis=1)
+    return threats
+
+
+class ConflictTracker:
+    """Contadores de reinas por fila y diagonal de un estado columna→fila.
+
+    Permite calcular la variación de H al mover una reina en O(1). La lista
+    `queens` se comparte (no se copia) y `move` la modifica en el lugar.
+    """
+
+    def __init__(self, queens: List[int]):
+        n = len(queens)
+        self.queens = queens
+        self.offset = n - 1
+        self.rows = [0] * n
+        self.diag1 = [0] * (2 * n - 1)  # r - c + (n - 1)
+        self.diag2 = [0] * (2 * n - 1)  # r + c
+        for col, row in enumerate(queens):
+            self.rows[row] += 1
+            self.diag1[row - col + self.offset] += 1
+            self.diag2[row + col] += 1
+        self.h = sum(
+            k * (k - 1) // 2 for counts in (self.rows, self.diag1, self.diag2) for k in counts
+        )
+
+    def delta(self, column: int, new_row: int) -> int:
+        """Variación de H si la reina de `column` pasa a `new_row`."""
+        old_row = self.queens[column]
+        d1, d2 = self.diag1, self.diag2
+        removed = (
+            self.rows[old_row] - 1
+            + d1[old_row - column + self.offset] - 1
+            + d2[old_row + column] - 1
+        )
+        added = self.rows[new_row] + d1[new_row - column + self.offset] + d2[new_row + column]
+        return added - removed
+
+    def move(self, column: int, new_row: int) -> None:
+        """Aplica el movimiento en el lugar actualizando contadores y H."""
+        self.h += self.delta(column, new_row)
+        old_row = self.queens[column]
+        self.rows[old_row] -= 1
+        self.diag1[old_row - column + self.offset] -= 1
+        self.diag2[old_row + column] -= 1
+        self.rows[new_row] += 1
+        self.diag1[new_row - column + self.offset] += 1
+        self.diag2[new_row + column] += 1
+        self.queens[column] = new_row
+
+
+def reference_threat(queens: Sequence[int]) -> int:
+    """Doble ciclo de `Board.get_threat`, sin depender de un tablero."""
+    threats = 0
+    n = len(queens)
+    for col_a in range(n):
+        for col_b in range(col_a + 1, n):
+            same_row = queens[col_a] == queens[col_b]
+            same_diag = abs(queens[col_a] - queens[col_b]) == abs(col_a - col_b)
+            if same_row or same_diag:
+                threats += 1
+    return threats
+
+
+def check_equivalence(trials: int = 2000, max_n: int = 40, seed: int = 0) -> None:
+    """Compara contra la referencia sobre tableros aleatorios (permutaciones,
+    filas repetidas y casos extremos como todas las reinas en una fila)."""
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(trials):
+        n = rng.randint(1, max_n)
+        kind = rng.randrange(4)
+        if kind == 0:
+            queens = [rng.randrange(n) for _ in range(n)]
+        elif kind == 1:
+            queens = rng.sample(range(n), n)
+        elif kind == 2:
+            queens = [rng.randrange(n)] * n
+        else:
+            queens = [min(n - 1, col) for col in range(n)]
+            if rng.random() < 0.5:
+                queens.reverse()
+        cases.append(queens)
+
+    for queens in cases:
+        expected = reference_threat(queens)
+        got = count_conflicts(queens)
+        assert got == expected, (queens, got, expected)
+
+    try:
+        import numpy as np
+    except ImportError:
+        print(f"count_conflicts: {len(cases)} tableros OK (NumPy no disponible, se omite el lote)")
+        return
+
+    by_size = {}
+    for queens in cases:
+        by_size.setdefault(len(queens), []).append(queens)
+    for n, group in by_size.items():
+        got = count_conflicts_batch(np.array(group))
+        expected = [reference_threat(queens) for queens in group]
+        assert got.tolist() == expected, n
+        permutations = [queens for queens in group if sorted(queens) == list(range(n))]
+        if permutations:
+            got = count_conflicts_batch(np.array(permutations), rows=False)
+            assert got.tolist() == [reference_threat(queens) for queens in permutations], n
+    print(f"count_conflicts y count_conflicts_batch: {len(cases)} tableros OK")
+
+
+def benchmark(sizes: Sequence[int], batch: int = 1000) -> None:
+    """Tiempo por tablero: doble ciclo vs O(N) vs lote NumPy."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    print(f"{'N':>6} {'get_threat':>14} {'O(N)':>12} {'NumPy/tablero':>15} {'speedup O(N)':>13}")
+    for n in sizes:
+        boards = [[random.randrange(n) for _ in range(n)] for _ in range(batch)]
+        ref_boards = boards[: max(1, min(batch, 200_000 // (n * n)))]
+
+        t0 = time.perf_counter()
+        for queens in ref_boards:
+            reference_threat(queens)
+        t_ref = (time.perf_counter() - t0) / len(ref_boards)
+
+        t0 = time.perf_counter()
+        for queens in boards:
+            count_conflicts(queens)
+        t_fast = (time.perf_counter() - t0) / len(boards)
+
+        t_batch = float("nan")
+        if np is not None:
+            arr = np.array(boards)
+            t0 = time.perf_counter()
+            count_conflicts_batch(arr)
+            t_batch = (time.perf_counter() - t0) / len(boards)
+
+        print(
+            f"{n:>6} {t_ref * 1e6:>12.1f}us {t_fast * 1e6:>10.1f}us "
+            f"{t_batch * 1e6:>13.2f}us {t_ref / t_fast:>12.1f}x"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verificación y benchmark del conteo O(N) de conflictos.")
+    parser.add_argument("--trials", type=int, default=2000, help="Tableros aleatorios a verificar (default: 2000).")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[4, 8, 10, 12, 15, 30, 100, 300, 1000],
+        help="Tamaños del benchmark.",
+    )
+    args = parser.parse_args()
+
+    check_equivalence(args.trials)
+    benchmark(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Registro compacto de la serie H(t) de una corrida.
+
+Los algoritmos agregan un valor de H por iteración, lo que puede significar
+cientos de miles de enteros Python por corrida. Este módulo ofrece dos
+registradores con la misma interfaz (`append`, `len`, `points`):
+
+- `RLEHistory`: guarda la serie completa en `array('I')` comprimiendo los
+  tramos planos (valor, repeticiones). Se comporta como una secuencia, de modo
+  que `list(history)`, `history[i]` e iterarla siguen funcionando.
+- `BucketHistory`: submuestreo en línea con presupuesto fijo de puntos.
+  Conserva el mínimo y el máximo de cada bucket de iteraciones y, cuando se
+  llena, fusiona buckets de a pares duplicando su ancho. La memoria queda
+  acotada sin importar la cantidad de iteraciones.
+"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, repeat
+from typing import Iterator, List, Optional, Tuple, Union
+
+
+class RLEHistory:
+    """Serie H(t) completa con codificación por tramos (run-length).
+
+    El tramo en curso se mantiene en atributos y se vuelca a los arreglos
+    recién cuando cambia el valor, de modo que `append` sobre una meseta sólo
+    incrementa un contador.
+    """
+
+    __slots__ = ("_values", "_counts", "_value", "_count", "_flushed", "_ends")
+
+    def __init__(self):
+        self._values = array("I")
+        self._counts = array("I")
+        self._value: Optional[int] = None
+        self._count = 0
+        self._flushed = 0
+        self._ends: Optional[array] = None
+
+    def append(self, value: int) -> None:
+        if value == self._value:
+            self._count += 1
+            return
+        if self._count:
+            self._flush()
+        self._value = value
+        self._count = 1
+
+    def _flush(self) -> None:
+        # Un vuelco parcial (por una lectura) puede continuar el último tramo.
+        if self._values and self._values[-1] == self._value:
+            self._counts[-1] += self._count
+        else:
+            self._values.append(self._value)
+            self._counts.append(self._count)
+        self._flushed += self._count
+        self._count = 0
+        self._ends = None
+
+    def runs(self) -> Tuple[array, array]:
+        """Arreglos (valores, repeticiones) de todos los tramos."""
+        if self._count:
+            self._flush()
+        return self._values, self._counts
+
+    def __len__(self) -> int:
+        return self._flushed + self._count
+
+    def __iter__(self) -> Iterator[int]:
+        for value, count in zip(*self.runs()):
+            yield from repeat(value, count)
+
+    def __getitem__(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("índice de historia fuera de rango")
+        values, counts = self.runs()
+        if self._ends is None:
+            self._ends = array("Q", accumulate(counts))
+        return values[bisect_right(self._ends, index)]
+
+    def __eq__(self, other) -> bool:
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"RLEHistory(len={len(self)}, runs={len(self.runs()[0])})"
+
+    def points(self) -> Tuple[List[int], List[int]]:
+        """Extremos de cada tramo: reproduce exactamente la curva escalonada."""
+        xs: List[int] = []
+        ys: List[int] = []
+        start = 0
+        for value, count in zip(*self.runs()):
+            xs.append(start)
+            ys.append(value)
+            if count > 1:
+                xs.append(start + count - 1)
+                ys.append(value)
+            start += count
+        return xs, ys
+
+    def nbytes(self) -> int:
+        values, counts = self.runs()
+        return values.itemsize * len(values) + counts.itemsize * len(counts)
+
+
+class BucketHistory:
+    """Submuestreo mín/máx por bucket con a lo sumo `max_points` puntos.
+
+    El bucket `b` cubre las iteraciones [b * width, (b + 1) * width). El
+    bucket abierto vive en atributos; los cerrados, en arreglos.
+    """
+
+    __slots__ = (
+        "max_buckets", "width", "_length", "_end", "first", "last",
+        "_lo", "_lo_at", "_hi", "_hi_at", "lo", "lo_at", "hi", "hi_at",
+    )
+
+    def __init__(self, max_points: int = 1500):
+        self.max_buckets = max(1, max_points // 2)
+        self.width = 1
+        self._length = 0
+        self._end = 0
+        self.first: Optional[int] = None
+        self.last: Optional[int] = None
+        self._lo = self._hi = self._lo_at = self._hi_at = 0
+        self.lo = array("I")
+        self.lo_at = array("Q")
+        self.hi = array("I")
+        self.hi_at = array("Q")
+
+    def append(self, value: int) -> None:
+        i = self._length
+        self._length = i + 1
+        self.last = value
+        if i < self._end:
+            if value < self._lo:
+                self._lo = value
+                self._lo_at = i
+            elif value > self._hi:
+                self._hi = value
+                self._hi_at = i
+            return
+        self._open_bucket(i, value)
+
+    def _open_bucket(self, i: int, value: int) -> None:
+        if i == 0:
+            self.first = value
+        else:
+            self.lo.append(self._lo)
+            self.lo_at.append(self._lo_at)
+            self.hi.append(self._hi)
+            self.hi_at.append(self._hi_at)
+            if len(self.lo) == self.max_buckets:
+                self._merge()
+
+        b = i // self.width
+        if b < len(self.lo):
+            # Tras fusionar una cantidad impar, `i` cae en el último bucket.
+            self._lo, self._lo_at = self.lo.pop(), self.lo_at.pop()
+            self._hi, self._hi_at = self.hi.pop(), self.hi_at.pop()
+            if value < self._lo:
+                self._lo, self._lo_at = value, i
+            elif value > self._hi:
+                self._hi, self._hi_at = value, i
+        else:
+            self._lo = self._hi = value
+            self._lo_at = self._hi_at = i
+        self._end = (b + 1) * self.width
+
+    def _merge(self) -> None:
+        """Fusiona buckets consecutivos de a pares y duplica el ancho."""
+        lo, lo_at, hi, hi_at = array("I"), array("Q"), array("I"), array("Q")
+        for b in range(0, len(self.lo), 2):
+            pair = range(b, min(b + 2, len(self.lo)))
+            j = min(pair, key=lambda k: self.lo[k])
+            lo.append(self.lo[j])
+            lo_at.append(self.lo_at[j])
+            j = max(pair, key=lambda k: self.hi[k])
+            hi.append(self.hi[j])
+            hi_at.append(self.hi_at[j])
+        self.lo, self.lo_at, self.hi, self.hi_at = lo, lo_at, hi, hi_at
+        self.width *= 2
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.points()[1])
+
+    def __repr__(self) -> str:
+        return f"BucketHistory(len={self._length}, buckets={len(self.lo) + 1}, width={self.width})"
+
+    def points(self) -> Tuple[List[int], List[int]]:
+        """Mínimo y máximo de cada bucket en orden, más el primer y el último valor."""
+        if self._length == 0:
+            return [], []
+        merged = {0: self.first, self._length - 1: self.last}
+        merged[self._lo_at] = self._lo
+        merged[self._hi_at] = self._hi
+        for b in range(len(self.lo)):
+            merged[self.lo_at[b]] = self.lo[b]
+            merged[self.hi_at[b]] = self.hi[b]
+        xs = sorted(merged)
+        return xs, [merged[x] for x in xs]
+
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.lo, self.lo_at, self.hi, self.hi_at))
+
+
+History = Union[RLEHistory, BucketHistory]
+
+
+def new_history(max_points: Optional[int] = None) -> History:
+    """Registrador completo (RLE) o, si se indica `max_points`, submuestreado."""
+    if max_points is None:
+        return RLEHistory()
+    return BucketHistory(max_points)
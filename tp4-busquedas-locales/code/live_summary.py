@@ -0,0 +1,243 @@
+"""
+Resumen en línea de las corridas de N-reinas (Welford).
+
+Mantiene, por (algoritmo, tamaño), la cantidad de corridas y de éxitos y la
+media/varianza acumuladas de H, tiempo y estados, tanto sobre todas las
+corridas como sólo sobre las exitosas. Cada corrida se incorpora en O(1) y el
+estado de su grupo se guarda en la tabla `summary` del almacén de corridas, de
+modo que el resumen puede consultarse mientras los experimentos siguen
+corriendo (`python live_summary.py`). Las columnas coinciden con las de
+`analyze_results.py` (desvío con ddof=1).
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+from typing import Dict, Iterable, List, Tuple
+
+from results_store import JSON_DIR, STORE_PATH, ResultsStore, open_store
+
+COLUMNS = [
+    "algorithm_name",
+    "size",
+    "runs",
+    "optimal_runs",
+    "optimality_pct",
+    "H_mean_all",
+    "H_std_all",
+    "time_mean_all",
+    "time_std_all",
+    "states_mean_all",
+    "states_std_all",
+    "time_mean_success",
+    "time_std_success",
+    "states_mean_success",
+    "states_std_success",
+]
+
+# (métrica, subconjunto) acumulados por grupo
+_TRACKED = [("H", "all"), ("time", "all"), ("states", "all"), ("time", "success"), ("states", "success")]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS summary (
+    algorithm_name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (algorithm_name, size)
+);
+"""
+
+
+class RunningStats:
+    """Media y suma de cuadrados centrada (M2) con el método de Welford."""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float) -> None:
+        """Deshace un `add(x)` previo (usado al reemplazar una corrida)."""
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        self.count -= 1
+        previous_mean = self.mean - (x - self.mean) / self.count
+        self.m2 = max(0.0, self.m2 - (x - previous_mean) * (x - self.mean))
+        self.mean = previous_mean
+
+    def std(self) -> float:
+        """Desvío muestral (ddof=1); 0 con una sola observación, NaN sin datos."""
+        if self.count == 0:
+            return float("nan")
+        if self.count == 1:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class LiveSummary:
+    """Agregados por (algoritmo, tamaño) persistidos junto al almacén."""
+
+    def __init__(self, store: ResultsStore):
+        self.store = store
+        self.conn = store.conn
+        self.conn.executescript(_SCHEMA)
+        self.groups: Dict[Tuple[str, int], Dict[str, RunningStats]] = {}
+        for algo, size, state in self.conn.execute("SELECT algorithm_name, size, state FROM summary"):
+            self.groups[(algo, size)] = {key: RunningStats(*values) for key, values in json.loads(state).items()}
+
+        built = self.conn.execute("SELECT value FROM meta WHERE key = 'summary_built'").fetchone()
+        if built is None:
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recalcula todos los grupos desde las corridas vigentes del almacén."""
+        self.groups = {}
+        touched = set()
+        for row in self.store.rows():
+            touched.add(self._apply(row, +1))
+        with self.conn:
+            self.conn.execute("DELETE FROM summary")
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('summary_built', '1')")
+            for key in touched:
+                self._persist(key)
+
+    def append(self, row: Dict) -> None:
+        """Agrega la corrida al almacén y la incorpora al resumen.
+
+        Fila y resumen se confirman en la misma transacción, de modo que una
+        interrupción no deja el resumen desfasado del almacén. Si la clave ya
+        tenía una versión vigente, se descuenta antes de sumar la nueva.
+        """
+        previous = self.store.get(row["algorithm_name"], row["size"], row["env_n"])
+        with self.conn:
+            self.store.insert_rows([row])
+            if previous is not None:
+                self._persist(self._apply(previous, -1))
+            self._persist(self._apply(row, +1))
+
+    def drop(self, algorithms: Iterable[str], sizes: Iterable[int]) -> None:
+        """Descarta los grupos borrados con `--reset`."""
+        sizes = list(sizes)
+        with self.conn:
+            for algo in algorithms:
+                for size in sizes:
+                    self.groups.pop((algo, size), None)
+                    self.conn.execute("DELETE FROM summary WHERE algorithm_name = ? AND size = ?", (algo, size))
+
+    def _apply(self, row: Dict, sign: int) -> Tuple[str, int]:
+        key = (row["algorithm_name"], int(row["size"]))
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {f"{metric}_{subset}": RunningStats() for metric, subset in _TRACKED}
+        success = int(row["H"]) == 0
+        for metric, subset in _TRACKED:
+            if subset == "success" and not success:
+                continue
+            stats = group[f"{metric}_{subset}"]
+            value = float(row[metric])
+            if sign > 0:
+                stats.add(value)
+            else:
+                stats.remove(value)
+        return key
+
+    def _persist(self, key: Tuple[str, int]) -> None:
+        group = self.groups[key]
+        if group["H_all"].count == 0:
+            del self.groups[key]
+            self.conn.execute("DELETE FROM summary WHERE algorithm_name = ? AND size = ?", key)
+            return
+        state = json.dumps({name: [s.count, s.mean, s.m2] for name, s in group.items()})
+        self.conn.execute(
+            "INSERT OR REPLACE INTO summary (algorithm_name, size, state) VALUES (?, ?, ?)",
+            (key[0], key[1], state),
+        )
+
+    def rows(self) -> List[Dict]:
+        """Filas con las columnas de results_summary.csv, ordenadas por (size, algoritmo)."""
+        out = []
+        for (algo, size), group in sorted(self.groups.items(), key=lambda item: (item[0][1], item[0][0])):
+            total = group["H_all"].count
+            n_ok = group["time_success"].count
+            row = {
+                "algorithm_name": algo,
+                "size": size,
+                "runs": total,
+                "optimal_runs": n_ok,
+                "optimality_pct": 100.0 * n_ok / total if total else 0.0,
+            }
+            for metric, subset in _TRACKED:
+                stats = group[f"{metric}_{subset}"]
+                row[f"{metric}_mean_{subset}"] = stats.mean if stats.count else float("nan")
+                row[f"{metric}_std_{subset}"] = stats.std()
+            out.append(row)
+        return out
+
+    def write_csv(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            for row in self.rows():
+                writer.writerow({k: ("" if isinstance(v, float) and math.isnan(v) else v) for k, v in row.items()})
+
+
+def check_against_batch(summary: LiveSummary) -> float:
+    """Máxima diferencia relativa contra `analyze_results.summarize`."""
+    import analyze_results
+
+    batch = analyze_results.summarize(summary.store.rows())
+    worst = 0.0
+    for live, (_, ref) in zip(summary.rows(), batch.iterrows()):
+        assert (live["algorithm_name"], live["size"]) == (ref["algorithm_name"], ref["size"])
+        for col in COLUMNS[2:]:
+            a, b = float(live[col]), float(ref[col])
+            if math.isnan(a) or math.isnan(b):
+                assert math.isnan(a) and math.isnan(b), (live["algorithm_name"], live["size"], col)
+                continue
+            worst = max(worst, abs(a - b) / max(1.0, abs(b)))
+    assert len(summary.rows()) == len(batch)
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumen en línea de las corridas registradas.")
+    parser.add_argument("--store", default=STORE_PATH, help="Ruta del almacén SQLite.")
+    parser.add_argument("--csv", default=None, help="Escribe el resumen en este CSV.")
+    parser.add_argument("--rebuild", action="store_true", help="Recalcula el resumen desde las corridas.")
+    parser.add_argument("--check", action="store_true", help="Compara contra analyze_results (requiere pandas).")
+    args = parser.parse_args()
+
+    if not os.path.isfile(args.store) and not os.path.isdir(JSON_DIR):
+        print("No se encontró el almacén de corridas. ¿Ya corriste main_experiments.py?")
+        return
+
+    with open_store(args.store) as store:
+        summary = LiveSummary(store)
+        if args.rebuild:
+            summary.rebuild()
+        for row in summary.rows():
+            print(
+                f"{row['algorithm_name']:>10} N={row['size']:>3} | runs={row['runs']:>4} "
+                f"| óptimas={row['optimality_pct']:6.2f}% | H={row['H_mean_all']:.3f}±{row['H_std_all']:.3f} "
+                f"| time={row['time_mean_all']:.4f}s"
+            )
+        if args.csv:
+            summary.write_csv(args.csv)
+            print("Resumen guardado en:", args.csv)
+        if args.check:
+            print(f"Máxima diferencia relativa contra analyze_results: {check_against_batch(summary):.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,23 @@
 import argparse
 import csv
+import hashlib
 import json
 import os
 import random
-import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from typing import Callable, Dict, Iterable, List, Sequence, Tuple
 
 import n_reinas_GA as ga
 import n_reinas_HC as hc
+import n_reinas_MC as mc
 import n_reinas_SA as sa
+import n_reinas_TS as ts
 import n_reinas_random as rnd
+from conflicts import count_conflicts
+from live_summary import LiveSummary
+from results_store import ResultsStore, open_store
 
 # =================== Utilidades de impresión ===================
 def print_board(queens: Sequence[int]) -> None:
@@ -22,46 +28,18 @@ def print_board(queens: Sequence[int]) -> None:
         print(" ".join(line))
     print()
 
-# =================== Medición de estados ===================
-class FitnessCounter:
-    """Context manager para medir llamadas a `board.fitness`."""
-
-    def __init__(self, board, max_evals=None):
-        self.board = board
-        self.counter = 0
-        self.max_evals = max_evals
-        self._orig = board.fitness
-
-    def __enter__(self):
-        def counted_fitness(sol):
-            self.counter += 1
-            # Lanzar excepción si se excede el presupuesto
-            if self.max_evals and self.counter > self.max_evals:
-                raise BudgetExceeded()
-            return self._orig(sol)
-        self.board.fitness = counted_fitness  # type: ignore[attr-defined]
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        self.board.fitness = self._orig  # restaurar método original
-        # Suprimir excepción de presupuesto
-        if exc_type is BudgetExceeded:
-            return True
-
-class BudgetExceeded(Exception):
-    """Excepción para detener cuando se agota el presupuesto"""
-    pass
-
 # =================== Registro por corrida ===================
 @dataclass
 class RunRecord:
-    algorithm_name: str      # "random" | "HC" | "SA" | "GA"
+    algorithm_name: str      # "random" | "HC" | "HC-RR" | "SA" | "PT" | "TS" | "GA" | "GA-islands" | "MC"
     env_n: int               # id de la corrida [0..29]
     size: int                # N
     best_solution: List[int] # lista con la mejor solución (posiciones de reinas)
     H: int                   # valor de H() de esa solución
     states: int              # cantidad de estados explorados (llamadas a fitness)
     time: float              # tiempo (segundos)
+    restarts: int = 0        # reinicios (sólo algoritmos con reinicios, p. ej. HC-RR)
+    cache_hits: int = 0      # aciertos del memo de fitness (GA); no cuentan en `states`
 
 # =================== Configuración de experimentos ===================
 SIZES = [4, 8, 10, 12, 15]
@@ -77,82 +55,82 @@ MAX_EVALUATIONS = {
 }
 
 # Parámetros de algoritmos (sin max_iters, se controla por presupuesto)
+RANDOM_PARAMS = lambda n: dict(batch_size=1024)
+# Cantidad fija de procesos: forma parte de config_hash y no debe depender de la máquina
+HC_RR_PARAMS = lambda n: dict(workers=4)
 SA_PARAMS = lambda n: dict(T_init=float(n), T_min=1e-3, alpha=0.98)
+PT_PARAMS = lambda n: dict(replicas=8, T_min=0.1, T_max=1.5, swap_interval=10)
+TS_PARAMS = lambda n: dict(tenure=n)
 GA_PARAMS = lambda n: dict(population_size=100, generations=10_000)
+# Memo LRU de fitness del GA secuencial: los duplicados no consumen presupuesto
+GA_CACHE_PARAMS = lambda n: dict(cache_size=4096)
+# Modelo de islas: cada isla usa GA_PARAMS y el presupuesto se reparte entre todas
+GA_ISLAND_PARAMS = lambda n: dict(islands=4, migration_interval=20, migrants=2)
 
 # Salidas
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 RESULTS_ROOT = os.path.join(BASE_DIR, "results")
-JSON_DIR = os.path.join(RESULTS_ROOT, "json")
 CSV_PATH = os.path.join(RESULTS_ROOT, "all_runs.csv")
 SUMMARY_CSV = os.path.join(RESULTS_ROOT, "results_summary.csv")
 
 def ensure_dirs():
-    os.makedirs(JSON_DIR, exist_ok=True)
     os.makedirs(RESULTS_ROOT, exist_ok=True)
 
-def save_run_json(rec: RunRecord) -> str:
-    algo_dir = os.path.join(JSON_DIR, rec.algorithm_name, str(rec.size))
-    os.makedirs(algo_dir, exist_ok=True)
-    path = os.path.join(algo_dir, f"run_{rec.env_n}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        data = asdict(rec)
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    return path
 
+def config_hash(algorithm_name: str, size: int) -> str:
+    """Huella de la configuración que determina una corrida (presupuesto y parámetros)."""
+    config = {
+        "algorithm_name": algorithm_name,
+        "size": size,
+        "max_evals": MAX_EVALUATIONS[size],
+        "params": ALGO_PARAMS[algorithm_name](size),
+    }
+    payload = json.dumps(config, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()[:16]
 
-def rebuild_csv_from_json() -> None:
-    """Reconstruye all_runs.csv leyendo todos los JSON existentes."""
-    if not os.path.isdir(JSON_DIR):
-        if os.path.isfile(CSV_PATH):
-            os.remove(CSV_PATH)
-        return
 
-    entries = []
-    for algo in os.listdir(JSON_DIR):
-        algo_dir = os.path.join(JSON_DIR, algo)
-        if not os.path.isdir(algo_dir):
-            continue
-        for size_name in os.listdir(algo_dir):
-            size_dir = os.path.join(algo_dir, size_name)
-            if not os.path.isdir(size_dir):
-                continue
-            for fname in os.listdir(size_dir):
-                if not fname.endswith(".json"):
-                    continue
-                with open(os.path.join(size_dir, fname), "r", encoding="utf-8") as f:
-                    entries.append(json.load(f))
+def save_run(summary: LiveSummary, rec: RunRecord) -> None:
+    """Agrega la corrida al almacén y actualiza el resumen en línea (una transacción)."""
+    data = asdict(rec)
+    data["config_hash"] = config_hash(rec.algorithm_name, rec.size)
+    summary.append(data)
 
+
+def is_run_done(store: ResultsStore, algorithm_name: str, size: int, env_n: int) -> bool:
+    """Indica si la corrida ya está registrada con la configuración vigente."""
+    data = store.get(algorithm_name, size, env_n)
+    return data is not None and data.get("config_hash") == config_hash(algorithm_name, size)
+
+
+def rebuild_csv(store: ResultsStore) -> None:
+    """Reconstruye all_runs.csv a partir de las corridas vigentes del almacén."""
+    entries = store.rows()
     if not entries:
         if os.path.isfile(CSV_PATH):
             os.remove(CSV_PATH)
         return
 
-    entries.sort(key=lambda row: (row["size"], row["algorithm_name"], row["env_n"]))
     with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-        fieldnames = ["algorithm_name", "env_n", "size", "best_solution", "H", "states", "time"]
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        fieldnames = ["algorithm_name", "env_n", "size", "best_solution", "H", "states", "time", "restarts", "cache_hits"]
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
         for row in entries:
-            row = row.copy()
+            row.setdefault("restarts", 0)  # corridas previas a HC-RR
+            row.setdefault("cache_hits", 0)  # corridas previas al memo del GA
             row["best_solution"] = json.dumps(row["best_solution"], ensure_ascii=False)
             writer.writerow(row)
 
 
-def reset_results(target_sizes: Iterable[int], target_algorithms: Iterable[str]) -> None:
+def reset_results(
+    store: ResultsStore,
+    summary: LiveSummary,
+    target_sizes: Iterable[int],
+    target_algorithms: Iterable[str],
+) -> None:
     """Elimina resultados previos para los tamaños/algoritmos seleccionados."""
-    ensure_dirs()
-    for algo in target_algorithms:
-        algo_dir = os.path.join(JSON_DIR, algo)
-        if not os.path.isdir(algo_dir):
-            continue
-        for size in target_sizes:
-            size_dir = os.path.join(algo_dir, str(size))
-            if os.path.isdir(size_dir):
-                shutil.rmtree(size_dir)
-        if os.path.isdir(algo_dir) and not os.listdir(algo_dir):
-            os.rmdir(algo_dir)
-
+    target_algorithms = list(target_algorithms)
+    store.delete(target_algorithms, target_sizes)
+    summary.drop(target_algorithms, target_sizes)
     if os.path.isfile(SUMMARY_CSV):
         os.remove(SUMMARY_CSV)
 
@@ -191,7 +169,7 @@ def parse_cli() -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
         action="append",
         type=algo_choice,
         metavar="ALGO",
-        help="Algoritmo a ejecutar (random, HC, SA, GA). Puede repetirse.",
+        help="Algoritmo a ejecutar (random, HC, HC-RR, SA, PT, TS, GA, GA-islands, MC). Puede repetirse.",
     )
     parser.add_argument(
         "--runs",
@@ -215,136 +193,203 @@ def parse_cli() -> Tuple[argparse.ArgumentParser, argparse.Namespace]:
         action="store_true",
         help="Elimina resultados previos de los tamaños/algoritmos seleccionados antes de correr.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Procesos para repartir las corridas (default: 1, ejecución serial). "
+            "Los resultados coinciden con la ejecución serial salvo HC-RR y GA-islands, "
+            "cuyos procesos internos compiten por un presupuesto compartido y no son "
+            "reproducibles ni siquiera en serie."
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Omite corridas ya registradas en el almacén con la misma configuración (hash).",
+    )
     args = parser.parse_args()
     return parser, args
 
 # =================== Wrappers por algoritmo ===================
 def run_random(dim: int, env_n: int) -> RunRecord:
     random.seed(f"{dim}-{env_n}-RANDOM")
-    board = rnd.Board(dimension=dim)
-    max_evals = MAX_EVALUATIONS[dim]
-    
-    best = list(board.queens)
-    best_H = None
-    
-    with FitnessCounter(board, max_evals=max_evals) as fc:
-        t0 = time.perf_counter()
-        try:
-            best_H = board.fitness(best)
-            while True:
-                candidate = rnd.Board(dimension=dim).queens
-                cH = board.fitness(candidate)
-                if cH < best_H:
-                    best, best_H = candidate, cH
-                    if best_H == 0:
-                        break
-        except BudgetExceeded:
-            # Calcular fitness final sin incrementar contador
-            board.fitness = fc._orig
-            best_H = board.fitness(best)
-        elapsed = time.perf_counter() - t0
-    
-    return RunRecord("random", env_n, dim, best, int(best_H), fc.counter, float(elapsed))
+    board = rnd.Board(dimension=dim, max_evals=MAX_EVALUATIONS[dim])
+
+    t0 = time.perf_counter()
+    best, best_H, _ = rnd.random_search(board, **RANDOM_PARAMS(dim))
+    elapsed = time.perf_counter() - t0
+
+    return RunRecord("random", env_n, dim, list(best), int(best_H), board.evaluations, float(elapsed))
 
 def run_hc(dim: int, env_n: int) -> RunRecord:
     random.seed(f"{dim}-{env_n}-HC")
-    board = hc.Board(dimension=dim)
+    board = hc.Board(dimension=dim, max_evals=MAX_EVALUATIONS[dim])
+
+    t0 = time.perf_counter()
+    best, _ = hc.hill_climbing(board)
+    elapsed = time.perf_counter() - t0
+    best_H = count_conflicts(best)  # no consume presupuesto
+
+    return RunRecord("HC", env_n, dim, list(best), int(best_H), board.evaluations, float(elapsed))
+
+def run_hc_rr(dim: int, env_n: int) -> RunRecord:
     max_evals = MAX_EVALUATIONS[dim]
-    
-    best = list(board.queens)
-    best_H = None
-    history: List[int] = []
-    
-    with FitnessCounter(board, max_evals=max_evals) as fc:
-        t0 = time.perf_counter()
-        try:
-            best, history = hc.hill_climbing(board, return_history=True)
-        except BudgetExceeded:
-            best = list(board.queens)
-        elapsed = time.perf_counter() - t0
-        # Calcular fitness final sin incrementar contador
-        board.fitness = fc._orig
-        best_H = board.fitness(best)
-    
-    return RunRecord("HC", env_n, dim, best, int(best_H), fc.counter, float(elapsed))
+    params = HC_RR_PARAMS(dim)
+
+    # El presupuesto se cuenta en memoria compartida entre todos los procesos
+    t0 = time.perf_counter()
+    best, best_H, evaluations, restarts = hc.random_restart_hill_climbing(
+        dim,
+        workers=params["workers"],
+        max_evals=max_evals,
+        seed=f"{dim}-{env_n}-HC-RR",
+    )
+    elapsed = time.perf_counter() - t0
+
+    return RunRecord("HC-RR", env_n, dim, list(best), int(best_H), evaluations, float(elapsed), restarts)
 
 def run_sa(dim: int, env_n: int) -> RunRecord:
     random.seed(f"{dim}-{env_n}-SA")
-    board = sa.Board(dimension=dim)
+    board = sa.Board(dimension=dim, max_evals=MAX_EVALUATIONS[dim])
     params = SA_PARAMS(dim)
+
+    t0 = time.perf_counter()
+    solution, best_H = sa.simulated_annealing(
+        board,
+        T_init=params["T_init"],
+        T_min=params["T_min"],
+        alpha=params["alpha"],
+        max_iters=999_999_999,  # Sin límite de iteraciones, sólo presupuesto
+    )
+    elapsed = time.perf_counter() - t0
+
+    return RunRecord("SA", env_n, dim, list(solution), int(best_H), board.evaluations, float(elapsed))
+
+def run_ts(dim: int, env_n: int) -> RunRecord:
+    random.seed(f"{dim}-{env_n}-TS")
+    board = ts.Board(dimension=dim, max_evals=MAX_EVALUATIONS[dim])
+    params = TS_PARAMS(dim)
+
+    t0 = time.perf_counter()
+    solution, best_H, _ = ts.tabu_search(
+        board,
+        tenure=params["tenure"],
+        max_iters=999_999_999,  # Sin límite de iteraciones, sólo presupuesto
+    )
+    elapsed = time.perf_counter() - t0
+
+    return RunRecord("TS", env_n, dim, list(solution), int(best_H), board.evaluations, float(elapsed))
+
+def run_pt(dim: int, env_n: int) -> RunRecord:
+    random.seed(f"{dim}-{env_n}-PT")
+    board = sa.Board(dimension=dim, max_evals=MAX_EVALUATIONS[dim])
+    params = PT_PARAMS(dim)
+
+    t0 = time.perf_counter()
+    solution, best_H = sa.parallel_tempering(
+        board,
+        replicas=params["replicas"],
+        T_min=params["T_min"],
+        T_max=params["T_max"],
+        swap_interval=params["swap_interval"],
+        max_iters=999_999_999,  # Sin límite de barridos, sólo presupuesto
+    )
+    elapsed = time.perf_counter() - t0
+
+    return RunRecord("PT", env_n, dim, list(solution), int(best_H), board.evaluations, float(elapsed))
+
+def run_ga(dim: int, env_n: int, islands: int = 1) -> RunRecord:
+    params = GA_PARAMS(dim)
     max_evals = MAX_EVALUATIONS[dim]
-    
-    solution = board.queens
-    best_H = None
-    history: List[int] = []
-    
-    with FitnessCounter(board, max_evals=max_evals) as fc:
+
+    if islands > 1:
+        # Presupuesto global: la suma de evaluaciones de todas las islas
+        island_params = GA_ISLAND_PARAMS(dim)
         t0 = time.perf_counter()
-        try:
-            result = sa.simulated_annealing(
-                board,
-                T_init=params["T_init"],
-                T_min=params["T_min"],
-                alpha=params["alpha"],
-                max_iters=999_999_999,  # Sin límite de iteraciones, sólo presupuesto
-            )
-            if isinstance(result, tuple) and len(result) == 3:
-                solution, fit, history = result
-            else:
-                solution, fit = result
-            best_H = fit
-        except BudgetExceeded:
-            solution = board.queens
-            # Calcular fitness sin incrementar contador
-            board.fitness = fc._orig
-            best_H = board.fitness(solution)
+        best, best_H, evaluations = ga.island_genetic_algorithm(
+            dim,
+            islands=islands,
+            population_size=params["population_size"],
+            generations=params["generations"],
+            migration_interval=island_params["migration_interval"],
+            migrants=island_params["migrants"],
+            max_evals=max_evals,
+            seed=f"{dim}-{env_n}-GA-islands",
+        )
         elapsed = time.perf_counter() - t0
-        best = list(solution)
-    
-    return RunRecord("SA", env_n, dim, best, int(best_H), fc.counter, float(elapsed))
+        return RunRecord("GA-islands", env_n, dim, list(best), int(best_H), evaluations, float(elapsed))
 
-def run_ga(dim: int, env_n: int) -> RunRecord:
     random.seed(f"{dim}-{env_n}-GA")
-    board = ga.Board(dimension=dim)
-    params = GA_PARAMS(dim)
+    board = ga.Board(dimension=dim, max_evals=max_evals, **GA_CACHE_PARAMS(dim))
+
+    t0 = time.perf_counter()
+    solution = board.genetic_algorithm(
+        population_size=params["population_size"],
+        generations=params["generations"],
+    )
+    elapsed = time.perf_counter() - t0
+    best_H = count_conflicts(solution)  # no consume presupuesto
+
+    return RunRecord(
+        "GA", env_n, dim, list(solution), int(best_H), board.evaluations, float(elapsed),
+        cache_hits=board.cache_hits,
+    )
+
+def run_mc(dim: int, env_n: int) -> RunRecord:
+    random.seed(f"{dim}-{env_n}-MC")
     max_evals = MAX_EVALUATIONS[dim]
-    
-    # Inicializar variables por si se agota el presupuesto
-    solution = board.queens
-    best_H = None
-    history: List[int] = []
-    
-    with FitnessCounter(board, max_evals=max_evals) as fc:
-        t0 = time.perf_counter()
-        try:
-            result = board.genetic_algorithm(
-                population_size=params["population_size"],
-                generations=params["generations"],
-            )
-            if isinstance(result, tuple):
-                solution, history = result
-            else:
-                solution = result
-            best_H = board.fitness(solution)
-        except BudgetExceeded:
-            # Devolver la mejor solución encontrada hasta ahora
-            solution = board.queens
-            # Calcular fitness sin incrementar contador (restaurar método original temporalmente)
-            board.fitness = fc._orig
-            best_H = board.fitness(solution)
-        elapsed = time.perf_counter() - t0
-        best = list(solution)
-    
-    return RunRecord("GA", env_n, dim, best, int(best_H), fc.counter, float(elapsed))
+
+    # Min-conflicts evalúa posiciones en O(1) y cuenta sus propias evaluaciones
+    # (incluida la colocación voraz inicial) contra el mismo presupuesto.
+    t0 = time.perf_counter()
+    board = mc.Board(dimension=dim)
+    solution, best_H, _ = mc.min_conflicts(board, max_evals=max_evals)
+    elapsed = time.perf_counter() - t0
+
+    return RunRecord("MC", env_n, dim, list(solution), int(best_H), board.evaluations, float(elapsed))
 
 ALGORITHMS: Dict[str, Callable[[int, int], RunRecord]] = {
     "random": run_random,
     "HC": run_hc,
+    "HC-RR": run_hc_rr,
     "SA": run_sa,
+    "PT": run_pt,
+    "TS": run_ts,
     "GA": run_ga,
+    "GA-islands": lambda dim, env_n: run_ga(dim, env_n, islands=GA_ISLAND_PARAMS(dim)["islands"]),
+    "MC": run_mc,
 }
 ALGO_NAME_MAP = {name.lower(): name for name in ALGORITHMS}
 
+# Parámetros que definen cada algoritmo (entran en el hash de configuración)
+ALGO_PARAMS: Dict[str, Callable[[int], dict]] = {
+    "random": RANDOM_PARAMS,
+    "HC": lambda n: {},
+    "HC-RR": HC_RR_PARAMS,
+    "SA": SA_PARAMS,
+    "PT": PT_PARAMS,
+    "TS": TS_PARAMS,
+    "GA": lambda n: {**GA_PARAMS(n), **GA_CACHE_PARAMS(n)},
+    "GA-islands": lambda n: {**GA_PARAMS(n), **GA_ISLAND_PARAMS(n)},
+    "MC": lambda n: {},
+}
+
+
+def run_job(job: Tuple[int, int, str]) -> RunRecord:
+    """Ejecuta una corrida (size, env_n, algoritmo); cada wrapper fija su semilla."""
+    size, env_n, name = job
+    return ALGORITHMS[name](size, env_n)
+
+
+def print_record(rec: RunRecord) -> None:
+    print(
+        f"[size={rec.size:>2}] [env={rec.env_n:>2}] [algo={rec.algorithm_name:>6}] "
+        f"H={rec.H:>2} | states={rec.states:>7} | time={rec.time:.4f}s",
+        flush=True,
+    )
+
 
 def algo_choice(value: str) -> str:
     """Normaliza el nombre del algoritmo desde CLI."""
@@ -378,31 +423,59 @@ def main() -> None:
     if seed_offset < 0:
         parser.error("--seed-offset debe ser mayor o igual a 0.")
 
-    if args.reset:
-        reset_results(sizes, algorithms)
-
-    if not args.skip_demo:
-        run_demo()
-
-    for size in sizes:
-        print(f"\n{'=' * 60}")
-        print(f"Tamaño N={size} | Presupuesto: {MAX_EVALUATIONS[size]:,} evaluaciones")
-        print(f"{'=' * 60}")
-
-        for run_idx in range(runs):
-            env_n = seed_offset + run_idx
-            for name in algorithms:
-                fn = ALGORITHMS[name]
+    if args.workers <= 0:
+        parser.error("--workers debe ser un entero positivo.")
+
+    store = open_store()
+    try:
+        summary = LiveSummary(store)
+        if args.reset:
+            reset_results(store, summary, sizes, algorithms)
+
+        if not args.skip_demo:
+            run_demo()
+
+        jobs = [
+            (size, seed_offset + run_idx, name)
+            for size in sizes
+            for run_idx in range(runs)
+            for name in algorithms
+        ]
+        if args.resume:
+            pending = [job for job in jobs if not is_run_done(store, job[2], job[0], job[1])]
+            print(f"--resume: se omiten {len(jobs) - len(pending)} de {len(jobs)} corridas ya registradas.")
+            jobs = pending
+
+        if args.workers > 1:
+            # Las semillas dependen sólo de (size, env_n, algoritmo): mismo resultado que en
+            # serie, salvo HC-RR y GA-islands (presupuesto compartido entre sus procesos)
+            print(f"Ejecutando {len(jobs)} corridas con {args.workers} procesos ...")
+            with ProcessPoolExecutor(max_workers=args.workers) as pool:
+                futures = [pool.submit(run_job, job) for job in jobs]
+                for future in as_completed(futures):
+                    rec = future.result()
+                    save_run(summary, rec)
+                    print_record(rec)
+        else:
+            current_size = None
+            for size, env_n, name in jobs:
+                if size != current_size:
+                    current_size = size
+                    print(f"\n{'=' * 60}")
+                    print(f"Tamaño N={size} | Presupuesto: {MAX_EVALUATIONS[size]:,} evaluaciones")
+                    print(f"{'=' * 60}")
                 print(f"[size={size:>2}] [env={env_n:>2}] [algo={name:>6}] ...", end=" ", flush=True)
-                rec = fn(size, env_n)
-                save_run_json(rec)
+                rec = run_job((size, env_n, name))
+                save_run(summary, rec)
                 print(f"H={rec.H:>2} | states={rec.states:>7} | time={rec.time:.4f}s", flush=True)
 
-    rebuild_csv_from_json()
+        rebuild_csv(store)
+        summary.write_csv(SUMMARY_CSV)
+    finally:
+        store.close()
 
     print(f"\nResultados consolidados en: {CSV_PATH}")
-    if os.path.isfile(SUMMARY_CSV):
-        print(f"Resumen existente en: {SUMMARY_CSV} (recordá regenerarlo si necesitás datos frescos).")
+    print(f"Resumen actualizado en: {SUMMARY_CSV}")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import os
 import random
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -11,12 +11,14 @@ import n_reinas_GA as ga
 import n_reinas_HC as hc
 import n_reinas_SA as sa
 import n_reinas_random as rnd
+from history import History
+from results_store import ResultsStore
 
 # Rutas
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 RESULTS_ROOT = os.path.join(BASE_DIR, "results")
 SUMMARY_CSV = os.path.join(RESULTS_ROOT, "results_summary.csv")
-ALL_RUNS_CSV = os.path.join(RESULTS_ROOT, "all_runs.csv")
+STORE_PATH = os.path.join(RESULTS_ROOT, "runs.sqlite")
 IMAGES_DIR = os.path.abspath(os.path.join(BASE_DIR, "..", "images"))
 os.makedirs(IMAGES_DIR, exist_ok=True)
 
@@ -40,22 +42,14 @@ ALGO_LABELS = {
 }
 
 
-def _downsample_history(history: Sequence[int], max_points: int = 1500) -> Tuple[List[int], List[int]]:
-    if len(history) <= max_points:
-        x = list(range(len(history)))
-        y = list(history)
-        return x, y
-    step = max(1, len(history) // max_points)
-    indices = list(range(0, len(history), step))
-    if indices[-1] != len(history) - 1:
-        indices.append(len(history) - 1)
-    return indices, [history[i] for i in indices]
+# Presupuesto de puntos por curva H(t); el submuestreo ocurre durante la corrida
+HISTORY_POINTS = 1500
 
 
 def generate_h_evolution_plots(board_size: int = DEFAULT_EVOLUTION_SIZE) -> None:
     """Genera gráficos H(t) para una corrida representativa de cada algoritmo."""
     print(f"Generando evolución de H() para N={board_size} ...")
-    histories: Dict[str, List[int]] = {}
+    histories: Dict[str, History] = {}
 
     random.seed(20_25)
     board_random = rnd.Board(dimension=board_size)
@@ -63,12 +57,13 @@ def generate_h_evolution_plots(board_size: int = DEFAULT_EVOLUTION_SIZE) -> None
         board_random,
         max_evals=MAX_EVALUATIONS[board_size],
         return_history=True,
+        history_points=HISTORY_POINTS,
     )
     histories["random"] = hist_random
 
     random.seed(20_26)
     board_hc = hc.Board(dimension=board_size)
-    _, hist_hc = hc.hill_climbing(board_hc, return_history=True)
+    _, hist_hc = hc.hill_climbing(board_hc, return_history=True, history_points=HISTORY_POINTS)
     histories["HC"] = hist_hc
 
     random.seed(20_27)
@@ -76,6 +71,7 @@ def generate_h_evolution_plots(board_size: int = DEFAULT_EVOLUTION_SIZE) -> None
     _, _, hist_sa = sa.simulated_annealing(
         board_sa,
         return_history=True,
+        history_points=HISTORY_POINTS,
         **SA_PARAMS(board_size),
         max_iters=MAX_EVALUATIONS[board_size],
     )
@@ -87,13 +83,14 @@ def generate_h_evolution_plots(board_size: int = DEFAULT_EVOLUTION_SIZE) -> None
         population_size=GA_PARAMS(board_size)["population_size"],
         generations=GA_PARAMS(board_size)["generations"],
         return_history=True,
+        history_points=HISTORY_POINTS,
     )
     histories["GA"] = hist_ga
 
     for name, history in histories.items():
         if not history:
             continue
-        xs, ys = _downsample_history(history)
+        xs, ys = history.points()
         plt.figure(figsize=(9, 5))
         plt.plot(xs, ys, linewidth=2.0, color="#2E86AB")
         plt.xlabel("Iteración", fontsize=12, fontweight="bold")
@@ -114,12 +111,14 @@ def main():
     algorithms = df_summary["algorithm_name"].unique()
     
     # Cargar datos completos para boxplots
-    if os.path.isfile(ALL_RUNS_CSV):
-        df_all = pd.read_csv(ALL_RUNS_CSV)
-        has_all_data = True
+    if os.path.isfile(STORE_PATH):
+        with ResultsStore(STORE_PATH) as store:
+            df_all = pd.DataFrame(store.rows())
+        has_all_data = not df_all.empty
     else:
-        print("Advertencia: No se encontró all_runs.csv. Se omitirán boxplots.")
         has_all_data = False
+    if not has_all_data:
+        print("Advertencia: No se encontró el almacén de corridas. Se omitirán boxplots.")
     
     # ========== GRÁFICOS EXISTENTES ==========
     
@@ -2,15 +2,35 @@
 Algoritmo genético para N-reinas con operadores crossover/mutación clásicos.
 """
 
+import multiprocessing as mp
+import queue
 import random
+from array import array
+from collections import OrderedDict
 from typing import List, Optional, Tuple, Union
 
+from conflicts import count_conflicts
+from history import History, new_history
+
 
 class Board:
-    """Tablero de N-reinas con individuos representados como permutaciones."""
+    """Tablero de N-reinas con individuos representados como permutaciones.
+
+    `evaluations` cuenta las llamadas a `fitness`; con `max_evals` el GA deja
+    de evaluar hijos al agotar el presupuesto y devuelve el mejor hallado.
 
-    def __init__(self, dimension: int):
+    Con `cache_size > 0`, `cached_fitness` memoriza H de las últimas
+    `cache_size` permutaciones (LRU). Un acierto se cuenta en `cache_hits` y
+    no en `evaluations`, de modo que no consume presupuesto.
+    """
+
+    def __init__(self, dimension: int, max_evals: Optional[int] = None, cache_size: int = 0):
         self.dimension = dimension
+        self.max_evals = max_evals
+        self.evaluations = 0
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self._cache: "OrderedDict[bytes, int]" = OrderedDict()
         self.queens = self.random_start()
         self.best_ever: Optional[List[int]] = None
         self.best_ever_fitness = float("inf")
@@ -23,10 +43,35 @@ class Board:
 
     def fitness(self, queens: List[int]) -> int:
         """Calcula H(e) como número de conflictos diagonales."""
-        return self.get_threat(queens)
+        self.evaluations += 1
+        return count_conflicts(queens)
+
+    def cached_fitness(self, queens: List[int]) -> int:
+        """`fitness` con memo LRU; la clave son los bytes de la permutación."""
+        if not self.cache_size:
+            return self.fitness(queens)
+        key = bytes(queens) if self.dimension <= 256 else array("H", queens).tobytes()
+        cache = self._cache
+        fit = cache.get(key)
+        if fit is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+            return fit
+        fit = cache[key] = self.fitness(queens)
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return fit
+
+    def budget_exhausted(self) -> bool:
+        """Indica si no quedan evaluaciones disponibles en el presupuesto."""
+        return self.max_evals is not None and self.evaluations >= self.max_evals
 
     def get_threat(self, queens: List[int]) -> int:
-        """Sólo hay que contemplar diagonales: no existen conflictos de columna."""
+        """Sólo hay que contemplar diagonales: no existen conflictos de columna.
+
+        Referencia O(N²); `fitness` usa `conflicts.count_conflicts`, que sobre
+        permutaciones devuelve el mismo valor.
+        """
         threats = 0
         for col_a in range(self.dimension):
             for col_b in range(col_a + 1, self.dimension):
@@ -102,12 +147,36 @@ class Board:
 
         return child1, child2
 
+    def breed(self, population: List[List[int]], population_size: int) -> List[List[int]]:
+        """Genera la próxima generación a partir de una población ordenada.
+
+        Copia los 2 mejores (elitismo) y completa con crossover OX sobre el
+        top-20 (80 %) o mutación por swap sobre el top-50 (20 %).
+        """
+        next_generation = [population[0][:], population[1][:]]
+
+        while len(next_generation) < population_size:
+            if random.random() < 0.2:
+                parent = random.choice(population[: min(50, len(population))])
+                mutant = self.mutate(parent)
+                next_generation.append(mutant)
+            else:
+                sample_pool = population[: min(20, len(population))]
+                parent1, parent2 = random.sample(sample_pool, 2)
+                child1, child2 = self.crossover_order(parent1, parent2)
+                next_generation.append(child1)
+                if len(next_generation) < population_size:
+                    next_generation.append(child2)
+
+        return next_generation[:population_size]
+
     def genetic_algorithm(
         self,
         population_size: int = 100,
         generations: int = 1000,
         return_history: bool = False,
-    ) -> Union[List[int], Tuple[List[int], List[int]]]:
+        history_points: Optional[int] = None,
+    ) -> Union[List[int], Tuple[List[int], History]]:
         """Ejecuta el GA con selección por truncamiento/elitismo.
 
         Selección:
@@ -119,16 +188,38 @@ class Board:
         Reemplazo:
             Elitismo explícito: los 2 mejores se copian sin modificaciones.
             El resto se genera por crossover (80 %) o mutación (20 %).
+
+        Presupuesto:
+            Si el tablero tiene `max_evals`, se deja de evaluar al agotarlo y
+            se devuelve el mejor individuo evaluado hasta ese momento.
+
+        Historia:
+            Con `return_history` se devuelve el mejor H por generación. Si se
+            indica `history_points`, la serie se submuestrea en línea a ese
+            presupuesto de puntos (ver `history.BucketHistory`).
+
+        Memo:
+            Los individuos se evalúan con `cached_fitness`: con `cache_size`
+            los duplicados que genera el cruce sobre el top-20 no se
+            re-evalúan. Sin presupuesto la trayectoria es la misma con o sin
+            memo, porque evaluar no consume números aleatorios.
         """
+        history = new_history(history_points)
         population = [self.random_start() for _ in range(population_size)]
 
-        pop_with_fitness = [(ind, self.fitness(ind)) for ind in population]
+        pop_with_fitness = []
+        for ind in population:
+            if self.budget_exhausted():
+                break
+            pop_with_fitness.append((ind, self.cached_fitness(ind)))
+        if not pop_with_fitness:
+            return (population[0][:], history) if return_history else population[0][:]
 
         pop_with_fitness.sort(key=lambda x: x[1])
         self.best_ever = pop_with_fitness[0][0][:]
         self.best_ever_fitness = pop_with_fitness[0][1]
 
-        history: List[int] = [self.best_ever_fitness]
+        history.append(self.best_ever_fitness)
 
         for _ in range(generations):
             if pop_with_fitness[0][1] < self.best_ever_fitness:
@@ -139,24 +230,11 @@ class Board:
                 history.append(0)
                 break
 
-            population = [ind for ind, _ in pop_with_fitness]
-
-            next_generation = [population[0][:], population[1][:]]
-
-            while len(next_generation) < population_size:
-                if random.random() < 0.2:
-                    parent = random.choice(population[: min(50, len(population))])
-                    mutant = self.mutate(parent)
-                    next_generation.append(mutant)
-                else:
-                    sample_pool = population[: min(20, len(population))]
-                    parent1, parent2 = random.sample(sample_pool, 2)
-                    child1, child2 = self.crossover_order(parent1, parent2)
-                    next_generation.append(child1)
-                    if len(next_generation) < population_size:
-                        next_generation.append(child2)
+            if self.budget_exhausted() or len(pop_with_fitness) < 2:
+                break
 
-            next_generation = next_generation[:population_size]
+            population = [ind for ind, _ in pop_with_fitness]
+            next_generation = self.breed(population, population_size)
 
             pop_with_fitness = [
                 (next_generation[0], pop_with_fitness[0][1]),
@@ -164,7 +242,9 @@ class Board:
             ]
 
             for i in range(2, len(next_generation)):
-                fit = self.fitness(next_generation[i])
+                if self.budget_exhausted():
+                    break
+                fit = self.cached_fitness(next_generation[i])
                 pop_with_fitness.append((next_generation[i], fit))
 
             pop_with_fitness.sort(key=lambda x: x[1])
@@ -173,6 +253,10 @@ class Board:
             if pop_with_fitness[0][1] == 0:
                 break
 
+        if pop_with_fitness[0][1] < self.best_ever_fitness:
+            self.best_ever = pop_with_fitness[0][0][:]
+            self.best_ever_fitness = pop_with_fitness[0][1]
+
         best_solution = self.best_ever[:] if self.best_ever else population[0][:]
         if return_history:
             return best_solution, history
@@ -187,10 +271,170 @@ class Board:
         print()
 
 
+# Segundos entre consultas a la cola de resultados de las islas
+RESULT_POLL_SECONDS = 1.0
+
+
+def _reserve_evaluations(counter, wanted: int, max_evals: Optional[int]) -> int:
+    """Reserva atómicamente hasta `wanted` evaluaciones del presupuesto global."""
+    with counter.get_lock():
+        granted = wanted if max_evals is None else max(0, min(wanted, max_evals - counter.value))
+        counter.value += granted
+    return granted
+
+
+def _island_worker(
+    index: int,
+    dimension: int,
+    population_size: int,
+    generations: int,
+    migration_interval: int,
+    migrants: int,
+    seed: str,
+    inbox,
+    outbox,
+    results,
+    stop,
+    counter,
+    max_evals: Optional[int],
+) -> None:
+    """Evoluciona una isla y migra sus élites al vecino siguiente del anillo."""
+    random.seed(f"{seed}-island-{index}")
+    board = Board(dimension=dimension)
+    pop_with_fitness: List[Tuple[List[int], int]] = []
+
+    try:
+        population = [board.random_start() for _ in range(population_size)]
+        granted = _reserve_evaluations(counter, population_size, max_evals)
+        pop_with_fitness = [(ind, board.fitness(ind)) for ind in population[:granted]]
+        pop_with_fitness.sort(key=lambda x: x[1])
+
+        for generation in range(1, generations + 1):
+            if stop.is_set() or len(pop_with_fitness) < 2 or pop_with_fitness[0][1] == 0:
+                break
+
+            next_generation = board.breed([ind for ind, _ in pop_with_fitness], population_size)
+            children = next_generation[2:]
+            granted = _reserve_evaluations(counter, len(children), max_evals)
+            scored = pop_with_fitness[:2] + [(child, board.fitness(child)) for child in children[:granted]]
+
+            if generation % migration_interval == 0:
+                outbox.send(pop_with_fitness[:migrants])
+                while inbox.poll():
+                    scored.extend(inbox.recv())
+
+            scored.sort(key=lambda x: x[1])
+            pop_with_fitness = scored[:population_size]
+            if granted < len(children):
+                break
+    finally:
+        # Cualquier isla que termina (éxito o presupuesto global agotado)
+        # detiene al resto.
+        stop.set()
+        best, best_fit = pop_with_fitness[0] if pop_with_fitness else (None, None)
+        results.put((index, best, best_fit))
+
+
+def island_genetic_algorithm(
+    dimension: int,
+    islands: int = 4,
+    population_size: int = 100,
+    generations: int = 1000,
+    migration_interval: int = 20,
+    migrants: int = 2,
+    max_evals: Optional[int] = None,
+    seed: Optional[str] = None,
+) -> Tuple[List[int], int, int]:
+    """Ejecuta el GA en modelo de islas, una isla por proceso.
+
+    Las islas forman un anillo: cada `migration_interval` generaciones una
+    isla envía sus `migrants` mejores individuos (con su fitness) al vecino
+    siguiente por un `Pipe`, y recibe de forma no bloqueante los que le
+    hayan llegado, que reemplazan a los peores. Todas las islas se detienen
+    en cuanto alguna encuentra H=0.
+
+    El presupuesto `max_evals` es global: cada isla reserva sus evaluaciones
+    de un contador compartido antes de evaluar, de modo que la suma entre
+    islas nunca lo supera. Si alguna isla muere sin reportar se devuelve el
+    mejor resultado de las demás.
+
+    Returns
+    -------
+    tuple
+        (mejor_solución, mejor_fitness, evaluaciones_totales).
+    """
+    if seed is None:
+        seed = str(random.getrandbits(64))
+    counter = mp.Value("q", 0)
+    stop = mp.Event()
+    results = mp.Queue()
+    pipes = [mp.Pipe(duplex=False) for _ in range(islands)]
+
+    workers = []
+    for index in range(islands):
+        inbox = pipes[index][0]
+        outbox = pipes[(index + 1) % islands][1]
+        worker = mp.Process(
+            target=_island_worker,
+            args=(
+                index,
+                dimension,
+                population_size,
+                generations,
+                migration_interval,
+                migrants,
+                seed,
+                inbox,
+                outbox,
+                results,
+                stop,
+                counter,
+                max_evals,
+            ),
+        )
+        worker.start()
+        workers.append(worker)
+
+    outcomes = []
+    try:
+        while len(outcomes) < len(workers):
+            try:
+                outcomes.append(results.get(timeout=RESULT_POLL_SECONDS))
+            except queue.Empty:
+                # Una isla muerta (señal, falta de memoria) nunca reporta: se
+                # deja de esperar cuando ya no queda ninguna viva.
+                if any(worker.is_alive() for worker in workers):
+                    continue
+                try:
+                    outcomes.append(results.get(timeout=RESULT_POLL_SECONDS))
+                except queue.Empty:
+                    break
+    finally:
+        stop.set()
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers:
+            worker.join()
+
+    if not outcomes:
+        codes = [worker.exitcode for worker in workers]
+        raise RuntimeError(f"Las islas del GA terminaron sin reportar resultado (exitcodes={codes}).")
+    scored = [(fit, index, best) for index, best, fit in outcomes if best is not None]
+    if not scored:
+        # Presupuesto insuficiente para evaluar un solo individuo: como en
+        # `genetic_algorithm`, se devuelve un individuo sin evaluar y su H se
+        # calcula fuera del presupuesto.
+        best = Board(dimension=dimension).queens
+        return best, count_conflicts(best), counter.value
+    best_fit, _, best = min(scored)
+    return best, best_fit, counter.value
+
+
 def main():
     """Pequeña demo del GA."""
     dim = 10
-    board = Board(dimension=dim)
+    board = Board(dimension=dim, cache_size=4096)
 
     print("Initial board (permutation):")
     board.print_board()
@@ -208,6 +452,7 @@ def main():
     board.print_board()
     print("Final fitness:", board.fitness(board.queens))
     print("History length:", len(history))
+    print("Evaluations:", board.evaluations, "| cache hits:", board.cache_hits)
 
 
 if __name__ == "__main__":
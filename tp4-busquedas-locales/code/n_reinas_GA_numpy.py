@@ -0,0 +1,194 @@
+"""
+Motor vectorizado (NumPy) del algoritmo genético para N-reinas.
+
+La población se guarda como un arreglo (P, N) de permutaciones y cada etapa
+(fitness, crossover OX y mutación por swap) opera sobre el lote completo. El
+esquema replica a `n_reinas_GA.Board.genetic_algorithm`: selección por
+truncamiento (top-20 para cruzamiento, top-50 para mutación), elitismo de los
+2 mejores y 80 % crossover / 20 % mutación para el resto.
+"""
+
+import argparse
+import random
+import time
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+
+import n_reinas_GA as ga
+from conflicts import count_conflicts_batch
+
+
+def random_population(rng: np.random.Generator, population_size: int, dimension: int) -> np.ndarray:
+    """Genera `population_size` permutaciones aleatorias como arreglo (P, N)."""
+    return np.argsort(rng.random((population_size, dimension)), axis=1)
+
+
+def batch_fitness(population: np.ndarray) -> np.ndarray:
+    """H(e) de cada fila (ver `conflicts.count_conflicts_batch`).
+
+    Los individuos son permutaciones, así que sólo se cuentan las diagonales.
+    """
+    return count_conflicts_batch(population, rows=False)
+
+
+def swap_mutation(rng: np.random.Generator, parents: np.ndarray) -> np.ndarray:
+    """Intercambia dos posiciones distintas en cada fila (mutación por swap)."""
+    mutants = parents.copy()
+    m, n = mutants.shape
+    rows = np.arange(m)
+    i = rng.integers(0, n, size=m)
+    j = (i + rng.integers(1, n, size=m)) % n
+    mutants[rows, i], mutants[rows, j] = parents[rows, j], parents[rows, i]
+    return mutants
+
+
+def order_crossover(rng: np.random.Generator, parent1: np.ndarray, parent2: np.ndarray) -> np.ndarray:
+    """Order Crossover (OX) por lotes; devuelve un hijo por par de padres.
+
+    Cada hijo conserva el segmento [a, b) de `parent1` y completa las
+    posiciones restantes, empezando en `b` y en forma circular, con los
+    valores de `parent2` que no están en el segmento, en el orden en que
+    aparecen en `parent2` a partir de `b`.
+    """
+    m, n = parent1.shape
+    rows = np.arange(m)[:, None]
+    # Dos puntos de corte distintos a < b, como `random.sample(range(n), 2)`.
+    first = rng.integers(0, n, size=m)
+    second = (first + rng.integers(1, n, size=m)) % n
+    a, b = np.minimum(first, second), np.maximum(first, second)
+
+    positions = np.arange(n)
+    in_segment = (positions >= a[:, None]) & (positions < b[:, None])
+
+    # Valores presentes en el segmento de cada hijo.
+    value_in_segment = np.zeros((m, n), dtype=bool)
+    value_in_segment[rows, parent1] = in_segment
+
+    rotation = (b[:, None] + positions) % n
+    donor = parent2[rows, rotation]
+    keep = ~value_in_segment[rows, donor]
+    # Orden estable: primero los valores a copiar, en el orden de `donor`.
+    fillers = donor[rows, np.argsort(~keep, axis=1, kind="stable")]
+    free_slots = ~in_segment[rows, rotation]
+    targets = rotation[rows, np.argsort(~free_slots, axis=1, kind="stable")]
+
+    child = parent1.copy()
+    n_free = n - (b - a)
+    fill_rows, fill_idx = np.nonzero(positions < n_free[:, None])
+    child[fill_rows, targets[fill_rows, fill_idx]] = fillers[fill_rows, fill_idx]
+    return child
+
+
+def genetic_algorithm(
+    dimension: int,
+    population_size: int = 100,
+    generations: int = 1000,
+    rng: Optional[np.random.Generator] = None,
+    return_history: bool = False,
+) -> Union[List[int], Tuple[List[int], List[int]]]:
+    """Ejecuta el GA vectorizado con el mismo esquema que la versión por listas.
+
+    Parameters
+    ----------
+    dimension
+        Cantidad de reinas (N).
+    population_size
+        Tamaño de la población (P).
+    generations
+        Cantidad máxima de generaciones.
+    rng
+        Generador NumPy; si es None se crea uno nuevo.
+    return_history
+        Si es True, devuelve también el mejor H de cada generación.
+    """
+    rng = rng or np.random.default_rng()
+    elite = min(2, population_size)
+    crossover_pool = min(20, population_size)
+    mutation_pool = min(50, population_size)
+    n_children = population_size - elite
+
+    population = random_population(rng, population_size, dimension)
+    fitness = batch_fitness(population)
+    order = np.argsort(fitness, kind="stable")
+    population, fitness = population[order], fitness[order]
+
+    best_ever = population[0].copy()
+    best_ever_fitness = int(fitness[0])
+    history: List[int] = [best_ever_fitness]
+
+    for _ in range(generations):
+        if fitness[0] < best_ever_fitness:
+            best_ever = population[0].copy()
+            best_ever_fitness = int(fitness[0])
+
+        if best_ever_fitness == 0:
+            history.append(0)
+            break
+
+        is_mutation = rng.random(n_children) < 0.2
+        n_mut = int(is_mutation.sum())
+        n_cx = n_children - n_mut
+
+        mutants = swap_mutation(rng, population[rng.integers(0, mutation_pool, size=n_mut)])
+        first = rng.integers(0, crossover_pool, size=n_cx)
+        second = (first + rng.integers(1, crossover_pool, size=n_cx)) % crossover_pool
+        children = order_crossover(rng, population[first], population[second])
+
+        offspring = np.empty((n_children, dimension), dtype=population.dtype)
+        offspring[is_mutation] = mutants
+        offspring[~is_mutation] = children
+
+        population = np.concatenate([population[:elite], offspring])
+        fitness = np.concatenate([fitness[:elite], batch_fitness(offspring)])
+        order = np.argsort(fitness, kind="stable")
+        population, fitness = population[order], fitness[order]
+        history.append(int(fitness[0]))
+
+        if fitness[0] == 0:
+            best_ever = population[0].copy()
+            best_ever_fitness = 0
+            break
+
+    best_solution = best_ever.tolist()
+    if return_history:
+        return best_solution, history
+    return best_solution
+
+
+def benchmark(population_size: int, dimension: int, generations: int, python_generations: int) -> None:
+    """Compara generaciones/segundo entre el GA por listas y el vectorizado."""
+    random.seed(0)
+    board = ga.Board(dimension=dimension)
+    t0 = time.perf_counter()
+    board.genetic_algorithm(population_size=population_size, generations=python_generations)
+    python_rate = python_generations / (time.perf_counter() - t0)
+
+    rng = np.random.default_rng(0)
+    t0 = time.perf_counter()
+    genetic_algorithm(dimension, population_size=population_size, generations=generations, rng=rng)
+    numpy_rate = generations / (time.perf_counter() - t0)
+
+    print(f"P={population_size} N={dimension}")
+    print(f"  listas : {python_rate:10.3f} generaciones/s")
+    print(f"  NumPy  : {numpy_rate:10.3f} generaciones/s")
+    print(f"  speedup: {numpy_rate / python_rate:10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del GA vectorizado para N-reinas.")
+    parser.add_argument("--population", type=int, default=1000, help="Tamaño de población (default: 1000).")
+    parser.add_argument("--n", type=int, default=200, help="Cantidad de reinas (default: 200).")
+    parser.add_argument("--generations", type=int, default=50, help="Generaciones del GA NumPy (default: 50).")
+    parser.add_argument(
+        "--python-generations",
+        type=int,
+        default=2,
+        help="Generaciones del GA por listas (default: 2, es mucho más lento).",
+    )
+    args = parser.parse_args()
+    benchmark(args.population, args.n, args.generations, args.python_generations)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
+import multiprocessing as mp
+import os
+import queue
 import random
 from typing import List, Optional, Tuple
 
+from conflicts import count_conflicts
+from history import History, new_history
+
 
 class Board:
     """Tablero de N-reinas con representación columna→fila.
@@ -8,10 +14,16 @@ class Board:
     Cada índice de `queens` refiere a una columna y su valor indica la fila
     donde se ubica la reina. De este modo no hay conflictos de columna y el
     cálculo de amenazas se limita a filas y diagonales.
+
+    Cada llamada a `fitness` suma una evaluación en `evaluations`; si se
+    indica `max_evals`, los algoritmos consultan `budget_exhausted()` y
+    terminan devolviendo el mejor estado alcanzado.
     """
 
-    def __init__(self, dimension: int):
+    def __init__(self, dimension: int, max_evals: Optional[int] = None):
         self.dimension = dimension
+        self.max_evals = max_evals
+        self.evaluations = 0
         self.queens = self.random_start()
 
     def random_start(self) -> List[int]:
@@ -20,10 +32,15 @@ class Board:
 
     def fitness(self, queens: List[int]) -> int:
         """Evalúa la cantidad de pares de reinas amenazadas."""
-        return self.get_threat(queens)
+        self.evaluations += 1
+        return count_conflicts(queens)
+
+    def budget_exhausted(self) -> bool:
+        """Indica si ya se consumió el presupuesto `max_evals` (None = sin límite)."""
+        return self.max_evals is not None and self.evaluations >= self.max_evals
 
     def get_threat(self, queens: List[int]) -> int:
-        """Cuenta amenazas por fila o diagonal."""
+        """Cuenta amenazas por fila o diagonal (referencia O(N²); `fitness` usa `conflicts.count_conflicts`)."""
         threats = 0
         for col_a in range(self.dimension):
             for col_b in range(col_a + 1, self.dimension):
@@ -33,9 +50,12 @@ class Board:
                     threats += 1
         return threats
 
-    def get_best_neighbour(self, actual_board: List[int]) -> Tuple[List[int], int]:
-        """Busca el vecino con menor H moviendo una reina de columna."""
-        current_fitness = self.fitness(actual_board)
+    def get_best_neighbour(self, actual_board: List[int], current_fitness: int) -> Tuple[List[int], int]:
+        """Busca el vecino con menor H moviendo una reina de columna.
+
+        `current_fitness` es el H ya evaluado de `actual_board`, de modo que
+        sólo los vecinos consumen presupuesto.
+        """
         best_board = actual_board[:]
         best_fitness = current_fitness
 
@@ -44,6 +64,8 @@ class Board:
             for candidate_row in range(self.dimension):
                 if candidate_row == original_row:
                     continue
+                if self.budget_exhausted():
+                    return best_board, best_fitness
                 candidate = actual_board[:]
                 candidate[column] = candidate_row
                 cand_fit = self.fitness(candidate)
@@ -65,7 +87,8 @@ def hill_climbing(
     board: Board,
     max_steps: Optional[int] = None,
     return_history: bool = False,
-) -> Tuple[List[int], List[int]]:
+    history_points: Optional[int] = None,
+) -> Tuple[List[int], History]:
     """Ejecuta Hill Climbing canónico sobre un tablero.
 
     Parameters
@@ -74,28 +97,38 @@ def hill_climbing(
         Instancia ya inicializada de `Board`.
     max_steps:
         Límite duro de iteraciones de escalada (None = sin límite).
+        El presupuesto de evaluaciones del tablero (`max_evals`) también
+        detiene la escalada, conservando el mejor vecino ya evaluado.
     return_history:
         Si es True, devuelve además la serie H(t) por iteración.
+    history_points:
+        Si se indica, la serie se submuestrea en línea a ese presupuesto de
+        puntos (ver `history.BucketHistory`); si no, se guarda completa.
 
     Returns
     -------
     tuple
         (mejor_solución, historia_de_H) cuando `return_history=True`,
-        o (mejor_solución, []) en caso contrario.
+        o (mejor_solución, historia vacía) en caso contrario.
     """
-    history: List[int] = []
+    history = new_history(history_points)
     steps = 0
+    if board.budget_exhausted():
+        return board.queens[:], history
 
+    # El estado inicial se evalúa una sola vez; tras cada movimiento su H ya
+    # es el `next_fit` del vecino elegido.
+    current_fit = board.fitness(board.queens)
     while True:
-        current_fit = board.fitness(board.queens)
         if return_history:
             history.append(current_fit)
 
-        next_board, next_fit = board.get_best_neighbour(board.queens)
+        next_board, next_fit = board.get_best_neighbour(board.queens, current_fit)
         if next_fit >= current_fit:
             break
 
         board.queens = next_board
+        current_fit = next_fit
         steps += 1
 
         if return_history:
@@ -105,10 +138,134 @@ def hill_climbing(
             break
         if max_steps is not None and steps >= max_steps:
             break
+        if board.budget_exhausted():
+            break
 
     return board.queens[:], history
 
 
+# Segundos entre consultas a la cola de resultados de HC-RR
+RESULT_POLL_SECONDS = 1.0
+
+
+class RestartCancelled(Exception):
+    """Se agotó el presupuesto compartido o otro proceso ya encontró H=0."""
+
+
+class SharedBudgetBoard(Board):
+    """`Board` cuyas evaluaciones se descuentan de un contador entre procesos.
+
+    El contador y la bandera de solución viven en memoria compartida; ambos
+    se consultan bajo el mismo lock, de modo que ningún proceso evalúa más
+    allá del presupuesto ni después de que otro resolvió el tablero.
+    """
+
+    def __init__(self, dimension: int, counter, solved, max_evals: Optional[int]):
+        super().__init__(dimension)
+        self.counter = counter
+        self.solved = solved
+        self.max_evals = max_evals
+
+    def fitness(self, queens: List[int]) -> int:
+        with self.counter.get_lock():
+            if self.solved.value or (
+                self.max_evals is not None and self.counter.value >= self.max_evals
+            ):
+                raise RestartCancelled()
+            self.counter.value += 1
+        return count_conflicts(queens)
+
+
+def _restart_worker(worker_id: int, dimension: int, seed: str, counter, solved, max_evals, results) -> None:
+    """Encadena escaladas desde estados aleatorios hasta H=0 o cancelación."""
+    random.seed(f"{seed}-worker-{worker_id}")
+    board = SharedBudgetBoard(dimension, counter, solved, max_evals)
+    best: List[int] = board.queens[:]
+    best_H = float("inf")
+    climbs = 0
+
+    try:
+        while best_H > 0:
+            board.queens = board.random_start()
+            climbs += 1
+            hill_climbing(board)
+            h = count_conflicts(board.queens)
+            if h < best_H:
+                best, best_H = board.queens[:], h
+        with counter.get_lock():
+            solved.value = 1
+    except RestartCancelled:
+        # La escalada interrumpida también puede mejorar al mejor conocido.
+        h = count_conflicts(board.queens)
+        if h < best_H:
+            best, best_H = board.queens[:], h
+    results.put((best, int(best_H), climbs))
+
+
+def random_restart_hill_climbing(
+    dimension: int,
+    workers: Optional[int] = None,
+    max_evals: Optional[int] = None,
+    seed: Optional[str] = None,
+) -> Tuple[List[int], int, int, int]:
+    """Hill Climbing con reinicios aleatorios repartidos en varios procesos.
+
+    Cada proceso encadena escaladas desde estados aleatorios contra un
+    presupuesto de evaluaciones compartido. En cuanto uno llega a H=0 los
+    demás se cancelan en su próxima evaluación. Si algún proceso muere sin
+    reportar se devuelve el mejor de los que sí reportaron.
+
+    Returns
+    -------
+    tuple
+        (mejor_solución, H, evaluaciones_totales, reinicios), donde los
+        reinicios son las escaladas iniciadas además de la primera.
+    """
+    workers = workers or os.cpu_count() or 1
+    if seed is None:
+        seed = str(random.getrandbits(64))
+    counter = mp.Value("q", 0)
+    solved = mp.RawValue("b", 0)
+    results = mp.Queue()
+
+    processes = [
+        mp.Process(
+            target=_restart_worker,
+            args=(worker_id, dimension, seed, counter, solved, max_evals, results),
+        )
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = []
+    try:
+        while len(outcomes) < len(processes):
+            try:
+                outcomes.append(results.get(timeout=RESULT_POLL_SECONDS))
+            except queue.Empty:
+                # Un proceso muerto (señal, falta de memoria) nunca reporta: se
+                # deja de esperar cuando ya no queda ninguno vivo.
+                if any(process.is_alive() for process in processes):
+                    continue
+                try:
+                    outcomes.append(results.get(timeout=RESULT_POLL_SECONDS))
+                except queue.Empty:
+                    break
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+
+    if not outcomes:
+        codes = [process.exitcode for process in processes]
+        raise RuntimeError(f"Procesos de HC-RR terminaron sin reportar resultado (exitcodes={codes}).")
+    best, best_H, _ = min(outcomes, key=lambda outcome: outcome[1])
+    climbs = sum(outcome[2] for outcome in outcomes)
+    return best, best_H, counter.value, max(climbs - 1, 0)
+
+
 def main():
     """Pequeña demo con N=10."""
     dim = 10
@@ -122,7 +279,7 @@ def main():
     print("Final board:")
     board.print_board(solution)
     print("Fitness achieved:", board.fitness(solution))
-    print("History:", history)
+    print("History:", list(history))
 
 
 if __name__ == "__main__":
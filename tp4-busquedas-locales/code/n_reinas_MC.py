@@ -0,0 +1,298 @@
+"""
+Min-conflicts para N-reinas, escalable a millones de reinas.
+
+A diferencia del resto de los algoritmos del TP, nunca se recalcula H(e) desde
+cero: el tablero mantiene contadores de reinas por fila y por diagonal, de modo
+que evaluar una posición candidata cuesta O(1). El estado inicial se construye
+con una colocación voraz O(N) y la búsqueda sólo visita columnas en conflicto.
+"""
+
+import argparse
+import random
+import time
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+from history import History, new_history
+
+
+# Tamaños sin solución: sin presupuesto la búsqueda no termina nunca
+UNSOLVABLE = (2, 3)
+
+
+class Board:
+    """Tablero columna→fila con contadores incrementales de conflictos.
+
+    Además de la cantidad de reinas por fila y diagonal se guarda el XOR de
+    las columnas que ocupan cada línea: cuando una línea pasa a tener dos
+    reinas, la otra se recupera en O(1) como `xor ^ columna`. Todas las
+    estructuras son `array('i')` para acotar la memoria con N grande.
+    """
+
+    def __init__(self, dimension: int, greedy_tries: int = 32):
+        n = dimension
+        self.dimension = n
+        self.evaluations = 0
+        self.h = 0
+        self._offset = n - 1
+        self.queens = array("i", [0]) * n
+        self.rows = array("i", [0]) * n
+        self.rows_xor = array("i", [0]) * n
+        self.diag1 = array("i", [0]) * (2 * n - 1)  # r - c + (n - 1)
+        self.diag1_xor = array("i", [0]) * (2 * n - 1)
+        self.diag2 = array("i", [0]) * (2 * n - 1)  # r + c
+        self.diag2_xor = array("i", [0]) * (2 * n - 1)
+        self.greedy_start(greedy_tries)
+
+    def greedy_start(self, tries: int) -> None:
+        """Colocación voraz O(N): una fila libre distinta por columna.
+
+        Para cada columna se prueban hasta `tries` filas aún no usadas y se
+        elige la primera sin conflictos diagonales (o la última probada). Cada
+        prueba cuenta como una evaluación.
+        """
+        n = self.dimension
+        free_rows = array("i", range(n))
+        queens, rows, rows_xor = self.queens, self.rows, self.rows_xor
+        diag1, diag1_xor = self.diag1, self.diag1_xor
+        diag2, diag2_xor = self.diag2, self.diag2_xor
+        offset = self._offset
+        rand = random.random
+        evaluations = 0
+        for col in range(n):
+            remaining = n - col
+            for _ in range(tries):
+                j = col + int(rand() * remaining)
+                row = free_rows[j]
+                evaluations += 1
+                d1 = row - col + offset
+                d2 = row + col
+                if diag1[d1] == 0 and diag2[d2] == 0:
+                    break
+            free_rows[j] = free_rows[col]
+            self.h += diag1[d1] + diag2[d2]
+            queens[col] = row
+            rows[row] = 1
+            rows_xor[row] = col
+            diag1[d1] += 1
+            diag1_xor[d1] ^= col
+            diag2[d2] += 1
+            diag2_xor[d2] ^= col
+        self.evaluations += evaluations
+
+    def _place(self, col: int, row: int) -> None:
+        offset = self._offset
+        d1 = row - col + offset
+        d2 = row + col
+        self.h += self.rows[row] + self.diag1[d1] + self.diag2[d2]
+        self.queens[col] = row
+        self.rows[row] += 1
+        self.rows_xor[row] ^= col
+        self.diag1[d1] += 1
+        self.diag1_xor[d1] ^= col
+        self.diag2[d2] += 1
+        self.diag2_xor[d2] ^= col
+
+    def _remove(self, col: int) -> None:
+        row = self.queens[col]
+        d1 = row - col + self._offset
+        d2 = row + col
+        self.rows[row] -= 1
+        self.rows_xor[row] ^= col
+        self.diag1[d1] -= 1
+        self.diag1_xor[d1] ^= col
+        self.diag2[d2] -= 1
+        self.diag2_xor[d2] ^= col
+        self.h -= self.rows[row] + self.diag1[d1] + self.diag2[d2]
+
+    def conflicts(self, col: int, row: int) -> int:
+        """Cantidad de reinas que atacarían a la de `col` si estuviera en `row`."""
+        self.evaluations += 1
+        total = self.rows[row] + self.diag1[row - col + self._offset] + self.diag2[row + col]
+        if row == self.queens[col]:
+            total -= 3
+        return total
+
+    def is_conflicted(self, col: int) -> bool:
+        """Indica si la reina de `col` está amenazada (sin contar evaluación)."""
+        row = self.queens[col]
+        return (
+            self.rows[row] > 1
+            or self.diag1[row - col + self._offset] > 1
+            or self.diag2[row + col] > 1
+        )
+
+    def print_board(self, queens: Optional[Sequence[int]] = None) -> None:
+        """Imprime el tablero usando la convención columna→fila."""
+        queens = queens if queens is not None else self.queens
+        for row in range(self.dimension):
+            line = ["Q" if queens[col] == row else "." for col in range(self.dimension)]
+            print(" ".join(line))
+        print()
+
+
+def min_conflicts(
+    board: Board,
+    max_evals: Optional[int] = None,
+    candidates: int = 32,
+    return_history: bool = False,
+    history_points: Optional[int] = None,
+) -> Tuple[Sequence[int], int, History]:
+    """Min-conflicts con conjunto de columnas en conflicto y movimientos O(1).
+
+    Parameters
+    ----------
+    board
+        Instancia de `Board` ya inicializada (colocación voraz).
+    max_evals
+        Límite de evaluaciones de posiciones candidatas (None = sin límite,
+        sólo admitido para N con solución: N = 2 y N = 3 no tienen).
+    candidates
+        Filas evaluadas por movimiento. Si N <= candidates se recorren todas
+        (min-conflicts clásico); si no, se muestrean al azar y se agregan las
+        filas que quedaron vacías, que son las que resuelven los conflictos
+        de fila.
+    return_history
+        Si es True, devuelve la serie H(t) por movimiento.
+    history_points
+        Si se indica, la serie se submuestrea en línea a ese presupuesto de
+        puntos (ver `history.BucketHistory`); si no, se guarda completa.
+
+    Returns
+    -------
+    tuple
+        (solución, H, historia). La solución es el `array` del tablero.
+
+    Notas
+    -----
+    La lista de columnas en conflicto se depura en forma perezosa: cada
+    columna que se vuelve amenazada se agrega (la compañera de una línea con
+    dos reinas se obtiene por XOR) y las que dejaron de estarlo se descartan
+    al ser elegidas. Así cada movimiento cuesta O(candidates) amortizado.
+    """
+    n = board.dimension
+    if max_evals is None and n in UNSOLVABLE:
+        raise ValueError(f"N={n} no tiene solución: min-conflicts sin max_evals no terminaría.")
+    queens = board.queens
+    rows, rows_xor = board.rows, board.rows_xor
+    diag1, diag1_xor = board.diag1, board.diag1_xor
+    diag2, diag2_xor = board.diag2, board.diag2_xor
+    offset = n - 1
+    rand = random.random
+    full_scan = n <= candidates
+
+    in_list = bytearray(n)
+    conflicted = array("i")
+    for col in range(n):
+        if board.is_conflicted(col):
+            conflicted.append(col)
+            in_list[col] = 1
+    empty_rows = array("i")
+    in_empty = bytearray(n)
+
+    def enqueue(col: int) -> None:
+        if not in_list[col]:
+            in_list[col] = 1
+            conflicted.append(col)
+
+    history = new_history(history_points)
+    if return_history:
+        history.append(board.h)
+
+    while board.h > 0 and conflicted:
+        if max_evals is not None and board.evaluations >= max_evals:
+            break
+
+        idx = int(rand() * len(conflicted))
+        col = conflicted[idx]
+        if not board.is_conflicted(col):
+            conflicted[idx] = conflicted[-1]
+            conflicted.pop()
+            in_list[col] = 0
+            continue
+
+        if full_scan:
+            pool: Sequence[int] = range(n)
+        else:
+            pool = [int(rand() * n) for _ in range(candidates)]
+            i = 0
+            while i < len(empty_rows) and i < candidates:
+                row = empty_rows[i]
+                if rows[row]:
+                    empty_rows[i] = empty_rows[-1]
+                    empty_rows.pop()
+                    in_empty[row] = 0
+                else:
+                    pool.append(row)
+                    i += 1
+
+        if max_evals is not None:
+            pool = pool[: max_evals - board.evaluations]
+        board.evaluations += len(pool)
+
+        current = queens[col]
+        best_rows: List[int] = []
+        best_cost = n + 3
+        for row in pool:
+            cost = rows[row] + diag1[row - col + offset] + diag2[row + col]
+            if row == current:
+                cost -= 3
+            if cost < best_cost:
+                best_cost = cost
+                best_rows = [row]
+            elif cost == best_cost:
+                best_rows.append(row)
+
+        new_row = best_rows[int(rand() * len(best_rows))]
+        old_row = queens[col]
+        if new_row != old_row:
+            board._remove(col)
+            if rows[old_row] == 0 and not in_empty[old_row]:
+                in_empty[old_row] = 1
+                empty_rows.append(old_row)
+            board._place(col, new_row)
+            d1 = new_row - col + offset
+            d2 = new_row + col
+            if rows[new_row] == 2:
+                enqueue(rows_xor[new_row] ^ col)
+            if diag1[d1] == 2:
+                enqueue(diag1_xor[d1] ^ col)
+            if diag2[d2] == 2:
+                enqueue(diag2_xor[d2] ^ col)
+
+        if return_history:
+            history.append(board.h)
+
+    return queens, board.h, history
+
+
+def main():
+    """Demo escalable: `python n_reinas_MC.py --n 1000000`."""
+    import resource  # Sólo Unix: se importa acá para no romper la importación del módulo en Windows
+
+    parser = argparse.ArgumentParser(description="Min-conflicts para N-reinas.")
+    parser.add_argument("--n", type=int, default=1_000_000, help="Cantidad de reinas (default: 10^6).")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla (default: 0).")
+    args = parser.parse_args()
+    if args.n in UNSOLVABLE:
+        parser.error(f"N={args.n} no tiene solución.")
+
+    random.seed(args.seed)
+    t0 = time.perf_counter()
+    board = Board(dimension=args.n)
+    t_init = time.perf_counter() - t0
+    initial_h = board.h
+    _, h, _ = min_conflicts(board)
+    elapsed = time.perf_counter() - t0
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f"N={args.n}")
+    print(f"H inicial (voraz): {initial_h} | tiempo de colocación: {t_init:.2f}s")
+    print(f"H final: {h} | evaluaciones: {board.evaluations} | tiempo total: {elapsed:.2f}s")
+    print(f"Memoria máxima del proceso: {peak_mb:.1f} MB")
+    if args.n <= 12:
+        board.print_board()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,21 @@ import math
 import random
 from typing import List, Optional, Tuple, Union
 
+from conflicts import ConflictTracker, count_conflicts
+from history import History, new_history
+
 
 class Board:
-    """Tablero con representación columna→fila, alineado al resto del TP."""
+    """Tablero con representación columna→fila, alineado al resto del TP.
+
+    `evaluations` cuenta las llamadas a `fitness` y `neighbour_fitness`; con
+    `max_evals` los algoritmos se detienen al agotar el presupuesto.
+    """
 
-    def __init__(self, dimension: int):
+    def __init__(self, dimension: int, max_evals: Optional[int] = None):
         self.dimension = dimension
+        self.max_evals = max_evals
+        self.evaluations = 0
         self.queens = self.random_start()
 
     def random_start(self) -> List[int]:
@@ -20,10 +29,15 @@ class Board:
 
     def fitness(self, queens: List[int]) -> int:
         """Devuelve H(e): cantidad de pares de reinas en conflicto."""
-        return self.get_threat(queens)
+        self.evaluations += 1
+        return count_conflicts(queens)
+
+    def budget_exhausted(self) -> bool:
+        """True cuando `evaluations` alcanzó `max_evals`."""
+        return self.max_evals is not None and self.evaluations >= self.max_evals
 
     def get_threat(self, queens: List[int]) -> int:
-        """Cuenta amenazas por filas y diagonales."""
+        """Cuenta amenazas por filas y diagonales (referencia O(N²); `fitness` usa `conflicts.count_conflicts`)."""
         threats = 0
         n = self.dimension
         for col_a in range(n):
@@ -34,16 +48,22 @@ class Board:
                     threats += 1
         return threats
 
-    def random_neighbour(self, actual_board: List[int]) -> Tuple[List[int], int]:
-        """Desplaza una reina a otra fila en la misma columna."""
+    def neighbour_fitness(self, tracker: "ConflictTracker", column: int, new_row: int) -> int:
+        """Evalúa H del vecino (column → new_row) en O(1) sin copiar el tablero."""
+        self.evaluations += 1
+        return tracker.h + tracker.delta(column, new_row)
+
+    def random_move(self, tracker: "ConflictTracker") -> Tuple[int, int, int]:
+        """Propone desplazar una reina a otra fila en la misma columna.
+
+        Devuelve (columna, fila_nueva, H_vecino); el movimiento no se aplica.
+        """
         n = self.dimension
-        neighbour = actual_board[:]
         column = random.randrange(n)
         new_row = random.randrange(n)
-        while new_row == neighbour[column]:
+        while new_row == tracker.queens[column]:
             new_row = random.randrange(n)
-        neighbour[column] = new_row
-        return neighbour, self.fitness(neighbour)
+        return column, new_row, self.neighbour_fitness(tracker, column, new_row)
 
     def print_board(self, queens: Optional[List[int]] = None) -> None:
         """Imprime el tablero respetando la representación columna→fila."""
@@ -66,7 +86,8 @@ def simulated_annealing(
     alpha: float = 0.95,
     max_iters: int = 100_000,
     return_history: bool = False,
-) -> Union[Tuple[List[int], int], Tuple[List[int], int, List[int]]]:
+    history_points: Optional[int] = None,
+) -> Union[Tuple[List[int], int], Tuple[List[int], int, History]]:
     """Optimiza N-reinas mediante Simulated Annealing.
 
     Parameters
@@ -83,6 +104,9 @@ def simulated_annealing(
         Límite de iteraciones independientemente del enfriamiento.
     return_history
         Si es True, devuelve también la serie H(t) del estado actual.
+    history_points
+        Si se indica, la serie se submuestrea en línea a ese presupuesto de
+        puntos (ver `history.BucketHistory`); si no, se guarda completa.
 
     Returns
     -------
@@ -95,15 +119,21 @@ def simulated_annealing(
     - Se alcanza solución óptima (H == 0).
     - La temperatura llega a `T_min`.
     - Se ejecutan `max_iters` iteraciones.
+    - Se agota el presupuesto de evaluaciones del tablero (`max_evals`).
+
+    Los vecinos se evalúan de forma incremental (`Board.neighbour_fitness`)
+    sobre un `ConflictTracker`, y los movimientos aceptados se aplican en el
+    lugar. Cada evaluación incremental cuenta como un estado explorado.
     """
     current = board.queens[:]
     current_fit = board.fitness(current)
+    tracker = ConflictTracker(current)
 
     best = current[:]
     best_fit = current_fit
 
     temperature = T_init
-    history: List[int] = []
+    history = new_history(history_points)
 
     for iteration in range(max_iters):
         if return_history:
@@ -112,18 +142,18 @@ def simulated_annealing(
         if best_fit == 0:
             break
 
-        if temperature < T_min:
+        if temperature < T_min or board.budget_exhausted():
             break
 
-        candidate, cand_fit = board.random_neighbour(current)
+        column, new_row, cand_fit = board.random_move(tracker)
         delta = cand_fit - current_fit
 
         if delta <= 0 or random.random() < math.exp(-delta / temperature):
-            current = candidate
+            tracker.move(column, new_row)
             current_fit = cand_fit
 
             if cand_fit < best_fit:
-                best = candidate[:]
+                best = current[:]
                 best_fit = cand_fit
 
         temperature = schedule(iteration + 1, T0=T_init, alpha=alpha)
@@ -133,6 +163,99 @@ def simulated_annealing(
     return best, best_fit
 
 
+def temperature_ladder(T_min: float, T_max: float, replicas: int) -> List[float]:
+    """Temperaturas en progresión geométrica de T_min (réplica 0) a T_max."""
+    if replicas == 1:
+        return [T_min]
+    ratio = (T_max / T_min) ** (1.0 / (replicas - 1))
+    return [T_min * ratio**i for i in range(replicas)]
+
+
+def parallel_tempering(
+    board: Board,
+    replicas: int = 8,
+    T_min: float = 0.1,
+    T_max: float = 1.5,
+    swap_interval: int = 10,
+    max_iters: int = 100_000,
+    return_history: bool = False,
+    history_points: Optional[int] = None,
+) -> Union[Tuple[List[int], int], Tuple[List[int], int, History]]:
+    """Optimiza N-reinas con Parallel Tempering (intercambio de réplicas).
+
+    Parameters
+    ----------
+    board
+        Instancia de `Board`; su configuración inicial es la réplica más fría.
+    replicas
+        Cantidad de cadenas de Metropolis, cada una a temperatura fija.
+    T_min, T_max
+        Extremos de la escalera geométrica de temperaturas.
+    swap_interval
+        Cada cuántos barridos se proponen intercambios entre vecinas.
+    max_iters
+        Límite de barridos (un barrido = una propuesta por réplica).
+    return_history
+        Si es True, devuelve también la serie H(t) de la réplica más fría.
+    history_points
+        Presupuesto de puntos de la serie, como en `simulated_annealing`.
+
+    Returns
+    -------
+    tuple
+        (mejor_solución, mejor_fitness) y opcionalmente history si se solicita.
+
+    Notas
+    -----
+    Las réplicas se ejecutan vectorizadas en un único proceso. Cada propuesta
+    se evalúa en O(1) con `Board.neighbour_fitness` y cuenta como un estado
+    explorado, igual que en `simulated_annealing`. Un intercambio entre las
+    temperaturas i e i+1 se acepta con probabilidad
+    min(1, exp((H_i - H_{i+1}) * (1/T_i - 1/T_{i+1}))) y no requiere nuevas
+    evaluaciones.
+    """
+    temperatures = temperature_ladder(T_min, T_max, replicas)
+    starts = [board.queens[:]] + [board.random_start() for _ in range(replicas - 1)]
+    energies = [board.fitness(queens) for queens in starts]
+    trackers = [ConflictTracker(queens) for queens in starts]
+
+    best_fit = min(energies)
+    best = trackers[energies.index(best_fit)].queens[:]
+    history = new_history(history_points)
+
+    for sweep in range(max_iters):
+        if return_history:
+            history.append(energies[0])
+
+        if best_fit == 0 or board.budget_exhausted():
+            break
+
+        for slot in range(replicas):
+            if board.budget_exhausted():
+                break
+            tracker = trackers[slot]
+            column, new_row, cand_fit = board.random_move(tracker)
+            delta = cand_fit - energies[slot]
+            if delta <= 0 or random.random() < math.exp(-delta / temperatures[slot]):
+                tracker.move(column, new_row)
+                energies[slot] = cand_fit
+                if cand_fit < best_fit:
+                    best = tracker.queens[:]
+                    best_fit = cand_fit
+
+        if (sweep + 1) % swap_interval == 0:
+            for slot in range(replicas - 1):
+                beta_gap = 1.0 / temperatures[slot] - 1.0 / temperatures[slot + 1]
+                log_accept = (energies[slot] - energies[slot + 1]) * beta_gap
+                if log_accept >= 0 or random.random() < math.exp(log_accept):
+                    trackers[slot], trackers[slot + 1] = trackers[slot + 1], trackers[slot]
+                    energies[slot], energies[slot + 1] = energies[slot + 1], energies[slot]
+
+    if return_history:
+        return best, best_fit, history
+    return best, best_fit
+
+
 def main():
     """Ejemplo rápido en consola."""
     random.seed()
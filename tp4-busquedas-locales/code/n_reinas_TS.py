@@ -0,0 +1,212 @@
+"""
+Búsqueda tabú para N-reinas.
+
+En cada iteración se evalúan, con contadores incrementales de filas y
+diagonales, todos los movimientos (columna, fila) de las columnas en conflicto
+y se aplica el mejor que no sea tabú. Al mover la reina de `c` desde la fila
+`r`, el par (c, r) queda prohibido durante `tenure` iteraciones para no
+deshacer el movimiento. Un movimiento tabú se admite igual si mejora el mejor
+H encontrado (criterio de aspiración).
+"""
+
+import random
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from conflicts import ConflictTracker, count_conflicts
+from history import History, new_history
+
+
+class Board:
+    """Tablero columna→fila con presupuesto de evaluaciones.
+
+    `evaluations` cuenta las llamadas a `fitness` y cada movimiento candidato
+    evaluado por `tabu_search`; con `max_evals` la búsqueda se detiene al
+    agotar el presupuesto.
+    """
+
+    def __init__(self, dimension: int, max_evals: Optional[int] = None):
+        self.dimension = dimension
+        self.max_evals = max_evals
+        self.evaluations = 0
+        self.queens = self.random_start()
+
+    def random_start(self) -> List[int]:
+        """Genera un estado inicial aleatorio columna→fila."""
+        return [random.randint(0, self.dimension - 1) for _ in range(self.dimension)]
+
+    def fitness(self, queens: List[int]) -> int:
+        """Devuelve H(e): cantidad de pares de reinas en conflicto."""
+        self.evaluations += 1
+        return count_conflicts(queens)
+
+    def budget_exhausted(self) -> bool:
+        """True cuando `evaluations` alcanzó `max_evals`."""
+        return self.max_evals is not None and self.evaluations >= self.max_evals
+
+    def print_board(self, queens: Optional[List[int]] = None) -> None:
+        """Imprime el tablero respetando la representación columna→fila."""
+        queens = queens if queens is not None else self.queens
+        for row in range(self.dimension):
+            line = ["Q" if queens[col] == row else "." for col in range(self.dimension)]
+            print(" ".join(line))
+        print()
+
+
+class TabuList:
+    """Memoria tabú de capacidad fija: buffer circular más conjunto hash.
+
+    Los movimientos (columna, fila) se codifican como `columna * N + fila`.
+    El buffer conserva el orden de llegada para expulsar el más viejo y el
+    diccionario (movimiento → posición en el buffer) responde la pertenencia
+    en O(1).
+    """
+
+    def __init__(self, dimension: int, tenure: int):
+        self.dimension = dimension
+        self.tenure = tenure
+        self._ring = array("i", [-1]) * tenure
+        self._next = 0
+        self._members: Dict[int, int] = {}
+
+    def push(self, column: int, row: int) -> None:
+        """Marca el movimiento como tabú; si ya lo era, reinicia su permanencia."""
+        if self.tenure == 0:
+            return
+        key = column * self.dimension + row
+        previous = self._members.get(key)
+        if previous is not None:
+            self._ring[previous] = -1
+        expired = self._ring[self._next]
+        if expired >= 0:
+            del self._members[expired]
+        self._ring[self._next] = key
+        self._members[key] = self._next
+        self._next = (self._next + 1) % self.tenure
+
+    def __contains__(self, move: Tuple[int, int]) -> bool:
+        return move[0] * self.dimension + move[1] in self._members
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+
+def tabu_search(
+    board: Board,
+    tenure: Optional[int] = None,
+    max_iters: int = 100_000,
+    return_history: bool = False,
+    history_points: Optional[int] = None,
+) -> Tuple[List[int], int, History]:
+    """Búsqueda tabú sobre el vecindario "mover una reina dentro de su columna".
+
+    Parameters
+    ----------
+    board
+        Instancia de `Board` con configuración inicial.
+    tenure
+        Cantidad de movimientos prohibidos simultáneamente (default: N).
+    max_iters
+        Límite de iteraciones independientemente del presupuesto.
+    return_history
+        Si es True, devuelve la serie H(t) del estado actual.
+    history_points
+        Si se indica, la serie se submuestrea en línea a ese presupuesto de
+        puntos (ver `history.BucketHistory`); si no, se guarda completa.
+
+    Returns
+    -------
+    tuple
+        (mejor_solución, mejor_H, historia).
+
+    Notas
+    -----
+    Cada movimiento candidato evaluado cuenta como un estado explorado. Sólo
+    se exploran las columnas cuya reina está amenazada; si todos los
+    movimientos son tabú y ninguno cumple la aspiración se aplica el mejor de
+    ellos. Los empates se desempatan al azar.
+    """
+    n = board.dimension
+    tenure = n if tenure is None else tenure
+    current = board.queens[:]
+    current_fit = board.fitness(current)
+    tracker = ConflictTracker(current)
+    rows, diag1, diag2 = tracker.rows, tracker.diag1, tracker.diag2
+    offset = tracker.offset
+    tabu = TabuList(n, tenure)
+    rand = random.random
+
+    best = current[:]
+    best_fit = current_fit
+    history = new_history(history_points)
+
+    for _ in range(max_iters):
+        if return_history:
+            history.append(current_fit)
+        if best_fit == 0 or board.budget_exhausted():
+            break
+
+        admissible_delta, admissible = n * n, []
+        fallback_delta, fallback = n * n, []
+        for col in range(n):
+            old = current[col]
+            d1_old, d2_old = old - col + offset, old + col
+            if rows[old] == 1 and diag1[d1_old] == 1 and diag2[d2_old] == 1:
+                continue
+            candidates = [row for row in range(n) if row != old]
+            if board.max_evals is not None:
+                candidates = candidates[: board.max_evals - board.evaluations]
+            board.evaluations += len(candidates)
+            removed = rows[old] + diag1[d1_old] + diag2[d2_old] - 3
+            for row in candidates:
+                delta = rows[row] + diag1[row - col + offset] + diag2[row + col] - removed
+                if (col, row) in tabu and current_fit + delta >= best_fit:
+                    if delta < fallback_delta:
+                        fallback_delta, fallback = delta, [(col, row)]
+                    elif delta == fallback_delta:
+                        fallback.append((col, row))
+                elif delta < admissible_delta:
+                    admissible_delta, admissible = delta, [(col, row)]
+                elif delta == admissible_delta:
+                    admissible.append((col, row))
+
+        if admissible:
+            moves, delta = admissible, admissible_delta
+        elif fallback:
+            moves, delta = fallback, fallback_delta
+        else:
+            break
+
+        col, row = moves[int(rand() * len(moves))]
+        tabu.push(col, current[col])
+        tracker.move(col, row)
+        current_fit += delta
+
+        if current_fit < best_fit:
+            best = current[:]
+            best_fit = current_fit
+
+    return best, best_fit, history
+
+
+def main():
+    """Ejemplo rápido en consola."""
+    random.seed()
+    dim = 10
+    board = Board(dimension=dim, max_evals=100_000)
+
+    print("Initial board:")
+    board.print_board()
+    print("Initial fitness:", board.fitness(board.queens))
+
+    solution, fit, history = tabu_search(board, return_history=True)
+
+    print("Final board:")
+    board.print_board(solution)
+    print("Fitness achieved:", fit)
+    print("Evaluations:", board.evaluations)
+    print("History length:", len(history))
+
+
+if __name__ == "__main__":
+    main()
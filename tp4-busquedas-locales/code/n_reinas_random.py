@@ -5,12 +5,21 @@ Búsqueda aleatoria para N-reinas (baseline).
 import random
 from typing import List, Optional, Tuple
 
+from conflicts import count_conflicts, count_conflicts_batch
+from history import History, new_history
+
 
 class Board:
-    """Tablero con representación columna→fila, consistente con el TP."""
+    """Tablero con representación columna→fila, consistente con el TP.
+
+    `evaluations` cuenta las llamadas a `fitness`; con `max_evals` la
+    búsqueda se detiene al agotar el presupuesto.
+    """
 
-    def __init__(self, dimension: int):
+    def __init__(self, dimension: int, max_evals: Optional[int] = None):
         self.dimension = dimension
+        self.max_evals = max_evals
+        self.evaluations = 0
         self.queens = self.random_start()
 
     def random_start(self) -> List[int]:
@@ -19,10 +28,15 @@ class Board:
 
     def fitness(self, queens: List[int]) -> int:
         """Cantidad de pares de reinas amenazadas (H)."""
-        return self.get_threat(queens)
+        self.evaluations += 1
+        return count_conflicts(queens)
+
+    def budget_exhausted(self) -> bool:
+        """Presupuesto agotado: `evaluations` >= `max_evals` (si hay límite)."""
+        return self.max_evals is not None and self.evaluations >= self.max_evals
 
     def get_threat(self, queens: List[int]) -> int:
-        """Evalúa conflictos por fila y diagonal."""
+        """Evalúa conflictos por fila y diagonal (referencia O(N²); `fitness` usa `conflicts.count_conflicts`)."""
         threats = 0
         for col_a in range(self.dimension):
             for col_b in range(col_a + 1, self.dimension):
@@ -37,7 +51,9 @@ def random_search(
     board: Board,
     max_evals: Optional[int] = None,
     return_history: bool = False,
-) -> Tuple[List[int], int, List[int]]:
+    history_points: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> Tuple[List[int], int, History]:
     """Explora estados al azar conservando el mejor encontrado.
 
     Parameters
@@ -45,16 +61,32 @@ def random_search(
     board
         Instancia de `Board` con estado inicial.
     max_evals
-        Límite de evaluaciones permitidas.
+        Límite de evaluaciones permitidas, además del presupuesto propio del
+        tablero (`Board.max_evals`).
     return_history
         Si es True, devuelve la evolución del mejor H observado.
+    history_points
+        Si se indica, la serie se submuestrea en línea a ese presupuesto de
+        puntos (ver `history.BucketHistory`); si no, se guarda completa.
+    batch_size
+        Si se indica, los candidatos se sortean de a lotes de ese tamaño con
+        NumPy y se evalúan con `count_conflicts_batch`. Sólo se cuentan las
+        evaluaciones hasta el primer tablero con H=0 del lote, de modo que
+        `states`, el presupuesto y la historia conservan su significado.
     """
     best = board.queens[:]
     best_H = board.fitness(best)
-    history: List[int] = [best_H] if return_history else []
+    history = new_history(history_points)
+    if return_history:
+        history.append(best_H)
+
+    if batch_size is not None:
+        return _random_search_batch(board, best, best_H, history, max_evals, return_history, batch_size)
 
     evaluations = 1
     while best_H != 0 and (max_evals is None or evaluations < max_evals):
+        if board.budget_exhausted():
+            break
         candidate = board.random_start()
         cand_H = board.fitness(candidate)
         evaluations += 1
@@ -65,3 +97,50 @@ def random_search(
             history.append(best_H)
 
     return best, best_H, history
+
+
+def _random_search_batch(
+    board: Board,
+    best: List[int],
+    best_H: int,
+    history: History,
+    max_evals: Optional[int],
+    return_history: bool,
+    batch_size: int,
+) -> Tuple[List[int], int, History]:
+    """Variante por lotes de `random_search` (ver su parámetro `batch_size`).
+
+    El generador de NumPy se siembra desde `random`, así que `random.seed`
+    sigue determinando la corrida.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(random.getrandbits(64))
+    n = board.dimension
+    evaluations = 1
+    while best_H != 0:
+        remaining = batch_size
+        if max_evals is not None:
+            remaining = min(remaining, max_evals - evaluations)
+        if board.max_evals is not None:
+            remaining = min(remaining, board.max_evals - board.evaluations)
+        if remaining <= 0:
+            break
+
+        candidates = rng.integers(0, n, size=(remaining, n))
+        threats = count_conflicts_batch(candidates)
+        solved = np.flatnonzero(threats == 0)
+        used = int(solved[0]) + 1 if solved.size else remaining
+        threats = threats[:used]
+        board.evaluations += used
+        evaluations += used
+
+        if return_history:
+            for value in np.minimum.accumulate(np.minimum(threats, best_H)).tolist():
+                history.append(value)
+        k = int(threats.argmin())
+        if threats[k] < best_H:
+            best = candidates[k].tolist()
+            best_H = int(threats[k])
+
+    return best, best_H, history
@@ -0,0 +1,188 @@
+"""
+Almacén append-only de corridas de N-reinas sobre SQLite.
+
+Reemplaza al árbol `results/json/<algo>/<size>/run_<n>.json`: cada corrida se
+agrega como una fila nueva (nunca se modifica una existente) y la versión
+vigente de una clave (algorithm_name, size, env_n) es la de mayor `id`. Los
+borrados se registran como filas lápida con `payload` NULL. Un índice sobre la
+clave permite consultar una corrida sin recorrer el directorio completo.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_ROOT = os.path.join(BASE_DIR, "results")
+STORE_PATH = os.path.join(RESULTS_ROOT, "runs.sqlite")
+JSON_DIR = os.path.join(RESULTS_ROOT, "json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    algorithm_name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    env_n INTEGER NOT NULL,
+    config_hash TEXT,
+    payload TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_key ON runs (algorithm_name, size, env_n, id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Última fila de cada clave; las lápidas (payload NULL) se filtran después.
+_LATEST = """
+SELECT payload FROM runs
+WHERE id IN (SELECT MAX(id) FROM runs GROUP BY algorithm_name, size, env_n)
+  AND payload IS NOT NULL
+"""
+
+
+class ResultsStore:
+    """Corridas indexadas por (algorithm_name, size, env_n)."""
+
+    def __init__(self, path: str = STORE_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def append(self, row: Dict) -> None:
+        """Agrega una corrida; reemplaza lógicamente a la anterior de su clave."""
+        self.append_many([row])
+
+    def append_many(self, rows: Iterable[Dict]) -> int:
+        """Agrega varias corridas en una única transacción."""
+        with self.conn:
+            return self.insert_rows(rows)
+
+    def insert_rows(self, rows: Iterable[Dict]) -> int:
+        """Inserta corridas sin confirmar: el llamador abre la transacción (`with store.conn`)."""
+        values = [
+            (
+                row["algorithm_name"],
+                int(row["size"]),
+                int(row["env_n"]),
+                row.get("config_hash"),
+                json.dumps(row, ensure_ascii=False),
+            )
+            for row in rows
+        ]
+        self.conn.executemany(
+            "INSERT INTO runs (algorithm_name, size, env_n, config_hash, payload) VALUES (?, ?, ?, ?, ?)",
+            values,
+        )
+        return len(values)
+
+    def get(self, algorithm_name: str, size: int, env_n: int) -> Optional[Dict]:
+        """Versión vigente de una corrida, o None si no existe o fue borrada."""
+        cur = self.conn.execute(
+            "SELECT payload FROM runs WHERE algorithm_name = ? AND size = ? AND env_n = ? "
+            "ORDER BY id DESC LIMIT 1",
+            (algorithm_name, size, env_n),
+        )
+        found = cur.fetchone()
+        if found is None or found[0] is None:
+            return None
+        return json.loads(found[0])
+
+    def rows(self) -> List[Dict]:
+        """Todas las corridas vigentes, ordenadas por (size, algoritmo, env_n)."""
+        rows = [json.loads(payload) for (payload,) in self.conn.execute(_LATEST)]
+        rows.sort(key=lambda row: (row["size"], row["algorithm_name"], row["env_n"]))
+        return rows
+
+    def delete(self, algorithms: Iterable[str], sizes: Iterable[int]) -> None:
+        """Registra lápidas para todas las corridas de los algoritmos/tamaños dados."""
+        sizes = list(sizes)
+        with self.conn:
+            for algo in algorithms:
+                for size in sizes:
+                    self.conn.execute(
+                        "INSERT INTO runs (algorithm_name, size, env_n, config_hash, payload) "
+                        "SELECT DISTINCT algorithm_name, size, env_n, NULL, NULL FROM runs "
+                        "WHERE algorithm_name = ? AND size = ?",
+                        (algo, size),
+                    )
+
+    def compact(self) -> None:
+        """Descarta versiones reemplazadas y lápidas, y libera espacio en disco."""
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM runs WHERE payload IS NULL OR id NOT IN "
+                "(SELECT MAX(id) FROM runs GROUP BY algorithm_name, size, env_n)"
+            )
+        self.conn.execute("VACUUM")
+
+    def migrate_json_tree(self, json_dir: str = JSON_DIR) -> int:
+        """Importa una única vez el árbol de JSON heredado.
+
+        Devuelve la cantidad de corridas importadas (0 si ya se había migrado
+        o si no hay árbol). Los JSON se dejan intactos.
+        """
+        done = self.conn.execute("SELECT value FROM meta WHERE key = 'json_migrated'").fetchone()
+        if done is not None:
+            return 0
+
+        rows = []
+        if os.path.isdir(json_dir):
+            for algo in sorted(os.listdir(json_dir)):
+                algo_dir = os.path.join(json_dir, algo)
+                if not os.path.isdir(algo_dir):
+                    continue
+                for size_name in sorted(os.listdir(algo_dir)):
+                    size_dir = os.path.join(algo_dir, size_name)
+                    if not os.path.isdir(size_dir):
+                        continue
+                    for fname in sorted(os.listdir(size_dir)):
+                        if not fname.endswith(".json"):
+                            continue
+                        with open(os.path.join(size_dir, fname), "r", encoding="utf-8") as f:
+                            rows.append(json.load(f))
+
+        # Las corridas ya guardadas en el almacén tienen prioridad sobre los JSON.
+        rows = [row for row in rows if self.get(row["algorithm_name"], row["size"], row["env_n"]) is None]
+        # Marca y corridas en la misma transacción: si la importación falla no
+        # queda la migración marcada como hecha.
+        with self.conn:
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('json_migrated', ?)", (json_dir,))
+            return self.insert_rows(rows)
+
+
+def open_store(path: str = STORE_PATH, json_dir: str = JSON_DIR) -> ResultsStore:
+    """Abre el almacén y migra el árbol de JSON heredado la primera vez."""
+    store = ResultsStore(path)
+    imported = store.migrate_json_tree(json_dir)
+    if imported:
+        print(f"Migradas {imported} corridas desde {json_dir} a {path}")
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mantenimiento del almacén de corridas.")
+    parser.add_argument("--store", default=STORE_PATH, help="Ruta del archivo SQLite.")
+    parser.add_argument("--json-dir", default=JSON_DIR, help="Árbol de JSON heredado a migrar.")
+    parser.add_argument("--compact", action="store_true", help="Descarta versiones reemplazadas.")
+    args = parser.parse_args()
+
+    with open_store(args.store, args.json_dir) as store:
+        if args.compact:
+            store.compact()
+        print(f"{len(store.rows())} corridas vigentes en {args.store}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Presupuestos de nodos y de tiempo de pared para los solvers del TP5.
+
+Consultar el reloj en cada nodo encarece la búsqueda, así que los solvers
+comparan su contador de nodos contra un punto de control y sólo al
+alcanzarlo llaman a `SearchBudget.check`, que verifica ambos límites y
+devuelve el próximo punto de control (a lo sumo `check_interval` nodos más
+adelante, o exactamente `max_nodes`). Al agotarse el presupuesto se lanza
+`BudgetExceeded` y el solver termina devolviendo `timed_out=True`: la
+cancelación es cooperativa y el resultado conserva los nodos explorados.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Optional
+
+CHECK_INTERVAL = 1024  # nodos entre consultas al reloj
+
+
+class BudgetExceeded(Exception):
+    """La búsqueda agotó su presupuesto de nodos o de tiempo."""
+
+
+class SearchBudget:
+    """Límite de nodos y/o de segundos contado desde la creación."""
+
+    def __init__(
+        self,
+        max_nodes: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        check_interval: int = CHECK_INTERVAL,
+    ):
+        if max_nodes is not None and max_nodes < 0:
+            raise ValueError("max_nodes debe ser mayor o igual a 0.")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("time_limit debe ser positivo.")
+        if check_interval <= 0:
+            raise ValueError("check_interval debe ser positivo.")
+        self.max_nodes = max_nodes
+        self.deadline = None if time_limit is None else perf_counter() + time_limit
+        self.check_interval = check_interval
+
+    def check(self, explored_nodes: int) -> int:
+        """Verifica el presupuesto antes de explorar un nodo más.
+
+        Lanza `BudgetExceeded` si ya se exploraron `max_nodes` nodos o venció
+        el plazo; si no, devuelve el conteo en el que volver a verificar.
+        """
+        if self.max_nodes is not None and explored_nodes >= self.max_nodes:
+            raise BudgetExceeded
+        if self.deadline is not None and perf_counter() >= self.deadline:
+            raise BudgetExceeded
+        checkpoint = explored_nodes + self.check_interval
+        if self.max_nodes is not None:
+            checkpoint = min(checkpoint, self.max_nodes)
+        return checkpoint
+
+
+def make_budget(
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    check_interval: int = CHECK_INTERVAL,
+) -> Optional[SearchBudget]:
+    """`SearchBudget` con los límites dados, o None si no hay ninguno."""
+    if max_nodes is None and time_limit is None:
+        return None
+    return SearchBudget(max_nodes=max_nodes, time_limit=time_limit, check_interval=check_interval)
@@ -12,7 +12,14 @@ from __future__ import annotations
 import random
 from dataclasses import dataclass
 from time import perf_counter
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
+
+try:
+    from .budget import BudgetExceeded, SearchBudget, make_budget
+    from .restarts import cutoffs
+except ImportError:  # Permite ejecución como script local
+    from budget import BudgetExceeded, SearchBudget, make_budget  # type: ignore[attr-defined]
+    from restarts import cutoffs  # type: ignore[attr-defined]
 
 
 @dataclass
@@ -21,22 +28,32 @@ class NQueensResult:
     solution: Optional[List[int]]
     explored_nodes: int
     time: float
+    restarts: int = 0
+    timed_out: bool = False  # corrida censurada: se agotó el presupuesto de nodos o tiempo
 
 
-def solve_n_queens_backtracking(n: int, rng: Optional[random.Random] = None) -> NQueensResult:
-    """
-    Resuelve N-Reinas con backtracking.
+class _Cutoff(Exception):
+    """El intento actual alcanzó su límite de nodos."""
 
-    :param n: cantidad de reinas
-    :param rng: generador para randomizar el orden de los dominios
+
+def _backtracking_attempt(
+    n: int,
+    rng: random.Random,
+    node_limit: Optional[int],
+    budget: Optional[SearchBudget] = None,
+    offset: int = 0,
+) -> Tuple[Optional[List[int]], int, str]:
     """
-    if n <= 0:
-        raise ValueError("n debe ser un entero positivo.")
+    Un intento de backtracking desde cero.
 
-    rng = rng or random.Random()
-    start = perf_counter()
+    Devuelve (solución, nodos explorados, estado), con estado "complete" si
+    el árbol se recorrió hasta una solución o hasta agotarlo, "cutoff" si se
+    alcanzó `node_limit` y "budget" si se agotó el presupuesto global
+    (`offset` son los nodos ya consumidos por intentos previos).
+    """
     explored_nodes = 0
     solution: Optional[List[int]] = None
+    checkpoint = None if budget is None else 0  # se verifica al entrar a la raíz
 
     assignment: List[Optional[int]] = [None] * n
     rows_used = set()
@@ -44,7 +61,11 @@ def solve_n_queens_backtracking(n: int, rng: Optional[random.Random] = None) ->
     diag2_used = set()  # r + c
 
     def backtrack(col: int) -> bool:
-        nonlocal explored_nodes, solution
+        nonlocal explored_nodes, solution, checkpoint
+        if explored_nodes == node_limit:
+            raise _Cutoff
+        if explored_nodes == checkpoint:
+            checkpoint = budget.check(offset + explored_nodes) - offset
         explored_nodes += 1
         if col == n:
             solution = [row for row in assignment if row is not None]
@@ -73,13 +94,65 @@ def solve_n_queens_backtracking(n: int, rng: Optional[random.Random] = None) ->
 
         return False
 
-    found = backtrack(0)
+    try:
+        backtrack(0)
+    except _Cutoff:
+        return None, explored_nodes, "cutoff"
+    except BudgetExceeded:
+        return None, explored_nodes, "budget"
+    return solution, explored_nodes, "complete"
+
+
+def solve_n_queens_backtracking(
+    n: int,
+    rng: Optional[random.Random] = None,
+    restart_policy: Optional[str] = None,
+    restart_base: Optional[int] = None,
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> NQueensResult:
+    """
+    Resuelve N-Reinas con backtracking.
+
+    :param n: cantidad de reinas
+    :param rng: generador para randomizar el orden de los dominios
+    :param restart_policy: None (sin reinicios), "luby", "geometric" o "fixed";
+        cada intento se corta al alcanzar su límite de nodos y el siguiente
+        empieza de cero con nuevas permutaciones del mismo `rng`
+    :param restart_base: límite base de nodos de la política (default: 4·N)
+    :param max_nodes: presupuesto total de nodos (entre todos los intentos)
+    :param time_limit: presupuesto de tiempo de pared en segundos; al
+        agotarse cualquiera de los dos se devuelve `timed_out=True`
+    """
+    if n <= 0:
+        raise ValueError("n debe ser un entero positivo.")
+
+    rng = rng or random.Random()
+    start = perf_counter()
+    budget = make_budget(max_nodes, time_limit)
+    limits: Iterable[Optional[int]] = [None]
+    if restart_policy is not None:
+        limits = cutoffs(restart_policy, restart_base or 4 * n)
+
+    explored_nodes = 0
+    solution: Optional[List[int]] = None
+    attempts = 0
+    status = "complete"
+    for limit in limits:
+        attempts += 1
+        solution, nodes, status = _backtracking_attempt(n, rng, limit, budget, explored_nodes)
+        explored_nodes += nodes
+        if status != "cutoff":
+            break
+
     elapsed = perf_counter() - start
     return NQueensResult(
-        found_solution=found,
+        found_solution=solution is not None,
         solution=solution,
         explored_nodes=explored_nodes,
         time=elapsed,
+        restarts=attempts - 1,
+        timed_out=status == "budget",
     )
 
 
@@ -89,6 +162,7 @@ if __name__ == "__main__":
     print(f"Solución encontrada: {result.found_solution}")
     print(f"Nodos explorados: {result.explored_nodes}")
     print(f"Tiempo: {result.time:.6f}s")
+    print(f"Reinicios: {result.restarts}")
     if result.solution:
         print("Representación columna -> fila:")
         print(result.solution)
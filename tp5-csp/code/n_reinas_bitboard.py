@@ -0,0 +1,160 @@
+"""
+Backtracking de N-Reinas sobre bitboards.
+
+Filas y diagonales ocupadas se guardan como enteros: el bit `r` de `rows`
+indica una fila ocupada, el bit `r - c + N - 1` de `diag1` una diagonal y el
+bit `r + c` de `diag2` una antidiagonal. Las filas libres de la columna `c`
+se obtienen con una sola expresión y se recorren con `x & -x` (bit menos
+significativo). La recursión se reemplaza por una pila explícita con la
+máscara de filas pendientes de cada nivel.
+
+Como un reordenamiento de filas no preserva las diagonales, la diversidad
+entre corridas se obtiene con una permutación sembrada del orden de las
+columnas (variables), sorteada una vez por corrida. Los nodos se cuentan
+como en `solve_n_queens_backtracking`: la raíz más cada reina colocada.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from time import perf_counter
+from typing import List, Optional, Sequence
+
+try:
+    from .budget import BudgetExceeded, make_budget
+    from .n_reinas_backtracking import NQueensResult, solve_n_queens_backtracking
+except ImportError:  # Permite ejecución como script local
+    from budget import BudgetExceeded, make_budget  # type: ignore[attr-defined]
+    from n_reinas_backtracking import NQueensResult, solve_n_queens_backtracking  # type: ignore[attr-defined]
+
+
+def solve_n_queens_bitboard(
+    n: int,
+    rng: Optional[random.Random] = None,
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> NQueensResult:
+    """
+    Resuelve N-Reinas con backtracking iterativo sobre máscaras de bits.
+
+    :param n: cantidad de reinas
+    :param rng: generador para sortear el orden de las columnas
+    :param max_nodes: presupuesto de nodos explorados
+    :param time_limit: presupuesto de tiempo de pared en segundos; al
+        agotarse cualquiera de los dos se devuelve `timed_out=True`
+    """
+    if n <= 0:
+        raise ValueError("n debe ser un entero positivo.")
+
+    rng = rng or random.Random()
+    start = perf_counter()
+
+    order = list(range(n))
+    rng.shuffle(order)
+    shift1 = [n - 1 - col for col in order]  # bit de diag1 = fila + shift1
+    shift2 = order  # bit de diag2 = fila + columna
+
+    full = (1 << n) - 1
+    rows = diag1 = diag2 = 0
+    placed = [0] * n  # bit de la fila elegida en cada nivel
+    pending = [0] * n  # filas libres aún no probadas en cada nivel
+    pending[0] = full
+    depth = 0
+    budget = make_budget(max_nodes, time_limit)
+    explored_nodes = 0
+    found = timed_out = False
+    try:
+        checkpoint = None if budget is None else budget.check(0)
+        explored_nodes = 1
+        while True:
+            avail = pending[depth]
+            if not avail:
+                if depth == 0:
+                    break
+                depth -= 1
+                bit = placed[depth]
+                rows ^= bit
+                diag1 ^= bit << shift1[depth]
+                diag2 ^= bit << shift2[depth]
+                continue
+
+            bit = avail & -avail
+            pending[depth] = avail ^ bit
+            placed[depth] = bit
+            if explored_nodes == checkpoint:
+                checkpoint = budget.check(explored_nodes)
+            explored_nodes += 1
+            if depth == n - 1:
+                found = True
+                break
+
+            rows |= bit
+            diag1 |= bit << shift1[depth]
+            diag2 |= bit << shift2[depth]
+            depth += 1
+            pending[depth] = full & ~(rows | (diag1 >> shift1[depth]) | (diag2 >> shift2[depth]))
+    except BudgetExceeded:
+        timed_out = True
+
+    solution: Optional[List[int]] = None
+    if found:
+        solution = [0] * n
+        for level, col in enumerate(order):
+            solution[col] = placed[level].bit_length() - 1
+
+    elapsed = perf_counter() - start
+    return NQueensResult(
+        found_solution=found,
+        solution=solution,
+        explored_nodes=explored_nodes,
+        time=elapsed,
+        timed_out=timed_out,
+    )
+
+
+def benchmark(n_values: Sequence[int], runs: int) -> None:
+    """Compara nodos por segundo contra `solve_n_queens_backtracking`."""
+    print(f"{'N':>4} {'BT nodos/s':>14} {'bitboard nodos/s':>18} {'speedup':>8}")
+    for n in n_values:
+        rates = []
+        for solver in (solve_n_queens_backtracking, solve_n_queens_bitboard):
+            nodes = 0
+            elapsed = 0.0
+            for seed in range(1, runs + 1):
+                result = solver(n, rng=random.Random(seed))
+                nodes += result.explored_nodes
+                elapsed += result.time
+            rates.append(nodes / elapsed)
+        print(f"{n:>4} {rates[0]:>14,.0f} {rates[1]:>18,.0f} {rates[1] / rates[0]:>7.1f}x")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Backtracking de N-Reinas sobre bitboards.")
+    parser.add_argument("--n", type=int, default=8, help="Tamaño del tablero del ejemplo (default: 8).")
+    parser.add_argument(
+        "--benchmark",
+        dest="bench_n",
+        nargs="+",
+        type=int,
+        metavar="N",
+        help="Compara nodos/s contra el backtracking clásico para estos N.",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Semillas por N en el benchmark (default: 10).")
+    args = parser.parse_args(argv)
+
+    if args.bench_n:
+        benchmark(args.bench_n, args.runs)
+        return
+
+    result = solve_n_queens_bitboard(args.n, rng=random.Random(42))
+    print(f"Solución encontrada: {result.found_solution}")
+    print(f"Nodos explorados: {result.explored_nodes}")
+    print(f"Tiempo: {result.time:.6f}s")
+    if result.solution:
+        print("Representación columna -> fila:")
+        print(result.solution)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Conteo exacto de soluciones de N-Reinas sobre bitboards.
+
+La búsqueda avanza fila por fila con tres máscaras: columnas ocupadas y
+diagonales que atacan la fila actual (`ld` se desplaza a la izquierda y `rd`
+a la derecha al bajar una fila). Las casillas libres son
+`full & ~(cols | ld | rd)` y se recorren con `x & -x`.
+
+Modos de simetría:
+
+- "none": recorre el árbol completo (referencia para validar).
+- "half": la reflexión vertical es una biyección entre soluciones con la
+  reina de la fila 0 en la mitad izquierda y en la derecha, así que sólo se
+  recorre la mitad izquierda y se duplica. Con N impar, para la columna del
+  medio se restringe la fila 1 a la mitad izquierda (tampoco puede estar en
+  el medio).
+- "d4": reducción por el grupo completo de simetrías del cuadrado (rotaciones
+  y reflexiones). Sólo se buscan representantes canónicos: la reina de la
+  fila 0 en la esquina, o bien en la columna `b1` con cotas que podan las
+  filas y columnas de los bordes; cada solución hallada se compara con sus
+  rotaciones y se pondera por el tamaño de su órbita (2, 4 u 8). Devuelve
+  además la cantidad de soluciones únicas.
+
+En todos los modos el trabajo se divide en tareas que fijan las dos primeras
+filas, y con `workers > 1` las tareas se reparten en procesos.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+from dataclasses import dataclass
+from time import perf_counter
+from typing import List, Optional, Sequence, Tuple
+
+SYMMETRIES = ("none", "half", "d4")
+
+# Conteos conocidos (OEIS A000170 y A002562) para validar.
+KNOWN_TOTALS = {
+    1: 1, 2: 0, 3: 0, 4: 2, 5: 10, 6: 4, 7: 40, 8: 92, 9: 352, 10: 724,
+    11: 2680, 12: 14200, 13: 73712, 14: 365596, 15: 2279184, 16: 14772512,
+    17: 95815104,
+}
+KNOWN_UNIQUE = {
+    1: 1, 2: 0, 3: 0, 4: 1, 5: 2, 6: 1, 7: 6, 8: 12, 9: 46, 10: 92,
+    11: 341, 12: 1787, 13: 9233, 14: 45752, 15: 285053, 16: 1846955,
+    17: 11977939,
+}
+
+# Tarea: (modo, peso, b1, b2, fila 0, fila 1, cols, ld, rd) con las dos
+# primeras filas ya colocadas; b1/b2 sólo se usan en "d4".
+Task = Tuple[str, int, int, int, int, int, int, int, int]
+
+
+@dataclass
+class CountResult:
+    n: int
+    total: int
+    unique: Optional[int]  # sólo con symmetry="d4"
+    explored_nodes: int  # reinas colocadas durante la búsqueda
+    time: float
+    tasks: int
+
+
+def _place(cols: int, ld: int, rd: int, bit: int) -> Tuple[int, int, int]:
+    """Máscaras de la fila siguiente tras colocar `bit` en la fila actual."""
+    return cols | bit, (ld | bit) << 1, (rd | bit) >> 1
+
+
+def _count_plain(n: int, row: int, cols: int, ld: int, rd: int) -> Tuple[int, int]:
+    """Soluciones y nodos del subárbol que empieza en `row`."""
+    full = (1 << n) - 1
+    last = n - 1
+    nodes = 0
+
+    def search(row: int, cols: int, ld: int, rd: int) -> int:
+        nonlocal nodes
+        avail = full & ~(cols | ld | rd)
+        if row == last:
+            if avail:
+                nodes += 1
+                return 1
+            return 0
+        nodes += avail.bit_count()
+        found = 0
+        while avail:
+            bit = avail & -avail
+            avail ^= bit
+            found += search(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+        return found
+
+    if row == n:
+        return 1, 0
+    return search(row, cols, ld, rd), nodes
+
+
+def _count_d4(
+    n: int, b1: int, b2: int, board0: int, board1: int, cols: int, ld: int, rd: int
+) -> Tuple[int, int, int, int]:
+    """Órbitas de tamaño 8, 4 y 2 (y nodos) del subárbol de una tarea "d4".
+
+    `b2 == 0` indica el caso de la reina de la fila 0 en la esquina, donde
+    `b1` es la columna de la fila 1.
+    """
+    full = (1 << n) - 1
+    last = n - 1
+    topbit = 1 << last
+    board = [0] * n
+    board[0], board[1] = board0, board1
+    counts = [0, 0, 0]  # órbitas de 8, 4 y 2
+    nodes = 0
+
+    if b2 == 0:
+        # Esquina: sólo se descarta la reflexión diagonal, prohibiendo la
+        # columna 1 en las filas anteriores a b1.
+        def corner(row: int, cols: int, ld: int, rd: int) -> None:
+            nonlocal nodes
+            avail = full & ~(cols | ld | rd)
+            if row == last:
+                if avail:
+                    nodes += 1
+                    counts[0] += 1
+                return
+            if row < b1:
+                avail &= ~2
+            nodes += avail.bit_count()
+            while avail:
+                bit = avail & -avail
+                avail ^= bit
+                corner(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+
+        corner(2, cols, ld, rd)
+        return counts[0], counts[1], counts[2], nodes
+
+    sidemask = topbit | 1
+    lastmask = sidemask
+    endbit = topbit >> 1
+    for _ in range(1, b1):
+        lastmask |= lastmask >> 1 | lastmask << 1
+        endbit >>= 1
+
+    def multiplicity() -> int:
+        """Tamaño de la órbita si `board` es canónica, 0 si no lo es."""
+        if board[b2] == 1:  # rotación de 90°
+            own, ptn = 1, 2
+            while own <= last:
+                bit, you = 1, last
+                while board[you] != ptn and board[own] >= bit:
+                    bit <<= 1
+                    you -= 1
+                if board[own] > bit:
+                    return 0
+                if board[own] < bit:
+                    break
+                own += 1
+                ptn <<= 1
+            else:
+                return 2
+        if board[last] == endbit:  # rotación de 180°
+            own, you = 1, last - 1
+            while own <= last:
+                bit, ptn = 1, topbit
+                while ptn != board[you] and board[own] >= bit:
+                    bit <<= 1
+                    ptn >>= 1
+                if board[own] > bit:
+                    return 0
+                if board[own] < bit:
+                    break
+                own += 1
+                you -= 1
+            else:
+                return 4
+        if board[b1] == topbit:  # rotación de 270°
+            own, ptn = 1, topbit >> 1
+            while own <= last:
+                bit, you = 1, 0
+                while board[you] != ptn and board[own] >= bit:
+                    bit <<= 1
+                    you += 1
+                if board[own] > bit:
+                    return 0
+                if board[own] < bit:
+                    break
+                own += 1
+                ptn >>= 1
+        return 8
+
+    def edge(row: int, cols: int, ld: int, rd: int) -> None:
+        nonlocal nodes
+        avail = full & ~(cols | ld | rd)
+        if row == last:
+            if avail and not avail & lastmask:
+                nodes += 1
+                board[row] = avail
+                size = multiplicity()
+                if size:
+                    counts[(8, 4, 2).index(size)] += 1
+            return
+        if row < b1:
+            avail &= ~sidemask
+        elif row == b2:
+            if not cols & sidemask:
+                return
+            if cols & sidemask != sidemask:
+                avail &= sidemask
+        nodes += avail.bit_count()
+        while avail:
+            bit = avail & -avail
+            avail ^= bit
+            board[row] = bit
+            edge(row + 1, cols | bit, (ld | bit) << 1, (rd | bit) >> 1)
+
+    edge(2, cols, ld, rd)
+    return counts[0], counts[1], counts[2], nodes
+
+
+def _split_tasks(n: int, symmetry: str) -> List[Task]:
+    """Tareas con las dos primeras filas fijas (requiere n >= 4)."""
+    full = (1 << n) - 1
+    tasks: List[Task] = []
+
+    def second_rows(mode: str, weight: int, b1: int, b2: int, first: int, allowed: int) -> None:
+        cols, ld, rd = _place(0, 0, 0, first)
+        avail = full & ~(cols | ld | rd) & allowed
+        while avail:
+            bit = avail & -avail
+            avail ^= bit
+            tasks.append((mode, weight, b1, b2, first, bit, *_place(cols, ld, rd, bit)))
+
+    if symmetry == "none":
+        for col in range(n):
+            second_rows("none", 1, 0, 0, 1 << col, full)
+    elif symmetry == "half":
+        half = n // 2
+        left = (1 << half) - 1  # columnas 0..half-1 (bits bajos)
+        for col in range(half):
+            second_rows("none", 2, 0, 0, 1 << col, full)
+        if n % 2:
+            second_rows("none", 2, 0, 0, 1 << half, left)
+    else:
+        last = n - 1
+        sidemask = (1 << last) | 1
+        for b1 in range(2, last):  # reina de la fila 0 en la esquina
+            cols, ld, rd = _place(0, 0, 0, 1)
+            bit = 1 << b1
+            tasks.append(("d4", 1, b1, 0, 1, bit, *_place(cols, ld, rd, bit)))
+        b1, b2 = 1, n - 2
+        while b1 < b2:
+            # La fila 1 < b1 salvo con b1 == 1; b2 >= 2 nunca coincide con ella.
+            allowed = full & ~sidemask if 1 < b1 else full
+            second_rows("d4", 1, b1, b2, 1 << b1, allowed)
+            b1 += 1
+            b2 -= 1
+    return tasks
+
+
+def _run_task(args: Tuple[int, Task]) -> Tuple[int, int, int]:
+    """(total ponderado, únicas, nodos) de una tarea; únicas sólo en "d4"."""
+    n, (mode, weight, b1, b2, board0, board1, cols, ld, rd) = args
+    if mode == "d4":
+        c8, c4, c2, nodes = _count_d4(n, b1, b2, board0, board1, cols, ld, rd)
+        return 8 * c8 + 4 * c4 + 2 * c2, c8 + c4 + c2, nodes + 2
+    found, nodes = _count_plain(n, 2, cols, ld, rd)
+    return weight * found, 0, nodes + 2
+
+
+def count_n_queens(n: int, symmetry: str = "d4", workers: int = 1) -> CountResult:
+    """
+    Cuenta todas las soluciones de N-Reinas.
+
+    :param n: tamaño del tablero
+    :param symmetry: "none", "half" o "d4" (ver docstring del módulo)
+    :param workers: procesos entre los que repartir las tareas
+    """
+    if n <= 0:
+        raise ValueError("n debe ser un entero positivo.")
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Simetría desconocida: {symmetry}. Opciones: {', '.join(SYMMETRIES)}.")
+    if workers <= 0:
+        raise ValueError("workers debe ser positivo.")
+
+    start = perf_counter()
+    if n < 4:
+        # Tableros sin dos filas que fijar: búsqueda directa. La única
+        # solución con N < 4 (N = 1) es su propia órbita.
+        total, nodes = _count_plain(n, 0, 0, 0, 0)
+        unique = total if symmetry == "d4" else None
+        return CountResult(n, total, unique, nodes, perf_counter() - start, 1)
+
+    tasks = _split_tasks(n, symmetry)
+    jobs = [(n, task) for task in tasks]
+    if workers == 1:
+        partials = list(map(_run_task, jobs))
+    else:
+        with mp.Pool(workers) as pool:
+            partials = pool.map(_run_task, jobs, chunksize=1)
+
+    total = sum(p[0] for p in partials)
+    unique = sum(p[1] for p in partials) if symmetry == "d4" else None
+    nodes = sum(p[2] for p in partials)
+    return CountResult(n, total, unique, nodes, perf_counter() - start, len(tasks))
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Conteo exacto de soluciones de N-Reinas.")
+    parser.add_argument(
+        "--n", dest="n_values", nargs="+", type=int, default=[8], help="Valores de N a contar (default: 8)."
+    )
+    parser.add_argument(
+        "--symmetry",
+        choices=SYMMETRIES,
+        default="d4",
+        help="Reducción por simetrías: none, half (reflexión) o d4 (grupo completo, default).",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Procesos para repartir las tareas (default: 1).")
+    args = parser.parse_args(argv)
+
+    print(f"{'N':>3} {'soluciones':>12} {'únicas':>10} {'nodos':>13} {'tareas':>7} {'tiempo (s)':>11} {'ok':>3}")
+    for n in args.n_values:
+        result = count_n_queens(n, args.symmetry, args.workers)
+        ok = result.total == KNOWN_TOTALS.get(n, result.total) and (
+            result.unique is None or result.unique == KNOWN_UNIQUE.get(n, result.unique)
+        )
+        unique = "-" if result.unique is None else str(result.unique)
+        print(
+            f"{n:>3} {result.total:>12} {unique:>10} {result.explored_nodes:>13} "
+            f"{result.tasks:>7} {result.time:>11.3f} {'sí' if ok else 'NO':>3}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,23 +14,35 @@ from time import perf_counter
 from typing import List, Optional, Sequence, Set
 
 try:
+    from .budget import BudgetExceeded, make_budget
     from .n_reinas_backtracking import NQueensResult
 except ImportError:  # Permite ejecución como script local
+    from budget import BudgetExceeded, make_budget  # type: ignore[attr-defined]
     from n_reinas_backtracking import NQueensResult  # type: ignore[attr-defined]
 
 
-def solve_n_queens_forward(n: int, rng: Optional[random.Random] = None) -> NQueensResult:
+def solve_n_queens_forward(
+    n: int,
+    rng: Optional[random.Random] = None,
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> NQueensResult:
     """
     Resuelve N-Reinas con forward checking.
 
     :param n: tamaño del tablero
     :param rng: generador pseudoaleatorio para explorar diversos órdenes
+    :param max_nodes: presupuesto de nodos explorados
+    :param time_limit: presupuesto de tiempo de pared en segundos; al
+        agotarse cualquiera de los dos se devuelve `timed_out=True`
     """
     if n <= 0:
         raise ValueError("n debe ser un entero positivo.")
 
     rng = rng or random.Random()
     start = perf_counter()
+    budget = make_budget(max_nodes, time_limit)
+    checkpoint = None if budget is None else 0  # se verifica al entrar a la raíz
     explored_nodes = 0
     assignment: List[Optional[int]] = [None] * n
     rows_used: Set[int] = set()
@@ -59,7 +71,9 @@ def solve_n_queens_forward(n: int, rng: Optional[random.Random] = None) -> NQuee
         return True
 
     def forward(col: int, domains: List[Set[int]]) -> bool:
-        nonlocal explored_nodes, solution
+        nonlocal explored_nodes, solution, checkpoint
+        if explored_nodes == checkpoint:
+            checkpoint = budget.check(explored_nodes)
         explored_nodes += 1
         if col == n:
             solution = [row for row in assignment if row is not None]
@@ -94,13 +108,18 @@ def solve_n_queens_forward(n: int, rng: Optional[random.Random] = None) -> NQuee
 
         return False
 
-    found = forward(0, initial_domains)
+    timed_out = False
+    try:
+        found = forward(0, initial_domains)
+    except BudgetExceeded:
+        found, solution, timed_out = False, None, True
     elapsed = perf_counter() - start
     return NQueensResult(
         found_solution=found,
         solution=solution,
         explored_nodes=explored_nodes,
         time=elapsed,
+        timed_out=timed_out,
     )
 
 
@@ -0,0 +1,241 @@
+"""
+Forward checking para N-Reinas con orden dinámico de variables (MRV + grado).
+
+En lugar de asignar las columnas de izquierda a derecha, en cada nodo se elige
+la columna sin asignar con menos filas disponibles (MRV). Las columnas se
+agrupan en buckets por tamaño de dominio: `buckets[s]` es una máscara con las
+columnas de dominio `s` y `sizes` una máscara con los tamaños no vacíos, de
+modo que elegir la próxima variable son dos operaciones `x & -x`.
+
+En N-Reinas cada par de columnas está restringido, así que el grado clásico
+(restricciones con variables sin asignar) empata siempre. El desempate usa el
+grado a nivel de casilleros: cuántas casillas atacan en diagonal las reinas de
+la columna, que es mayor en las columnas centrales. Dentro de un bucket los
+bits se ordenan por esa prioridad.
+
+Dominios y deshacer funcionan como en `n_reinas_forward_trail`: dominios en
+bits y un trail de (columna, máscara previa); al restaurar una entrada la
+columna vuelve también a su bucket anterior.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from time import perf_counter
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from .budget import BudgetExceeded, make_budget
+    from .n_reinas_backtracking import NQueensResult
+    from .n_reinas_forward_trail import _bits, solve_n_queens_forward_trail
+except ImportError:  # Permite ejecución como script local
+    from budget import BudgetExceeded, make_budget  # type: ignore[attr-defined]
+    from n_reinas_backtracking import NQueensResult  # type: ignore[attr-defined]
+    from n_reinas_forward_trail import _bits, solve_n_queens_forward_trail  # type: ignore[attr-defined]
+
+
+def _degree_priority(n: int) -> List[int]:
+    """Columnas ordenadas por casillas atacadas en diagonal (desc.), luego índice."""
+    def degree(col: int) -> int:
+        return sum(
+            min(row, col) + min(n - 1 - row, n - 1 - col) + min(row, n - 1 - col) + min(n - 1 - row, col)
+            for row in range(n)
+        )
+
+    return sorted(range(n), key=lambda col: (-degree(col), col))
+
+
+def solve_n_queens_forward_mrv(
+    n: int,
+    rng: Optional[random.Random] = None,
+    max_nodes: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> NQueensResult:
+    """
+    Resuelve N-Reinas con forward checking y selección de variable MRV.
+
+    :param n: tamaño del tablero
+    :param rng: generador pseudoaleatorio para el orden de los valores
+    :param max_nodes: presupuesto de nodos explorados
+    :param time_limit: presupuesto de tiempo de pared en segundos; al
+        agotarse cualquiera de los dos se devuelve `timed_out=True`
+    """
+    if n <= 0:
+        raise ValueError("n debe ser un entero positivo.")
+
+    rng = rng or random.Random()
+    start = perf_counter()
+
+    by_priority = _degree_priority(n)
+    priority_bit = [0] * n
+    for rank, col in enumerate(by_priority):
+        priority_bit[col] = 1 << rank
+
+    domains = [(1 << n) - 1] * n
+    buckets = [0] * (n + 1)
+    buckets[n] = (1 << n) - 1
+    sizes = 1 << n
+    unassigned = (1 << n) - 1  # máscara indexada por columna
+
+    def move(col: int, old_size: int, new_size: int) -> None:
+        nonlocal sizes
+        bit = priority_bit[col]
+        buckets[old_size] ^= bit
+        if not buckets[old_size]:
+            sizes ^= 1 << old_size
+        if not buckets[new_size]:
+            sizes |= 1 << new_size
+        buckets[new_size] |= bit
+
+    def take_mrv() -> int:
+        """Quita de los buckets y devuelve la columna a asignar."""
+        nonlocal sizes, unassigned
+        size = (sizes & -sizes).bit_length() - 1
+        bucket = buckets[size]
+        bit = bucket & -bucket
+        buckets[size] = bucket ^ bit
+        if bucket == bit:
+            sizes ^= 1 << size
+        col = by_priority[bit.bit_length() - 1]
+        unassigned ^= 1 << col
+        return col
+
+    def release(col: int) -> None:
+        """Devuelve la columna a su bucket al agotar sus valores."""
+        nonlocal sizes, unassigned
+        size = domains[col].bit_count()
+        if not buckets[size]:
+            sizes |= 1 << size
+        buckets[size] |= priority_bit[col]
+        unassigned |= 1 << col
+
+    trail: List[Tuple[int, int]] = []
+    marks = [0] * n
+    columns = [0] * n
+    orders: List[List[int]] = [[] for _ in range(n)]
+    next_index = [0] * n
+    assignment = [0] * n
+
+    budget = make_budget(max_nodes, time_limit)
+    explored_nodes = 0
+    found = timed_out = False
+    try:
+        checkpoint = None if budget is None else budget.check(0)
+        explored_nodes = 1
+        level = 0
+        col = columns[0] = take_mrv()
+        orders[0] = rng.sample(_bits(domains[col]), k=n)
+
+        while True:
+            mark = marks[level]
+            while len(trail) > mark:
+                future_col, previous = trail.pop()
+                move(future_col, domains[future_col].bit_count(), previous.bit_count())
+                domains[future_col] = previous
+
+            col = columns[level]
+            order = orders[level]
+            i = next_index[level]
+            if i == len(order):
+                release(col)
+                if level == 0:
+                    break
+                level -= 1
+                continue
+            next_index[level] = i + 1
+            row = order[i]
+
+            consistent = True
+            pending = unassigned
+            while pending:
+                low = pending & -pending
+                pending ^= low
+                future_col = low.bit_length() - 1
+                distance = abs(future_col - col)
+                bit = 1 << row
+                domain = domains[future_col]
+                remaining = domain & ~(bit | bit << distance | bit >> distance)
+                if remaining != domain:
+                    trail.append((future_col, domain))
+                    domains[future_col] = remaining
+                    move(future_col, domain.bit_count(), remaining.bit_count())
+                    if not remaining:
+                        consistent = False
+                        break
+            if not consistent:
+                continue
+
+            assignment[col] = row
+            if explored_nodes == checkpoint:
+                checkpoint = budget.check(explored_nodes)
+            explored_nodes += 1
+            if level == n - 1:
+                found = True
+                break
+
+            level += 1
+            col = columns[level] = take_mrv()
+            values = _bits(domains[col])
+            orders[level] = rng.sample(values, k=len(values))
+            next_index[level] = 0
+            marks[level] = len(trail)
+    except BudgetExceeded:
+        timed_out = True
+
+    elapsed = perf_counter() - start
+    return NQueensResult(
+        found_solution=found,
+        solution=assignment if found else None,
+        explored_nodes=explored_nodes,
+        time=elapsed,
+        timed_out=timed_out,
+    )
+
+
+def benchmark(n_values: Sequence[int], runs: int) -> None:
+    """Nodos y tiempo medios contra forward checking con orden fijo de columnas."""
+    print(f"{'N':>4} {'nodos FC':>10} {'nodos MRV':>10} {'FC (s)':>10} {'MRV (s)':>10}")
+    for n in n_values:
+        totals = [[0, 0.0], [0, 0.0]]
+        for seed in range(1, runs + 1):
+            for k, solver in enumerate((solve_n_queens_forward_trail, solve_n_queens_forward_mrv)):
+                result = solver(n, rng=random.Random(seed))
+                totals[k][0] += result.explored_nodes
+                totals[k][1] += result.time
+        (fc_nodes, fc_time), (mrv_nodes, mrv_time) = totals
+        print(
+            f"{n:>4} {fc_nodes / runs:>10.1f} {mrv_nodes / runs:>10.1f} "
+            f"{fc_time / runs:>10.5f} {mrv_time / runs:>10.5f}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Forward checking de N-Reinas con MRV.")
+    parser.add_argument("--n", type=int, default=8, help="Tamaño del tablero del ejemplo (default: 8).")
+    parser.add_argument(
+        "--benchmark",
+        dest="bench_n",
+        nargs="+",
+        type=int,
+        metavar="N",
+        help="Compara contra forward checking con orden fijo para estos N.",
+    )
+    parser.add_argument("--runs", type=int, default=10, help="Semillas por N en el benchmark (default: 10).")
+    args = parser.parse_args(argv)
+
+    if args.bench_n:
+        benchmark(args.bench_n, args.runs)
+        return
+
+    result = solve_n_queens_forward_mrv(args.n, rng=random.Random(123))
+    print(f"Solución encontrada: {result.found_solution}")
+    print(f"Nodos explorados: {result.explored_nodes}")
+    print(f"Tiempo: {result.time:.6f}s")
+    if result.solution:
+        print("Columna -> fila:")
+        print(result.solution)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,18 +9,27 @@ from __future__ import annotations
 
 import argparse
 import random
+from functools import partial
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
 import pandas as pd
 
 try:
     from .n_reinas_backtracking import NQueensResult, solve_n_queens_backtracking
+    from .n_reinas_bitboard import solve_n_queens_bitboard
     from .n_reinas_forward import solve_n_queens_forward
+    from .n_reinas_forward_mrv import solve_n_queens_forward_mrv
+    from .n_reinas_forward_trail import solve_n_queens_forward_trail
+    from .portfolio import nqueens_portfolio, run_portfolio
     from .utils import compute_stats, make_boxplots
 except ImportError:  # Permite correr como script sin paquete
     from n_reinas_backtracking import NQueensResult, solve_n_queens_backtracking  # type: ignore[attr-defined]
+    from n_reinas_bitboard import solve_n_queens_bitboard  # type: ignore[attr-defined]
     from n_reinas_forward import solve_n_queens_forward  # type: ignore[attr-defined]
+    from n_reinas_forward_mrv import solve_n_queens_forward_mrv  # type: ignore[attr-defined]
+    from n_reinas_forward_trail import solve_n_queens_forward_trail  # type: ignore[attr-defined]
+    from portfolio import nqueens_portfolio, run_portfolio  # type: ignore[attr-defined]
     from utils import compute_stats, make_boxplots  # type: ignore[attr-defined]
 
 Solver = Callable[[int, random.Random], NQueensResult]
@@ -28,7 +37,13 @@ Solver = Callable[[int, random.Random], NQueensResult]
 ALGORITHMS: Dict[str, Solver] = {
     "BT": solve_n_queens_backtracking,
     "FC": solve_n_queens_forward,
+    "BT-bits": solve_n_queens_bitboard,
+    "FC-trail": solve_n_queens_forward_trail,
+    "FC-MRV": solve_n_queens_forward_mrv,
+    "BT-Luby": partial(solve_n_queens_backtracking, restart_policy="luby"),
 }
+# Comparación clásica del informe (--algo both)
+DEFAULT_PAIR = ("BT", "FC")
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -43,10 +58,14 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--algo",
-        dest="algorithm",
-        choices=["BT", "FC", "both"],
-        default="both",
-        help="Algoritmo a ejecutar (BT, FC o both).",
+        dest="algorithms",
+        nargs="+",
+        choices=[*ALGORITHMS, "both", "all"],
+        default=["both"],
+        help=(
+            "Algoritmos a ejecutar (BT, FC, BT-bits, FC-trail, FC-MRV, BT-Luby); admite varios. "
+            "both = BT y FC, all = todos."
+        ),
     )
     parser.add_argument(
         "--runs",
@@ -55,6 +74,28 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=30,
         help="Cantidad de corridas por combinación (default: 30).",
     )
+    parser.add_argument(
+        "--timeout",
+        dest="timeout",
+        type=float,
+        metavar="SEGUNDOS",
+        default=None,
+        help=(
+            "Tiempo máximo por corrida; las corridas que lo agotan se registran "
+            "como censuradas (timed_out) en lugar de bloquear el barrido."
+        ),
+    )
+    parser.add_argument(
+        "--portfolio",
+        dest="portfolio",
+        type=int,
+        metavar="K",
+        default=0,
+        help=(
+            "Además corre un portafolio de K procesos que alterna los algoritmos "
+            "elegidos con semillas distintas y se queda con la primera solución."
+        ),
+    )
     parser.add_argument(
         "--output",
         dest="output",
@@ -65,7 +106,22 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def run_experiments(n_values: Iterable[int], algos: Iterable[str], runs: int) -> List[Dict[str, object]]:
+def resolve_algorithms(names: Sequence[str]) -> List[str]:
+    """Expande los alias both/all y elimina repetidos preservando el orden."""
+    expanded: List[str] = []
+    for name in names:
+        if name == "both":
+            expanded.extend(DEFAULT_PAIR)
+        elif name == "all":
+            expanded.extend(ALGORITHMS)
+        else:
+            expanded.append(name)
+    return list(dict.fromkeys(expanded))
+
+
+def run_experiments(
+    n_values: Iterable[int], algos: Iterable[str], runs: int, time_limit: Optional[float] = None
+) -> List[Dict[str, object]]:
     records: List[Dict[str, object]] = []
     for n in n_values:
         for algo_key in algos:
@@ -73,7 +129,7 @@ def run_experiments(n_values: Iterable[int], algos: Iterable[str], runs: int) ->
             print(f"Ejecutando {algo_key} para N={n} ({runs} corridas)...")
             for seed in range(1, runs + 1):
                 rng = random.Random(seed)
-                result = solver(n, rng=rng)
+                result = solver(n, rng=rng, time_limit=time_limit)
                 records.append(
                     {
                         "algorithm_name": algo_key,
@@ -81,19 +137,84 @@ def run_experiments(n_values: Iterable[int], algos: Iterable[str], runs: int) ->
                         "found_solution": result.found_solution,
                         "time": result.time,
                         "explored_nodes": result.explored_nodes,
+                        "restarts": result.restarts,
+                        "timed_out": result.timed_out,
                     }
                 )
     return records
 
 
+def run_portfolio_experiments(
+    n_values: Iterable[int],
+    algos: Sequence[str],
+    runs: int,
+    size: int,
+    time_limit: Optional[float] = None,
+) -> List[Dict[str, object]]:
+    """Una corrida de portafolio por (N, semilla); `time` es tiempo de pared.
+
+    `time_limit` se aplica a cada configuración, de modo que el portafolio
+    entero también queda acotado por ese tiempo.
+    """
+    algorithms = {key: ALGORITHMS[key] for key in algos}
+    records: List[Dict[str, object]] = []
+    for n in n_values:
+        print(f"Ejecutando portafolio de {size} configuraciones para N={n} ({runs} corridas)...")
+        for seed in range(1, runs + 1):
+            outcome = run_portfolio(nqueens_portfolio(n, algorithms, size, seed, time_limit))
+            records.append(
+                {
+                    "algorithm_name": f"portfolio-{size}",
+                    "n": n,
+                    "found_solution": outcome.found_solution,
+                    "time": outcome.time,
+                    "explored_nodes": outcome.explored_nodes,
+                    "restarts": getattr(outcome.result, "restarts", 0),
+                    "timed_out": outcome.timed_out,
+                    "winner": outcome.winner,
+                }
+            )
+    return records
+
+
+def summarize_portfolio(df: pd.DataFrame) -> pd.DataFrame:
+    """Speedup del portafolio contra la mejor configuración individual por N.
+
+    La mejor configuración individual es el algoritmo con menor tiempo medio
+    en ese N entre los corridos por separado.
+    """
+    is_portfolio = df["algorithm_name"].str.startswith("portfolio-")
+    rows = []
+    for n, group in df.groupby("n"):
+        singles = group[~is_portfolio.loc[group.index]].groupby("algorithm_name")["time"].mean()
+        portfolio = group[is_portfolio.loc[group.index]]
+        if singles.empty or portfolio.empty:
+            continue
+        best = singles.idxmin()
+        winners = portfolio["winner"].dropna().str.split("#").str[0].value_counts()
+        rows.append(
+            {
+                "n": n,
+                "best_single": best,
+                "best_single_time": singles[best],
+                "portfolio_time": portfolio["time"].mean(),
+                "speedup": singles[best] / portfolio["time"].mean(),
+                "wins": ", ".join(f"{algo}={count}" for algo, count in winners.items()),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
 def main(argv: Sequence[str] | None = None) -> None:
     args = parse_args(argv)
-    algos = ALGORITHMS.keys() if args.algorithm == "both" else [args.algorithm]
+    algos = resolve_algorithms(args.algorithms)
     output_path: Path = args.output
     images_dir = Path(__file__).resolve().parents[1] / "images"
     images_dir.mkdir(parents=True, exist_ok=True)
 
-    records = run_experiments(args.n_values, algos, args.runs)
+    records = run_experiments(args.n_values, algos, args.runs, args.timeout)
+    if args.portfolio > 0:
+        records += run_portfolio_experiments(args.n_values, algos, args.runs, args.portfolio, args.timeout)
     df = pd.DataFrame.from_records(records)
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,6 +224,9 @@ def main(argv: Sequence[str] | None = None) -> None:
     stats_df = compute_stats(df)
     print("\nResumen estadístico:")
     print(stats_df.to_string(index=False))
+    if args.portfolio > 0:
+        print("\nPortafolio vs. mejor configuración individual:")
+        print(summarize_portfolio(df).to_string(index=False))
 
     make_boxplots(df, metric="time", outpath=images_dir / "boxplot_tiempos.png")
     make_boxplots(df, metric="explored_nodes", outpath=images_dir / "boxplot_nodos.png")
@@ -0,0 +1,181 @@
+"""
+Portafolio paralelo de solvers para N-Reinas y Sudoku.
+
+Se lanzan K configuraciones (algoritmo, semilla, reinicios) en procesos
+independientes; la primera que encuentra solución gana y el resto se
+cancela. Como los tiempos de backtracking con orden aleatorio tienen cola
+pesada, correr varias semillas en paralelo recorta la cola aun en una sola
+CPU.
+
+Cada configuración es un `PortfolioConfig` con un nombre y una tarea sin
+argumentos (p. ej. un `functools.partial`) que devuelve un resultado con
+`found_solution` y `explored_nodes` (`NQueensResult` o `SudokuResult`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import queue
+import random
+from dataclasses import dataclass
+from functools import partial
+from time import perf_counter
+from typing import Any, Callable, List, Mapping, Optional, Sequence
+
+try:
+    from .n_reinas_backtracking import solve_n_queens_backtracking
+    from .n_reinas_forward_trail import solve_n_queens_forward_trail
+    from .sudoku_csp import EXAMPLE_PUZZLE, SudokuCSP, load_grid_from_string
+except ImportError:  # Permite ejecución como script local
+    from n_reinas_backtracking import solve_n_queens_backtracking  # type: ignore[attr-defined]
+    from n_reinas_forward_trail import solve_n_queens_forward_trail  # type: ignore[attr-defined]
+    from sudoku_csp import EXAMPLE_PUZZLE, SudokuCSP, load_grid_from_string  # type: ignore[attr-defined]
+
+
+# Segundos entre consultas a la cola de resultados
+RESULT_POLL_SECONDS = 0.5
+
+
+@dataclass(frozen=True)
+class PortfolioConfig:
+    name: str
+    task: Callable[[], Any]
+
+
+@dataclass
+class PortfolioResult:
+    found_solution: bool
+    winner: Optional[str]
+    result: Any  # resultado de la configuración ganadora (o de la última si ninguna resolvió)
+    explored_nodes: int  # nodos de la configuración ganadora
+    time: float  # tiempo de pared del portafolio completo
+    finished: int  # configuraciones que terminaron antes de cancelar al resto
+    timed_out: bool = False  # ninguna resolvió y alguna agotó su presupuesto
+
+
+def _portfolio_worker(index: int, task: Callable[[], Any], results) -> None:
+    try:
+        results.put((index, task()))
+    except Exception as exc:  # se relanza en el proceso principal
+        results.put((index, exc))
+
+
+def run_portfolio(configs: Sequence[PortfolioConfig]) -> PortfolioResult:
+    """Ejecuta las configuraciones en paralelo y devuelve la primera solución.
+
+    Las configuraciones que terminan sin solución (p. ej. N sin soluciones)
+    o cuyo proceso muere sin reportar no detienen al resto; si ninguna
+    resuelve se devuelve el último resultado (None si ninguna reportó)
+    y `timed_out` indica si alguna se cortó por presupuesto (resultado
+    censurado) en lugar de agotar el árbol.
+    """
+    if not configs:
+        raise ValueError("El portafolio necesita al menos una configuración.")
+
+    start = perf_counter()
+    results = mp.Queue()
+    workers = [
+        mp.Process(target=_portfolio_worker, args=(index, config.task, results), daemon=True)
+        for index, config in enumerate(configs)
+    ]
+    for worker in workers:
+        worker.start()
+
+    winner: Optional[int] = None
+    last = None
+    finished = 0
+    timed_out = False
+    try:
+        while finished < len(workers):
+            try:
+                index, result = results.get(timeout=RESULT_POLL_SECONDS)
+            except queue.Empty:
+                # Un proceso muerto (señal, falta de memoria, resultado que no
+                # se pudo serializar) nunca reporta: se deja de esperar cuando
+                # ya no queda ninguno vivo.
+                if any(worker.is_alive() for worker in workers):
+                    continue
+                try:
+                    index, result = results.get(timeout=RESULT_POLL_SECONDS)
+                except queue.Empty:
+                    break
+            if isinstance(result, Exception):
+                raise result
+            finished += 1
+            last = result
+            timed_out = timed_out or getattr(result, "timed_out", False)
+            if result.found_solution:
+                winner = index
+                break
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers:
+            worker.join()
+
+    elapsed = perf_counter() - start
+    if winner is None:
+        return PortfolioResult(False, None, last, 0, elapsed, finished, timed_out)
+    return PortfolioResult(True, configs[winner].name, last, last.explored_nodes, elapsed, finished)
+
+
+def nqueens_portfolio(
+    n: int,
+    algorithms: Mapping[str, Callable[..., Any]],
+    size: int,
+    seed: int,
+    time_limit: Optional[float] = None,
+) -> List[PortfolioConfig]:
+    """K configuraciones que alternan los algoritmos dados con semillas distintas.
+
+    La configuración `i` usa `algorithms[i % len(algorithms)]` con semilla
+    `seed * 1000 + i`, de modo que cada corrida del runner arma un
+    portafolio reproducible y distinto. `time_limit` se pasa a cada
+    configuración.
+    """
+    keys = list(algorithms)
+    configs = []
+    for i in range(size):
+        key = keys[i % len(keys)]
+        config_seed = seed * 1000 + i
+        task = partial(algorithms[key], n, rng=random.Random(config_seed), time_limit=time_limit)
+        configs.append(PortfolioConfig(f"{key}#{config_seed}", task))
+    return configs
+
+
+def sudoku_portfolio(csp: SudokuCSP) -> List[PortfolioConfig]:
+    """Backtracking MRV+LCV con y sin AC-3 como inferencia."""
+    return [
+        PortfolioConfig("AC-3", partial(csp.solve_detailed, use_ac3=True)),
+        PortfolioConfig("sin AC-3", partial(csp.solve_detailed, use_ac3=False)),
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Portafolio paralelo de solvers (demo con Sudoku y N-Reinas).")
+    parser.add_argument("--n", type=int, default=60, help="Tamaño de N-Reinas (default: 60).")
+    parser.add_argument("--size", type=int, default=4, help="Configuraciones del portafolio (default: 4).")
+    parser.add_argument("--seed", type=int, default=1, help="Semilla base (default: 1).")
+    args = parser.parse_args(argv)
+
+    algorithms = {
+        "BT": solve_n_queens_backtracking,
+        "FC": solve_n_queens_forward_trail,
+        "BT-Luby": partial(solve_n_queens_backtracking, restart_policy="luby"),
+    }
+    configs = nqueens_portfolio(args.n, algorithms, args.size, args.seed)
+    outcome = run_portfolio(configs)
+    print(
+        f"N-Reinas N={args.n}: ganó {outcome.winner} con {outcome.explored_nodes} nodos "
+        f"en {outcome.time:.3f}s ({len(configs)} configuraciones)"
+    )
+
+    csp = SudokuCSP(load_grid_from_string(EXAMPLE_PUZZLE))
+    outcome = run_portfolio(sudoku_portfolio(csp))
+    print(f"Sudoku: ganó {outcome.winner} con {outcome.explored_nodes} nodos en {outcome.time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
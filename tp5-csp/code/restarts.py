@@ -0,0 +1,125 @@
+"""
+Políticas de reinicio para búsquedas con orden de valores aleatorizado.
+
+El backtracking con orden aleatorio tiene tiempos de corrida de cola pesada:
+la mayoría de las semillas resuelve rápido y unas pocas exploran órdenes de
+magnitud más nodos. Cortar cada intento tras un límite de nodos y reiniciar
+con una permutación nueva recorta esa cola. Este módulo define las secuencias
+de límites:
+
+- `luby`: base * (1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ...), la secuencia universal
+  de Luby, Sinclair y Zuckerman;
+- `geometric`: base * factor**i;
+- `fixed`: base en todos los intentos.
+
+`python restarts.py` compara la distribución de nodos explorados del
+backtracking con y sin reinicios.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+from itertools import count
+from typing import Dict, Iterator, List, Optional, Sequence
+
+RESTART_POLICIES = ("luby", "geometric", "fixed")
+
+
+def luby(i: int) -> int:
+    """i-ésimo término (desde 1) de la secuencia de Luby."""
+    if i < 1:
+        raise ValueError("i debe ser mayor o igual a 1.")
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+def cutoffs(policy: str, base: int, factor: float = 1.5) -> Iterator[int]:
+    """Límites de nodos sucesivos para la política indicada."""
+    if base <= 0:
+        raise ValueError("base debe ser un entero positivo.")
+    if policy == "luby":
+        return (base * luby(i) for i in count(1))
+    if policy == "geometric":
+        if factor <= 1:
+            raise ValueError("factor debe ser mayor que 1.")
+        return (int(base * factor**i) for i in count())
+    if policy == "fixed":
+        return (base for _ in count())
+    raise ValueError(f"Política de reinicio desconocida: {policy!r}. Opciones: {', '.join(RESTART_POLICIES)}.")
+
+
+def tail_summary(nodes: Sequence[int]) -> Dict[str, float]:
+    """Mediana, percentiles 90/99 y máximo de una muestra de nodos."""
+    ordered = sorted(nodes)
+
+    def pct(q: float) -> float:
+        return float(ordered[min(len(ordered) - 1, int(q * len(ordered)))])
+
+    return {
+        "median": float(statistics.median(ordered)),
+        "p90": pct(0.9),
+        "p99": pct(0.99),
+        "max": float(ordered[-1]),
+        "mean": float(statistics.fmean(ordered)),
+    }
+
+
+def compare_tails(n_values: Sequence[int], runs: int, base: Optional[int], cap: int) -> None:
+    """Distribución de nodos de BT sin reinicios y con cada política.
+
+    Las corridas sin reinicios que superan `cap` nodos se cortan y se cuentan
+    como censuradas (sus estadísticos son cotas inferiores).
+    """
+    try:
+        from .n_reinas_backtracking import solve_n_queens_backtracking
+    except ImportError:  # Permite ejecución como script local
+        from n_reinas_backtracking import solve_n_queens_backtracking  # type: ignore[attr-defined]
+
+    print(f"{'N':>4} {'política':>10} {'mediana':>9} {'p90':>9} {'p99':>9} {'máx':>9} {'media':>10} {'reinicios':>10}")
+    for n in n_values:
+        for policy in (None, *RESTART_POLICIES):
+            nodes: List[int] = []
+            restarts: List[int] = []
+            censored = 0
+            for seed in range(1, runs + 1):
+                result = solve_n_queens_backtracking(
+                    n,
+                    rng=random.Random(seed),
+                    restart_policy=policy,
+                    restart_base=base,
+                    max_nodes=cap if policy is None else None,
+                )
+                censored += result.timed_out
+                nodes.append(result.explored_nodes)
+                restarts.append(result.restarts)
+            tail = tail_summary(nodes)
+            label = policy or "ninguna"
+            note = f"  ({censored} censuradas en {cap})" if censored else ""
+            print(
+                f"{n:>4} {label:>10} {tail['median']:>9.0f} {tail['p90']:>9.0f} {tail['p99']:>9.0f} "
+                f"{tail['max']:>9.0f} {tail['mean']:>10.1f} {statistics.fmean(restarts):>10.1f}{note}"
+            )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Efecto de los reinicios en la cola de nodos explorados.")
+    parser.add_argument("--n", dest="n_values", nargs="+", type=int, default=[20, 30, 40, 50, 60])
+    parser.add_argument("--runs", type=int, default=30, help="Semillas por N (default: 30).")
+    parser.add_argument("--base", type=int, default=None, help="Límite base de nodos (default: 4·N).")
+    parser.add_argument(
+        "--cap",
+        type=int,
+        default=200_000,
+        help="Corte de las corridas sin reinicios (default: 200000 nodos).",
+    )
+    args = parser.parse_args(argv)
+    compare_tails(args.n_values, args.runs, args.base, args.cap)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Motor compacto de Sudoku con dominios en bits y deshacer por trail.
+
+Cada celda es un índice 0..80 y su dominio un entero de 9 bits (bit `v - 1`
+encendido si el valor `v` sigue disponible). Los 20 pares de cada celda
+(misma fila, columna o subcuadro) se precalculan como tuplas de índices.
+
+Al fijar una celda se quita su valor de los pares; si un par queda con un
+único valor se propaga a su vez. Para restricciones binarias de desigualdad
+esto alcanza el mismo punto fijo que AC-3: un valor sólo pierde soporte
+cuando el dominio vecino es exactamente ese valor. Cada dominio modificado se
+anota en el trail como (celda, máscara previa) y al retroceder se restaura
+hasta la marca del nodo, sin copiar dominios.
+
+La búsqueda elige la celda con menos valores (MRV, desempate por índice
+como `SudokuCSP`) y prueba los valores en orden ascendente.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from .budget import BudgetExceeded, make_budget
+    from .sudoku_csp import BUDGET_CHECK_INTERVAL, Grid, SudokuCSP, SudokuResult, _format_grid, load_puzzles
+except ImportError:  # Permite ejecución como script local
+    from budget import BudgetExceeded, make_budget  # type: ignore[attr-defined]
+    from sudoku_csp import BUDGET_CHECK_INTERVAL, Grid, SudokuCSP, SudokuResult, _format_grid, load_puzzles  # type: ignore[attr-defined]
+
+ALL_VALUES = (1 << 9) - 1
+
+
+def _build_peers() -> Tuple[Tuple[int, ...], ...]:
+    peers = []
+    for cell in range(81):
+        r, c = divmod(cell, 9)
+        box_r, box_c = r // 3 * 3, c // 3 * 3
+        related = {r * 9 + cc for cc in range(9)}
+        related.update(rr * 9 + c for rr in range(9))
+        related.update(rr * 9 + cc for rr in range(box_r, box_r + 3) for cc in range(box_c, box_c + 3))
+        related.discard(cell)
+        peers.append(tuple(sorted(related)))
+    return tuple(peers)
+
+
+PEERS = _build_peers()
+
+
+@dataclass(frozen=True)
+class BitmaskSudoku:
+    """Sudoku 9x9 con la misma interfaz `solve`/`solve_detailed` que `SudokuCSP`."""
+
+    initial_grid: Grid
+
+    def __post_init__(self) -> None:
+        if len(self.initial_grid) != 9 or any(len(row) != 9 for row in self.initial_grid):
+            raise ValueError("El tablero debe ser una matriz 9x9.")
+        if any(not (0 <= value <= 9) for row in self.initial_grid for value in row):
+            raise ValueError("Los valores deben estar en el rango 0..9 (0 = vacío).")
+
+    def solve(self, max_nodes: Optional[int] = None, time_limit: Optional[float] = None) -> Optional[Grid]:
+        """Devuelve una nueva grilla resuelta, o None si no tiene solución (o se agotó el presupuesto)."""
+        return self.solve_detailed(max_nodes, time_limit).solution
+
+    def solve_detailed(self, max_nodes: Optional[int] = None, time_limit: Optional[float] = None) -> SudokuResult:
+        """Como `solve`, pero informa también nodos explorados, tiempo y si se agotó el presupuesto."""
+        start = perf_counter()
+        budget = make_budget(max_nodes, time_limit, BUDGET_CHECK_INTERVAL)
+        checkpoint = None if budget is None else 0
+        domains = [ALL_VALUES] * 81
+        trail: List[Tuple[int, int]] = []
+        explored_nodes = 0
+
+        def eliminate(cell: int, bit: int) -> bool:
+            """Quita `bit` del dominio de `cell`; False si queda vacío."""
+            domain = domains[cell]
+            if not domain & bit:
+                return True
+            trail.append((cell, domain))
+            domain ^= bit
+            domains[cell] = domain
+            if not domain:
+                return False
+            if not domain & (domain - 1):  # quedó un único valor
+                for peer in PEERS[cell]:
+                    if not eliminate(peer, domain):
+                        return False
+            return True
+
+        def assign(cell: int, bit: int) -> bool:
+            """Fija `cell` en `bit` y propaga a sus pares."""
+            domain = domains[cell]
+            if not domain & bit:
+                return False
+            if domain == bit:
+                return True  # ya propagado al quedar único
+            trail.append((cell, domain))
+            domains[cell] = bit
+            for peer in PEERS[cell]:
+                if not eliminate(peer, bit):
+                    return False
+            return True
+
+        def search() -> bool:
+            nonlocal explored_nodes, checkpoint
+            if explored_nodes == checkpoint:
+                checkpoint = budget.check(explored_nodes)
+            explored_nodes += 1
+
+            best, best_size = -1, 10
+            for cell in range(81):
+                domain = domains[cell]
+                if domain & (domain - 1):
+                    size = domain.bit_count()
+                    if size < best_size:
+                        best, best_size = cell, size
+                        if size == 2:
+                            break
+            if best < 0:
+                return True
+
+            mark = len(trail)
+            remaining = domains[best]
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                if assign(best, bit) and search():
+                    return True
+                while len(trail) > mark:
+                    cell, previous = trail.pop()
+                    domains[cell] = previous
+            return False
+
+        found = timed_out = False
+        givens = [(r * 9 + c, value) for r, row in enumerate(self.initial_grid) for c, value in enumerate(row) if value]
+        if all(assign(cell, 1 << (value - 1)) for cell, value in givens):
+            try:
+                found = search()
+            except BudgetExceeded:
+                timed_out = True
+
+        solution: Optional[Grid] = None
+        if found:
+            values = [domain.bit_length() for domain in domains]
+            solution = [values[r * 9 : r * 9 + 9] for r in range(9)]
+        return SudokuResult(
+            found_solution=found,
+            solution=solution,
+            explored_nodes=explored_nodes,
+            time=perf_counter() - start,
+            timed_out=timed_out,
+        )
+
+
+def benchmark(puzzles: Sequence[Tuple[str, Grid]], repeat: int, baseline_limit: float) -> None:
+    """Puzzles por segundo del motor en bits contra `SudokuCSP` con AC-3.
+
+    `SudokuCSP` corre una vez por puzzle con `time_limit=baseline_limit`; los
+    puzzles que lo agotan se informan como censurados.
+    """
+    print(f"{'puzzle':<18} {'nodos bits':>10} {'bits (s)':>10} {'nodos CSP':>10} {'CSP (s)':>10}")
+    total_bits = total_csp = 0.0
+    censored = 0
+    for name, grid in puzzles:
+        times = []
+        for _ in range(repeat):
+            result = BitmaskSudoku(grid).solve_detailed()
+            times.append(result.time)
+        if not result.found_solution:
+            raise AssertionError(f"{name}: el motor en bits no encontró solución")
+        reference = SudokuCSP(grid).solve_detailed(time_limit=baseline_limit)
+        if reference.found_solution and reference.solution != result.solution:
+            raise AssertionError(f"{name}: soluciones distintas")
+        censored += reference.timed_out
+        best = min(times)
+        total_bits += best
+        total_csp += reference.time
+        mark = ">" if reference.timed_out else ""
+        print(
+            f"{name:<18} {result.explored_nodes:>10} {best:>10.4f} "
+            f"{mark + str(reference.explored_nodes):>10} {mark + f'{reference.time:.3f}':>10}"
+        )
+    count = len(puzzles)
+    print(f"\nbits: {count / total_bits:,.1f} puzzles/s")
+    note = f" ({censored} censurados a {baseline_limit:g}s: cota superior)" if censored else ""
+    print(f"SudokuCSP + AC-3: {count / total_csp:,.3f} puzzles/s{note}")
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Sudoku con dominios en bits y trail.")
+    parser.add_argument("--benchmark", action="store_true", help="Compara puzzles/s contra SudokuCSP.")
+    parser.add_argument(
+        "--puzzles", type=Path, default=None, help="Archivo con un puzzle de 81 caracteres por línea (default: HARD_PUZZLES)."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repeticiones del motor en bits por puzzle (default: 5).")
+    parser.add_argument(
+        "--baseline-limit",
+        type=float,
+        default=60.0,
+        help="Tiempo máximo de SudokuCSP por puzzle en el benchmark (default: 60).",
+    )
+    args = parser.parse_args(argv)
+
+    puzzles = load_puzzles(args.puzzles)
+    if args.benchmark:
+        benchmark(puzzles, args.repeat, args.baseline_limit)
+        return
+
+    for name, grid in puzzles:
+        result = BitmaskSudoku(grid).solve_detailed()
+        print(f"{name}: {result.explored_nodes} nodos en {result.time:.4f}s")
+        if result.solution:
+            print(_format_grid(result.solution))
+        print()
+
+
+if __name__ == "__main__":
+    main()
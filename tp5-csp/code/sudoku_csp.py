@@ -10,15 +10,54 @@ en cada paso de la búsqueda.
 
 from __future__ import annotations
 
+import argparse
 from collections import deque
 from copy import deepcopy
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    from .budget import BudgetExceeded, SearchBudget, make_budget
+except ImportError:  # Permite ejecución como script local
+    from budget import BudgetExceeded, SearchBudget, make_budget  # type: ignore[attr-defined]
 
 Grid = List[List[int]]
 Variable = Tuple[int, int]
 Assignment = Dict[Variable, int]
 Domains = Dict[Variable, Set[int]]
+Arc = Tuple[Variable, Variable]
+Residues = Dict[Arc, Dict[int, int]]
+
+# Cada nodo copia dominios (y corre AC-3), así que el reloj se consulta seguido.
+BUDGET_CHECK_INTERVAL = 16
+
+
+EXAMPLE_PUZZLE = """
+530070000
+600195000
+098000060
+800060003
+400803001
+700020006
+060000280
+000419005
+000080079
+"""
+
+# Sudokus difíciles conocidos (una línea de 81 caracteres, "." = vacío), todos
+# con solución única; los "hardest-*" son de la colección de Peter Norvig.
+HARD_PUZZLES = {
+    "AI Escargot": "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..",
+    "Easter Monster": "1.......2.9.4...5...6...7...5.9.3.......7.......85..4.7.....6...3...9.8...2.....1",
+    "Golden Nugget": ".......39.....1..5..3.5.8....8.9...6.7...2...1..4.......9.8..5..2....6..4..7.....",
+    "Inkala 2012": "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+    "hard1": "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+    "hardest-1": "85...24..72......9..4.........1.7..23.5...9...4...........8..7..17..........36.4.",
+    "hardest-2": "..53.....8......2..7..1.5..4....53...1..7...6..32...8..6.5....9..4....3......97..",
+    "hardest-3": "7..1523........92....3.....1....47.8.......6............9...5.6.4.9.7...8....6.1.",
+}
 
 
 def _default_domain() -> Set[int]:
@@ -26,6 +65,28 @@ def _default_domain() -> Set[int]:
     return set(range(1, 10))
 
 
+@dataclass
+class SudokuResult:
+    found_solution: bool
+    solution: Optional[Grid]
+    explored_nodes: int
+    time: float
+    timed_out: bool = False  # se agotó el presupuesto de nodos o de tiempo
+    revisions: int = 0  # llamadas a revise de AC-3
+
+
+@dataclass
+class _SearchState:
+    """Contadores de una búsqueda en curso."""
+
+    explored_nodes: int = 0
+    budget: Optional[SearchBudget] = None
+    checkpoint: Optional[int] = None
+    revisions: int = 0
+    incremental: bool = True
+    residues: Residues = field(default_factory=dict)  # soportes residuales de AC-3rm
+
+
 @dataclass(frozen=True)
 class SudokuCSP:
     """CSP para Sudoku 9x9 con dominios discretos y restricciones binarias."""
@@ -111,15 +172,18 @@ class SudokuCSP:
     # ------------------------------------------------------------------ #
     # AC-3
 
-    def ac3(self, domains: Domains) -> bool:
+    def ac3(self, domains: Domains, state: Optional[_SearchState] = None) -> bool:
         """
         Ejecuta AC-3 sobre los dominios.
 
-        Devuelve False si algún dominio queda vacío (inconsistencia).
+        Devuelve False si algún dominio queda vacío (inconsistencia). Con
+        `state` se cuentan las revisiones.
         """
         queue = deque([(xi, xj) for xi in self.variables for xj in self.neighbors[xi]])
         while queue:
             xi, xj = queue.popleft()
+            if state is not None:
+                state.revisions += 1
             if self._revise(domains, xi, xj):
                 if not domains[xi]:
                     return False
@@ -139,33 +203,120 @@ class SudokuCSP:
             revised = True
         return revised
 
+    def ac3_incremental(self, domains: Domains, arcs: Iterable[Arc], state: _SearchState) -> bool:
+        """
+        AC-3 que arranca sólo desde `arcs` en lugar de todos los arcos.
+
+        Tras asignar `var` en un estado ya arco-consistente, sólo pueden
+        perder soporte los arcos (xk, var), así que alcanza con sembrar la
+        cola con ellos. Un arco no se encola dos veces y las revisiones usan
+        los soportes residuales de `state` (AC-3rm).
+        """
+        queue = deque(arcs)
+        queued = set(queue)
+        neighbors = self.neighbors
+        while queue:
+            arc = queue.popleft()
+            queued.discard(arc)
+            xi, xj = arc
+            state.revisions += 1
+            if self._revise_residual(domains, xi, xj, state.residues):
+                if not domains[xi]:
+                    return False
+                for xk in neighbors[xi]:
+                    if xk != xj and (xk, xi) not in queued:
+                        queued.add((xk, xi))
+                        queue.append((xk, xi))
+        return True
+
+    def _revise_residual(self, domains: Domains, xi: Variable, xj: Variable, residues: Residues) -> bool:
+        """Como `_revise`, pero prueba primero el último soporte hallado para cada valor.
+
+        Los residuos no se deshacen al retroceder: sólo se usan si el valor
+        sigue en el dominio de xj, y si no se busca otro soporte.
+        """
+        domain_j = domains[xj]
+        supports = residues.setdefault((xi, xj), {})
+        to_remove = []
+        for x in domains[xi]:
+            if supports.get(x) in domain_j:
+                continue
+            for y in domain_j:
+                if y != x:
+                    supports[x] = y
+                    break
+            else:
+                to_remove.append(x)
+        if to_remove:
+            domains[xi].difference_update(to_remove)
+            return True
+        return False
+
     # ------------------------------------------------------------------ #
     # Búsqueda con backtracking
 
-    def solve(self, use_ac3: bool = True) -> Optional[Grid]:
+    def solve(
+        self,
+        use_ac3: bool = True,
+        max_nodes: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        incremental: bool = True,
+    ) -> Optional[Grid]:
         """
         Intenta resolver el Sudoku devolviendo una nueva grilla si tiene solución.
 
         Si `use_ac3` es True, aplica AC-3 como inferencia en cada paso de la
-        búsqueda para reducir dominios.
+        búsqueda para reducir dominios; con `incremental` (por defecto) cada
+        paso sólo revisa los arcos afectados por la última asignación, y si es
+        False se recorren todos los arcos en cada paso. `max_nodes` y
+        `time_limit` acotan la búsqueda; si se agotan se devuelve None (ver
+        `solve_detailed`).
         """
+        return self.solve_detailed(use_ac3, max_nodes, time_limit, incremental).solution
+
+    def solve_detailed(
+        self,
+        use_ac3: bool = True,
+        max_nodes: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        incremental: bool = True,
+    ) -> SudokuResult:
+        """Como `solve`, pero informa también nodos, revisiones, tiempo y si se agotó el presupuesto."""
+        start = perf_counter()
+        budget = make_budget(max_nodes, time_limit, BUDGET_CHECK_INTERVAL)
+        state = _SearchState(budget=budget, checkpoint=None if budget is None else 0, incremental=incremental)
+        timed_out = False
+        solution: Optional[Grid] = None
         assignment: Assignment = {
             var: next(iter(domain)) for var, domain in self.domains.items() if len(domain) == 1
         }
         domains = deepcopy(self.domains)
-        if use_ac3 and not self.ac3(domains):
-            return None
-        solution_assignment = self._backtrack(assignment, domains, use_ac3)
-        if solution_assignment is None:
-            return None
-        return self._assignment_to_grid(solution_assignment)
+        if not use_ac3 or self.ac3(domains, state):
+            try:
+                solution_assignment = self._backtrack(assignment, domains, use_ac3, state)
+            except BudgetExceeded:
+                solution_assignment, timed_out = None, True
+            if solution_assignment is not None:
+                solution = self._assignment_to_grid(solution_assignment)
+        return SudokuResult(
+            found_solution=solution is not None,
+            solution=solution,
+            explored_nodes=state.explored_nodes,
+            time=perf_counter() - start,
+            timed_out=timed_out,
+            revisions=state.revisions,
+        )
 
     def _backtrack(
         self,
         assignment: Assignment,
         domains: Domains,
         use_ac3: bool,
+        state: _SearchState,
     ) -> Optional[Assignment]:
+        if state.explored_nodes == state.checkpoint:
+            state.checkpoint = state.budget.check(state.explored_nodes)
+        state.explored_nodes += 1
         if len(assignment) == len(self.variables):
             return assignment
 
@@ -177,10 +328,13 @@ class SudokuCSP:
             saved_domains = deepcopy(domains)
             domains[var] = {value}
             inference_ok = True
-            if use_ac3:
-                inference_ok = self.ac3(domains)
+            if use_ac3 and state.incremental:
+                arcs = [(neighbor, var) for neighbor in self.neighbors[var]]
+                inference_ok = self.ac3_incremental(domains, arcs, state)
+            elif use_ac3:
+                inference_ok = self.ac3(domains, state)
             if inference_ok:
-                result = self._backtrack(assignment, domains, use_ac3)
+                result = self._backtrack(assignment, domains, use_ac3, state)
                 if result is not None:
                     return result
             assignment.pop(var, None)
@@ -225,19 +379,86 @@ def load_grid_from_string(data: str) -> Grid:
     return grid
 
 
-if __name__ == "__main__":
-    EXAMPLE = """
-    530070000
-    600195000
-    098000060
-    800060003
-    400803001
-    700020006
-    060000280
-    000419005
-    000080079
+def grid_from_line(line: str) -> Grid:
+    """Convierte una línea de 81 caracteres ("." o "0" = vacío) en grilla."""
+    cells = [ch for ch in line.strip() if not ch.isspace()]
+    if len(cells) != 81:
+        raise ValueError("La línea debe contener 81 celdas.")
+    values = [0 if ch in ".0" else int(ch) for ch in cells]
+    return [values[r * 9 : r * 9 + 9] for r in range(9)]
+
+
+def load_puzzles(path: Optional[Path]) -> List[Tuple[str, Grid]]:
+    """Puzzles de `path` (uno por línea, se ignoran vacías y comentarios #) o `HARD_PUZZLES`."""
+    if path is None:
+        return [(name, grid_from_line(line)) for name, line in HARD_PUZZLES.items()]
+    lines = [line.strip() for line in path.read_text().splitlines()]
+    return [(f"{path.name}:{i}", grid_from_line(line)) for i, line in enumerate(lines, 1) if line and not line.startswith("#")]
+
+
+def benchmark_ac3(puzzles: Sequence[Tuple[str, Grid]], time_limit: float) -> None:
+    """Revisiones/s y tiempo total de AC-3 completo contra incremental (AC-3rm).
+
+    Ambas variantes alcanzan el mismo punto fijo en cada nodo, así que
+    exploran el mismo árbol; las cifras de una corrida que agota
+    `time_limit` se marcan con ">" y son cotas. Los totales comparan sólo
+    los puzzles que ambas variantes terminaron.
     """
-    puzzle = load_grid_from_string(EXAMPLE)
+    print(
+        f"{'puzzle':<16} {'nodos':>7} {'rev. AC-3':>11} {'rev. incr.':>11} "
+        f"{'AC-3 (s)':>10} {'incr. (s)':>10} {'rev/s AC-3':>11} {'rev/s incr.':>12}"
+    )
+    totals = {False: [0, 0.0], True: [0, 0.0]}
+    censored = 0
+    for name, grid in puzzles:
+        csp = SudokuCSP(grid)
+        results = {mode: csp.solve_detailed(time_limit=time_limit, incremental=mode) for mode in (False, True)}
+        full, incr = results[False], results[True]
+        if not full.timed_out and not incr.timed_out and full.solution != incr.solution:
+            raise AssertionError(f"{name}: soluciones distintas")
+        if full.timed_out or incr.timed_out:
+            censored += 1
+        else:
+            for mode, result in results.items():
+                totals[mode][0] += result.revisions
+                totals[mode][1] += result.time
+        full_mark = ">" if full.timed_out else ""
+        incr_mark = ">" if incr.timed_out else ""
+        print(
+            f"{name:<16} {incr_mark + str(incr.explored_nodes):>7} {full_mark + str(full.revisions):>11} "
+            f"{incr_mark + str(incr.revisions):>11} {full_mark + f'{full.time:.3f}':>10} "
+            f"{incr_mark + f'{incr.time:.3f}':>10} "
+            f"{full.revisions / full.time:>11,.0f} {incr.revisions / incr.time:>12,.0f}"
+        )
+    (full_revisions, full_time), (incr_revisions, incr_time) = totals[False], totals[True]
+    note = f" ({censored} puzzles censurados a {time_limit:g}s excluidos)" if censored else ""
+    if censored == len(puzzles):
+        print(f"\nTotal: sin puzzles completos en ambas variantes{note}")
+        return
+    print(
+        f"\nTotal: AC-3 {full_revisions} revisiones en {full_time:.2f}s; "
+        f"incremental {incr_revisions} revisiones en {incr_time:.2f}s ({full_time / incr_time:.1f}x){note}"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Sudoku como CSP con backtracking + AC-3.")
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Compara AC-3 completo contra incremental sobre Sudokus difíciles."
+    )
+    parser.add_argument(
+        "--puzzles", type=Path, default=None, help="Archivo con un puzzle de 81 caracteres por línea (default: HARD_PUZZLES)."
+    )
+    parser.add_argument(
+        "--time-limit", type=float, default=60.0, help="Tiempo máximo por puzzle y variante en el benchmark (default: 60)."
+    )
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        benchmark_ac3(load_puzzles(args.puzzles), args.time_limit)
+        return
+
+    puzzle = load_grid_from_string(EXAMPLE_PUZZLE)
     csp = SudokuCSP(puzzle)
     solution = csp.solve()
     if solution:
@@ -245,3 +466,7 @@ if __name__ == "__main__":
         print(_format_grid(solution))
     else:
         print("El Sudoku dado no tiene solución.")
+
+
+if __name__ == "__main__":
+    main()
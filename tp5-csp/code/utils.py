@@ -14,19 +14,36 @@ def compute_stats(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calcula estadísticas agrupadas por algoritmo y tamaño de problema.
 
-    Retorna un DataFrame con porcentaje de éxito, promedios y desviaciones
-    estándar de tiempo y nodos explorados.
+    Retorna un DataFrame con corridas censuradas y fallidas, porcentaje de
+    éxito y promedios y desviaciones estándar de tiempo y nodos explorados.
+    Las corridas censuradas (columna `timed_out`, agotaron su presupuesto)
+    no son éxitos ni fallos: se excluyen del denominador de `success_rate`
+    y de los promedios, porque su tiempo y sus nodos son sólo cotas
+    inferiores. Si todas las corridas de un grupo son censuradas, esas
+    columnas quedan en NaN.
     """
-    grouped = df.groupby(["algorithm_name", "n"], as_index=False)
-    stats = grouped.agg(
+    keys = ["algorithm_name", "n"]
+    timed_out = df["timed_out"].astype(bool) if "timed_out" in df.columns else False
+    df = df.assign(timed_out=timed_out)
+    df = df.assign(failed=~df["found_solution"].astype(bool) & ~df["timed_out"])
+    counts = df.groupby(keys, as_index=False).agg(
         runs=("found_solution", "size"),
+        censored=("timed_out", "sum"),
+        failed=("failed", "sum"),
+    )
+    means = df[~df["timed_out"]].groupby(keys, as_index=False).agg(
         success_rate=("found_solution", lambda s: float(s.mean()) * 100.0),
         mean_time=("time", "mean"),
         std_time=("time", "std"),
         mean_nodes=("explored_nodes", "mean"),
         std_nodes=("explored_nodes", "std"),
     )
-    stats = stats.fillna(0.0)
+    stats = counts.merge(means, on=keys, how="left")
+    # Desvío de una sola corrida completa: 0; grupos sin corridas completas: NaN
+    completed = stats["mean_time"].notna()
+    stats.loc[completed, ["std_time", "std_nodes"]] = stats.loc[completed, ["std_time", "std_nodes"]].fillna(0.0)
+    stats["censored"] = stats["censored"].astype(int)
+    stats["failed"] = stats["failed"].astype(int)
     stats["success_rate"] = stats["success_rate"].round(2)
     stats["mean_time"] = stats["mean_time"].round(6)
     stats["std_time"] = stats["std_time"].round(6)